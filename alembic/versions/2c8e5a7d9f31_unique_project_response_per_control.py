@@ -0,0 +1,117 @@
+"""unique project response per control
+
+Revision ID: 2c8e5a7d9f31
+Revises: 7b3e9d1f4a20
+Create Date: 2026-10-17 00:00:03.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2c8e5a7d9f31"
+down_revision: Union[str, None] = "7b3e9d1f4a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONSTRAINT = "uq_project_responses_project_control"
+OLD_INDEX = "ix_project_responses_project_id_control_id"
+
+
+# Keep the most recently saved response for each control; earlier
+# double-submits left older copies that the upsert would conflict with.
+DEDUPE = """
+    DELETE FROM project_responses AS pr
+    USING (
+        SELECT id,
+               row_number() OVER (
+                   PARTITION BY project_id, framework_control_id
+                   ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST, id DESC
+               ) AS position
+        FROM project_responses
+    ) AS ranked
+    WHERE pr.id = ranked.id AND ranked.position > 1
+"""
+
+# The app keeps saving responses while the index builds, so a duplicate can
+# slip in between the dedupe and the build; each attempt dedupes again
+BUILD_ATTEMPTS = 5
+
+
+def _index_valid() -> bool | None:
+    """Whether the unique index is valid, or None when it does not exist."""
+    return op.get_bind().scalar(
+        sa.text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": CONSTRAINT},
+    )
+
+
+def _constraint_exists() -> bool:
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT 1 FROM pg_constraint"
+                " WHERE conname = :name AND conrelid = to_regclass('project_responses')"
+            ),
+            {"name": CONSTRAINT},
+        )
+    )
+
+
+def upgrade() -> None:
+    # Build the unique index without blocking writes, then attach it as the
+    # constraint; it also covers lookups the plain composite index served.
+    with op.get_context().autocommit_block():
+        for _ in range(BUILD_ATTEMPTS):
+            # A failed concurrent build (this run's or an earlier one's) leaves
+            # an INVALID index, which IF NOT EXISTS would otherwise keep
+            if _index_valid() is False:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {CONSTRAINT}")
+            op.execute(DEDUPE)
+            try:
+                op.create_index(
+                    CONSTRAINT,
+                    "project_responses",
+                    ["project_id", "framework_control_id"],
+                    unique=True,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+            except sa.exc.IntegrityError:
+                continue
+            if _index_valid():
+                break
+        else:
+            raise RuntimeError(
+                f"{CONSTRAINT} could not be built: duplicate responses kept being "
+                "saved during the build; pause writes to project_responses and re-run"
+            )
+    if not _constraint_exists():
+        op.execute(
+            f"ALTER TABLE project_responses ADD CONSTRAINT {CONSTRAINT}"
+            f" UNIQUE USING INDEX {CONSTRAINT}"
+        )
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            OLD_INDEX,
+            table_name="project_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            OLD_INDEX,
+            "project_responses",
+            ["project_id", "framework_control_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.drop_constraint(CONSTRAINT, "project_responses", type_="unique")
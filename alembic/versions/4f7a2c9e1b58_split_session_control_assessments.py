@@ -0,0 +1,169 @@
+"""split session control assessments
+
+Revision ID: 4f7a2c9e1b58
+Revises: 9d4b6f2e8a13
+Create Date: 2026-10-17 00:00:05.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f7a2c9e1b58"
+down_revision: Union[str, None] = "9d4b6f2e8a13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STATUS = postgresql.ENUM(
+    "not_started", "draft", "pass", "fail", "na", name="controlinstancestatus", create_type=False
+)
+
+# Columns moving to session_control_assessments, in copy order
+ASSESSMENT_COLUMNS = ["status", "notes", "assessed_by_id", "reviewed_by_id", "updated_at"]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "session_control_assessments",
+        sa.Column("session_control_instance_id", sa.Uuid(), nullable=False),
+        sa.Column("audit_session_id", sa.Uuid(), nullable=False),
+        sa.Column("status", STATUS, nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("assessed_by_id", sa.Uuid(), nullable=True),
+        sa.Column("reviewed_by_id", sa.Uuid(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["session_control_instance_id"],
+            ["session_control_instances.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(["audit_session_id"], ["audit_sessions.id"]),
+        sa.ForeignKeyConstraint(["assessed_by_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["reviewed_by_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("session_control_instance_id"),
+    )
+
+    columns = ", ".join(ASSESSMENT_COLUMNS)
+    op.execute(
+        f"""
+        INSERT INTO session_control_assessments
+            (session_control_instance_id, audit_session_id, {columns})
+        SELECT id, audit_session_id, {columns}
+        FROM session_control_instances
+        """
+    )
+
+    op.create_index(
+        "ix_session_control_assessments_audit_session_id_status",
+        "session_control_assessments",
+        ["audit_session_id", "status"],
+    )
+    op.create_index(
+        "ix_session_control_assessments_assessed_by_id",
+        "session_control_assessments",
+        ["assessed_by_id"],
+    )
+    op.create_index(
+        "ix_session_control_assessments_reviewed_by_id",
+        "session_control_assessments",
+        ["reviewed_by_id"],
+    )
+
+    op.create_index(
+        "ix_session_control_instances_audit_session_id",
+        "session_control_instances",
+        ["audit_session_id"],
+    )
+    op.drop_index(
+        "ix_session_control_instances_audit_session_id_status",
+        table_name="session_control_instances",
+    )
+    op.drop_index(
+        "ix_session_control_instances_assessed_by_id",
+        table_name="session_control_instances",
+    )
+    op.drop_index(
+        "ix_session_control_instances_reviewed_by_id",
+        table_name="session_control_instances",
+    )
+    for column in ASSESSMENT_COLUMNS:
+        op.drop_column("session_control_instances", column)
+
+
+def downgrade() -> None:
+    op.add_column(
+        "session_control_instances",
+        sa.Column("status", STATUS, server_default="not_started", nullable=False),
+    )
+    op.add_column("session_control_instances", sa.Column("notes", sa.Text(), nullable=True))
+    op.add_column(
+        "session_control_instances", sa.Column("assessed_by_id", sa.Uuid(), nullable=True)
+    )
+    op.add_column(
+        "session_control_instances", sa.Column("reviewed_by_id", sa.Uuid(), nullable=True)
+    )
+    op.add_column(
+        "session_control_instances",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+
+    assignments = ", ".join(f"{column} = a.{column}" for column in ASSESSMENT_COLUMNS)
+    op.execute(
+        f"""
+        UPDATE session_control_instances AS i
+        SET {assignments}
+        FROM session_control_assessments AS a
+        WHERE a.session_control_instance_id = i.id
+        """
+    )
+
+    op.create_foreign_key(
+        "session_control_instances_assessed_by_id_fkey",
+        "session_control_instances",
+        "users",
+        ["assessed_by_id"],
+        ["id"],
+    )
+    op.create_foreign_key(
+        "session_control_instances_reviewed_by_id_fkey",
+        "session_control_instances",
+        "users",
+        ["reviewed_by_id"],
+        ["id"],
+    )
+    op.create_index(
+        "ix_session_control_instances_reviewed_by_id",
+        "session_control_instances",
+        ["reviewed_by_id"],
+    )
+    op.create_index(
+        "ix_session_control_instances_assessed_by_id",
+        "session_control_instances",
+        ["assessed_by_id"],
+    )
+    op.create_index(
+        "ix_session_control_instances_audit_session_id_status",
+        "session_control_instances",
+        ["audit_session_id", "status"],
+    )
+    op.drop_index(
+        "ix_session_control_instances_audit_session_id",
+        table_name="session_control_instances",
+    )
+    op.drop_table("session_control_assessments")
@@ -0,0 +1,141 @@
+"""add foreign key indexes
+
+Revision ID: 7b3e9d1f4a20
+Revises: 5e1f0c9a2b7d
+Create Date: 2026-10-17 00:00:02.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b3e9d1f4a20"
+down_revision: Union[str, None] = "5e1f0c9a2b7d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns). Composite indexes lead with the column the
+# hot queries filter on and add the one they filter or sort by next.
+INDEXES = [
+    ("ix_clients_tenant_id", "clients", ["tenant_id"]),
+    ("ix_users_tenant_id_full_name", "users", ["tenant_id", "full_name"]),
+    ("ix_frameworks_tenant_id", "frameworks", ["tenant_id"]),
+    ("ix_framework_sections_framework_id_order", "framework_sections", ["framework_id", "order"]),
+    ("ix_framework_sections_parent_section_id", "framework_sections", ["parent_section_id"]),
+    ("ix_framework_controls_framework_section_id", "framework_controls", ["framework_section_id"]),
+    ("ix_checklist_items_framework_control_id", "checklist_items", ["framework_control_id"]),
+    (
+        "ix_review_scope_types_framework_id_sort_order",
+        "review_scope_types",
+        ["framework_id", "sort_order"],
+    ),
+    (
+        "ix_control_to_review_scope_mappings_control_id",
+        "control_to_review_scope_mappings",
+        ["framework_control_id"],
+    ),
+    ("ix_review_scopes_project_id_sort_order", "review_scopes", ["project_id", "sort_order"]),
+    ("ix_review_scopes_review_scope_type_id", "review_scopes", ["review_scope_type_id"]),
+    ("ix_audit_sessions_review_scope_id", "audit_sessions", ["review_scope_id"]),
+    ("ix_audit_sessions_project_id", "audit_sessions", ["project_id"]),
+    (
+        "ix_session_control_instances_audit_session_id_status",
+        "session_control_instances",
+        ["audit_session_id", "status"],
+    ),
+    (
+        "ix_session_control_instances_framework_control_id",
+        "session_control_instances",
+        ["framework_control_id"],
+    ),
+    (
+        "ix_session_control_instances_assessed_by_id",
+        "session_control_instances",
+        ["assessed_by_id"],
+    ),
+    (
+        "ix_session_control_instances_reviewed_by_id",
+        "session_control_instances",
+        ["reviewed_by_id"],
+    ),
+    (
+        "ix_control_instance_evidence_files_instance_id",
+        "control_instance_evidence_files",
+        ["session_control_instance_id"],
+    ),
+    (
+        "ix_session_control_observations_instance_id",
+        "session_control_observations",
+        ["session_control_instance_id"],
+    ),
+    (
+        "ix_session_control_observation_evidence_observation_id",
+        "session_control_observation_evidence",
+        ["session_control_observation_id"],
+    ),
+    ("ix_projects_tenant_id_parent_project_id", "projects", ["tenant_id", "parent_project_id"]),
+    ("ix_projects_parent_project_id", "projects", ["parent_project_id"]),
+    ("ix_projects_client_id", "projects", ["client_id"]),
+    ("ix_projects_framework_id", "projects", ["framework_id"]),
+    ("ix_projects_owner_id", "projects", ["owner_id"]),
+    ("ix_project_members_project_id_user_id", "project_members", ["project_id", "user_id"]),
+    ("ix_project_members_user_id_project_id", "project_members", ["user_id", "project_id"]),
+    (
+        "ix_project_responses_project_id_control_id",
+        "project_responses",
+        ["project_id", "framework_control_id"],
+    ),
+    ("ix_project_responses_framework_control_id", "project_responses", ["framework_control_id"]),
+    ("ix_project_responses_assigned_to_id", "project_responses", ["assigned_to_id"]),
+    (
+        "ix_project_observations_project_id_control_id",
+        "project_observations",
+        ["project_id", "framework_control_id"],
+    ),
+    (
+        "ix_project_observations_framework_control_id",
+        "project_observations",
+        ["framework_control_id"],
+    ),
+    (
+        "ix_project_evidence_files_project_observation_id",
+        "project_evidence_files",
+        ["project_observation_id"],
+    ),
+    ("ix_form_drafts_user_id", "form_drafts", ["user_id"]),
+    (
+        "ix_workflow_executions_framework_control_id",
+        "workflow_executions",
+        ["framework_control_id"],
+    ),
+    ("ix_session_revocations_user_id", "session_revocations", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; building
+    # concurrently keeps large tables writable while the indexes are built.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,125 @@
+"""add control snapshots
+
+Revision ID: 9d4b6f2e8a13
+Revises: 2c8e5a7d9f31
+Create Date: 2026-10-17 00:00:04.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d4b6f2e8a13"
+down_revision: Union[str, None] = "2c8e5a7d9f31"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.framework.control_snapshot_hash
+CONTENT_HASH = """
+    encode(sha256(convert_to(CAST(jsonb_build_array(
+        {}, {}, {}, {}, {}
+    ) AS TEXT), 'UTF8')), 'hex')
+"""
+
+SNAPSHOT_COLUMNS = [
+    ("control_description_snapshot", "description", sa.Text()),
+    ("requirements_text_snapshot", "requirements_text", sa.Text()),
+    ("testing_procedures_text_snapshot", "testing_procedures_text", sa.Text()),
+    ("check_points_text_snapshot", "check_points_text", sa.Text()),
+    (
+        "assessment_checklist_snapshot",
+        "assessment_checklist",
+        postgresql.JSONB(astext_type=sa.Text()),
+    ),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "framework_controls",
+        sa.Column("snapshot_hash", sa.String(length=64), nullable=True),
+    )
+    op.execute(
+        "UPDATE framework_controls SET snapshot_hash = "
+        + CONTENT_HASH.format(*(name for _old, name, _type in SNAPSHOT_COLUMNS))
+    )
+
+    op.create_table(
+        "control_snapshots",
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        *(sa.Column(name, type_, nullable=True) for _old, name, type_ in SNAPSHOT_COLUMNS),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("content_hash"),
+    )
+    op.add_column(
+        "session_control_instances",
+        sa.Column("control_snapshot_hash", sa.String(length=64), nullable=True),
+    )
+
+    old_columns = [old for old, _name, _type in SNAPSHOT_COLUMNS]
+    new_columns = ", ".join(name for _old, name, _type in SNAPSHOT_COLUMNS)
+    instance_hash = CONTENT_HASH.format(*old_columns)
+    op.execute(
+        f"""
+        INSERT INTO control_snapshots (content_hash, {new_columns})
+        SELECT DISTINCT {instance_hash}, {", ".join(old_columns)}
+        FROM session_control_instances
+        ON CONFLICT (content_hash) DO NOTHING
+        """
+    )
+    op.execute(f"UPDATE session_control_instances SET control_snapshot_hash = {instance_hash}")
+
+    op.alter_column("session_control_instances", "control_snapshot_hash", nullable=False)
+    op.create_foreign_key(
+        "session_control_instances_control_snapshot_hash_fkey",
+        "session_control_instances",
+        "control_snapshots",
+        ["control_snapshot_hash"],
+        ["content_hash"],
+    )
+    op.create_index(
+        "ix_session_control_instances_control_snapshot_hash",
+        "session_control_instances",
+        ["control_snapshot_hash"],
+    )
+    for old, _name, _type in SNAPSHOT_COLUMNS:
+        op.drop_column("session_control_instances", old)
+
+
+def downgrade() -> None:
+    for old, _name, type_ in SNAPSHOT_COLUMNS:
+        op.add_column("session_control_instances", sa.Column(old, type_, nullable=True))
+
+    assignments = ", ".join(f"{old} = s.{name}" for old, name, _type in SNAPSHOT_COLUMNS)
+    op.execute(
+        f"""
+        UPDATE session_control_instances AS i
+        SET {assignments}
+        FROM control_snapshots AS s
+        WHERE s.content_hash = i.control_snapshot_hash
+        """
+    )
+
+    op.drop_index(
+        "ix_session_control_instances_control_snapshot_hash",
+        table_name="session_control_instances",
+    )
+    op.drop_constraint(
+        "session_control_instances_control_snapshot_hash_fkey",
+        "session_control_instances",
+        type_="foreignkey",
+    )
+    op.drop_column("session_control_instances", "control_snapshot_hash")
+    op.drop_table("control_snapshots")
+    op.drop_column("framework_controls", "snapshot_hash")
@@ -0,0 +1,89 @@
+"""add search vectors
+
+Revision ID: a3f8c1d6e2b4
+Revises: c7d4e2a9b5f1
+Create Date: 2026-10-17 00:00:09.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f8c1d6e2b4"
+down_revision: Union[str, None] = "c7d4e2a9b5f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> (column, weight) pairs of its generated search vector
+SEARCH_VECTORS = {
+    "framework_controls": (
+        ("control_id", "A"),
+        ("name", "A"),
+        ("description", "B"),
+        ("requirements_text", "B"),
+        ("implementation_guidance", "C"),
+        ("testing_procedures_text", "C"),
+        ("check_points_text", "C"),
+    ),
+    "project_responses": (("finding", "A"), ("recommendation", "B"), ("response_text", "C")),
+    "project_observations": (("observation_text", "A"), ("recommendation_text", "B")),
+    "project_evidence_files": (("content", "A"),),
+    "session_control_observations": (("observation_text", "A"), ("recommendation_text", "B")),
+    "control_instance_evidence_files": (("content", "A"),),
+    "session_control_observation_evidence": (("content", "A"),),
+}
+
+
+def _expression(weighted_columns) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table under an ACCESS
+    # EXCLUSIVE lock: reads and writes of that table wait until the rewrite is
+    # done, which on project_responses or framework_controls with millions of
+    # rows takes minutes. Each table is altered in its own transaction, so only
+    # one is locked at a time and the others stay available; still run this in
+    # a maintenance window on large installations. The GIN indexes are then
+    # built concurrently, which keeps the tables writable.
+    with op.get_context().autocommit_block():
+        for table, weighted_columns in SEARCH_VECTORS.items():
+            op.add_column(
+                table,
+                sa.Column(
+                    "search_vector",
+                    postgresql.TSVECTOR(),
+                    sa.Computed(_expression(weighted_columns), persisted=True),
+                ),
+                if_not_exists=True,
+            )
+        for table in SEARCH_VECTORS:
+            op.create_index(
+                f"ix_{table}_search_vector",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(list(SEARCH_VECTORS)):
+            op.drop_index(
+                f"ix_{table}_search_vector",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.drop_column(table, "search_vector")
@@ -0,0 +1,68 @@
+"""add evidence blobs
+
+Revision ID: a7f3c9e1d5b2
+Revises: d8a4f1c9e3b7
+Create Date: 2026-10-17 00:00:12.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7f3c9e1d5b2"
+down_revision: Union[str, None] = "d8a4f1c9e3b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+EVIDENCE_TABLES = [
+    "control_instance_evidence_files",
+    "session_control_observation_evidence",
+    "project_evidence_files",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_blobs",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("tenant_id", sa.Uuid(), nullable=False),
+        sa.Column("extension", sa.String(length=16), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("sha256"),
+    )
+    op.create_index("ix_evidence_blobs_tenant_id", "evidence_blobs", ["tenant_id"])
+    # Existing files keep their paths (blob_sha256 NULL) until
+    # scripts/reconcile_evidence_blobs.py --adopt-legacy moves them into the store
+    for table in EVIDENCE_TABLES:
+        op.add_column(table, sa.Column("blob_sha256", sa.String(length=64), nullable=True))
+        op.create_foreign_key(
+            f"{table}_blob_sha256_fkey",
+            table,
+            "evidence_blobs",
+            ["blob_sha256"],
+            ["sha256"],
+        )
+        op.create_index(f"ix_{table}_blob_sha256", table, ["blob_sha256"])
+
+
+def downgrade() -> None:
+    # Rows keep their file_path into the blob directory; files shared by
+    # several rows are then removed with the first row deleted
+    for table in EVIDENCE_TABLES:
+        op.drop_index(f"ix_{table}_blob_sha256", table_name=table)
+        op.drop_constraint(f"{table}_blob_sha256_fkey", table, type_="foreignkey")
+        op.drop_column(table, "blob_sha256")
+    op.drop_index("ix_evidence_blobs_tenant_id", table_name="evidence_blobs")
+    op.drop_table("evidence_blobs")
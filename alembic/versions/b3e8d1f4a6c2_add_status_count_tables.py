@@ -0,0 +1,98 @@
+"""add status count tables
+
+Revision ID: b3e8d1f4a6c2
+Revises: 4f7a2c9e1b58
+Create Date: 2026-10-17 00:00:06.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8d1f4a6c2"
+down_revision: Union[str, None] = "4f7a2c9e1b58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+STATUSES = ["not_started", "draft", "pass", "fail", "na"]
+
+
+def _count_columns() -> list[sa.Column]:
+    return [
+        sa.Column(f"{status}_count", sa.Integer(), server_default="0", nullable=False)
+        for status in STATUSES
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_session_status_counts",
+        sa.Column("audit_session_id", sa.Uuid(), nullable=False),
+        sa.Column("review_scope_id", sa.Uuid(), nullable=False),
+        *_count_columns(),
+        sa.ForeignKeyConstraint(["audit_session_id"], ["audit_sessions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["review_scope_id"], ["review_scopes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("audit_session_id"),
+    )
+    op.create_index(
+        "ix_audit_session_status_counts_review_scope_id",
+        "audit_session_status_counts",
+        ["review_scope_id"],
+    )
+    op.create_table(
+        "review_scope_status_counts",
+        sa.Column("review_scope_id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        *_count_columns(),
+        sa.ForeignKeyConstraint(["review_scope_id"], ["review_scopes.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"]),
+        sa.PrimaryKeyConstraint("review_scope_id"),
+    )
+    op.create_index(
+        "ix_review_scope_status_counts_project_id",
+        "review_scope_status_counts",
+        ["project_id"],
+    )
+
+    columns = ", ".join(f"{status}_count" for status in STATUSES)
+    session_counts = ", ".join(
+        f"count(a.session_control_instance_id) FILTER (WHERE a.status = '{status}')"
+        for status in STATUSES
+    )
+    op.execute(
+        f"""
+        INSERT INTO audit_session_status_counts (audit_session_id, review_scope_id, {columns})
+        SELECT s.id, s.review_scope_id, {session_counts}
+        FROM audit_sessions AS s
+        LEFT JOIN session_control_assessments AS a ON a.audit_session_id = s.id
+        GROUP BY s.id
+        """
+    )
+    scope_counts = ", ".join(f"coalesce(sum(c.{status}_count), 0)" for status in STATUSES)
+    op.execute(
+        f"""
+        INSERT INTO review_scope_status_counts (review_scope_id, project_id, {columns})
+        SELECT r.id, r.project_id, {scope_counts}
+        FROM review_scopes AS r
+        LEFT JOIN audit_session_status_counts AS c ON c.review_scope_id = r.id
+        GROUP BY r.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_review_scope_status_counts_project_id",
+        table_name="review_scope_status_counts",
+    )
+    op.drop_table("review_scope_status_counts")
+    op.drop_index(
+        "ix_audit_session_status_counts_review_scope_id",
+        table_name="audit_session_status_counts",
+    )
+    op.drop_table("audit_session_status_counts")
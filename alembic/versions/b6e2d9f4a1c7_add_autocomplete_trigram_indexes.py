@@ -0,0 +1,58 @@
+"""add autocomplete trigram indexes
+
+Revision ID: b6e2d9f4a1c7
+Revises: a3f8c1d6e2b4
+Create Date: 2026-10-17 00:00:10.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b6e2d9f4a1c7"
+down_revision: Union[str, None] = "a3f8c1d6e2b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# table -> columns searched with ILIKE '%term%'
+TRIGRAM_COLUMNS = {
+    "users": ("full_name", "email"),
+    "clients": ("name", "industry", "contact_name", "contact_email"),
+}
+
+
+def upgrade() -> None:
+    # pg_trgm ships with Postgres (contrib); creating it needs a role allowed
+    # to create trusted extensions, which the database owner is
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Trigram indexes are built concurrently outside a transaction, as in
+    # 7b3e9d1f4a20, so users and clients stay writable meanwhile
+    with op.get_context().autocommit_block():
+        for table, columns in TRIGRAM_COLUMNS.items():
+            for column in columns:
+                op.create_index(
+                    f"ix_{table}_{column}_trgm",
+                    table,
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    # The extension is left in place: other objects may have come to use it
+    with op.get_context().autocommit_block():
+        for table in reversed(list(TRIGRAM_COLUMNS)):
+            for column in reversed(TRIGRAM_COLUMNS[table]):
+                op.drop_index(
+                    f"ix_{table}_{column}_trgm",
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
@@ -0,0 +1,70 @@
+"""add list sort indexes
+
+Revision ID: c7d4e2a9b5f1
+Revises: e5c2a9d7f3b1
+Create Date: 2026-10-17 00:00:08.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7d4e2a9b5f1"
+down_revision: Union[str, None] = "e5c2a9d7f3b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TOP_LEVEL = sa.text("parent_project_id IS NULL")
+
+# name, table, columns, partial-index predicate
+INDEXES = [
+    ("ix_projects_list_recent", "projects", ["tenant_id", "updated_at", "id"], TOP_LEVEL),
+    ("ix_projects_list_name", "projects", ["tenant_id", "name", "id"], TOP_LEVEL),
+    ("ix_projects_list_status", "projects", ["tenant_id", "status", "name", "id"], TOP_LEVEL),
+    ("ix_clients_tenant_id_name", "clients", ["tenant_id", "name", "id"], None),
+]
+
+
+def upgrade() -> None:
+    # Built and dropped concurrently outside a transaction, as in 7b3e9d1f4a20,
+    # so projects and clients stay writable; ix_clients_tenant_id is only
+    # dropped once its replacement exists
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_clients_tenant_id",
+            table_name="clients",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_clients_tenant_id",
+            "clients",
+            ["tenant_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, table, _columns, _where in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
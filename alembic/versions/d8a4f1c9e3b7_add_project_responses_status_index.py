@@ -0,0 +1,40 @@
+"""add project responses status index
+
+Revision ID: d8a4f1c9e3b7
+Revises: b6e2d9f4a1c7
+Create Date: 2026-10-17 00:00:11.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a4f1c9e3b7"
+down_revision: Union[str, None] = "b6e2d9f4a1c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently: project_responses is written on every control save
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_project_responses_project_id_status",
+            "project_responses",
+            ["project_id", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_project_responses_project_id_status",
+            table_name="project_responses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
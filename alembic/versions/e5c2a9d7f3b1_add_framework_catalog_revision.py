@@ -0,0 +1,30 @@
+"""add framework catalog revision
+
+Revision ID: e5c2a9d7f3b1
+Revises: b3e8d1f4a6c2
+Create Date: 2026-10-17 00:00:07.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5c2a9d7f3b1"
+down_revision: Union[str, None] = "b3e8d1f4a6c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "frameworks",
+        sa.Column("catalog_revision", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("frameworks", "catalog_revision")
@@ -0,0 +1,66 @@
+"""keep control snapshot hashes in a trigger
+
+Revision ID: f3a9c5e7b2d4
+Revises: a7f3c9e1d5b2
+Create Date: 2026-10-17 00:00:13.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a9c5e7b2d4"
+down_revision: Union[str, None] = "a7f3c9e1d5b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match app.models.framework.SNAPSHOT_HASH_TRIGGER
+CONTENT_HASH = """
+    encode(sha256(convert_to(CAST(jsonb_build_array(
+        {prefix}description, {prefix}requirements_text, {prefix}testing_procedures_text,
+        {prefix}check_points_text, {prefix}assessment_checklist
+    ) AS TEXT), 'UTF8')), 'hex')
+"""
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION framework_controls_snapshot_hash() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.snapshot_hash := {CONTENT_HASH.format(prefix="NEW.")};
+            RETURN NEW;
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER framework_controls_snapshot_hash
+            BEFORE INSERT OR UPDATE ON framework_controls
+            FOR EACH ROW EXECUTE FUNCTION framework_controls_snapshot_hash()
+        """
+    )
+    # Hashes left stale or NULL by Core updates and manual edits; the trigger
+    # recomputes them
+    op.execute(
+        "UPDATE framework_controls SET snapshot_hash = NULL WHERE snapshot_hash IS DISTINCT FROM "
+        + CONTENT_HASH.format(prefix="")
+    )
+    op.alter_column(
+        "framework_controls", "snapshot_hash", existing_type=sa.String(length=64), nullable=False
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "framework_controls", "snapshot_hash", existing_type=sa.String(length=64), nullable=True
+    )
+    op.execute("DROP TRIGGER framework_controls_snapshot_hash ON framework_controls")
+    op.execute("DROP FUNCTION framework_controls_snapshot_hash()")
@@ -21,6 +21,53 @@ class Settings(BaseSettings):
     session_cookie_httponly: bool = True
     session_cookie_samesite: str = "Lax"
 
+    # Password hashing and login throttling (per worker)
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
+    login_ip_max_failures: int = 20
+    login_ip_window_seconds: int = 300
+    login_account_max_failures: int = 5
+    login_account_window_seconds: int = 900
+
+    # Reverse proxies (addresses or CIDR networks) whose X-Forwarded-For is
+    # trusted; with none, the client address is the connecting peer
+    trusted_proxies: list[str] = []
+
+    # Session revocation (per-worker mirror of session_revocations)
+    session_revocation_refresh_seconds: int = 5
+    session_revocation_bloom_capacity: int = 100_000
+    session_revocation_bloom_error_rate: float = 0.01
+
+    # Authenticated principal cache (per worker)
+    principal_cache_max_size: int = 1024
+    principal_cache_ttl_seconds: int = 60
+
+    # Framework catalog cache (per worker, frameworks kept)
+    framework_catalog_cache_max_size: int = 64
+
+    # Autocomplete result cache (per worker, per tenant and query)
+    autocomplete_cache_max_size: int = 4096
+    autocomplete_cache_ttl_seconds: int = 30
+
+    # Dashboard summary cache (per worker, per tenant and user)
+    dashboard_cache_max_size: int = 1024
+    dashboard_cache_ttl_seconds: int = 15
+
+    # List pages (rows per page; more load on scroll)
+    list_page_size: int = 50
+
+    # Full-text search (results per query)
+    search_result_limit: int = 50
+
+    # Evidence uploads (largest file accepted; bytes buffered per disk write)
+    evidence_upload_max_bytes: int = 50 * 1024 * 1024
+    evidence_upload_chunk_bytes: int = 1024 * 1024
+
+    # Evidence blob store (content-addressed per tenant; files are shared between
+    # a tenant's evidence rows). Keep it outside static/: blobs are served by an
+    # authenticated route
+    evidence_blob_dir: str = "data/evidence_blobs"
+
     # Azure AD SSO
     azure_ad_enabled: bool = False
     azure_ad_tenant_id: str = ""
@@ -29,6 +76,11 @@ class Settings(BaseSettings):
     azure_ad_redirect_uri: str = "http://localhost:8000/auth/azure/callback"
     azure_ad_scopes: str = "User.Read"
     azure_default_tenant_slug: str = ""
+    # Overrides for pointing sign-in at a stand-in identity endpoint
+    azure_ad_authority: str = ""  # defaults to login.microsoftonline.com/<tenant>
+    azure_ad_instance_discovery: bool = True
+    azure_ad_ca_bundle: str = ""
+    azure_ad_http_cache_path: str = ".cache/msal_http_cache.pickle"
 
     # Logging
     log_level: str = "INFO"
@@ -38,6 +90,14 @@ class Settings(BaseSettings):
     db_log_queries: bool = False
     db_slow_query_ms: int = 500
 
+    # Per-request statement budget; exceeding it warns, or raises when debug is on
+    db_query_budget: int = 100
+    db_query_budgets: dict[str, int] = {}  # overrides keyed by route path template
+    db_n_plus_one_threshold: int = 5  # identical statements per request before flagging
+
+    # Prometheus /metrics: scrapers send "Authorization: Bearer <token>"; unset disables it
+    metrics_token: str = ""
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -1,11 +1,18 @@
 import logging
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 
 from sqlalchemy import create_engine
 from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
+from app import metrics
 from app.config import get_settings
+from app.query_stats import QueryBudgetExceeded, current_query_stats
 
 
 settings = get_settings()
@@ -17,50 +24,99 @@ def _compact_sql(statement: str | None) -> str:
         return "-"
     return " ".join(statement.split())
 
+
+def _async_database_url(url: str) -> str:
+    """Return the asyncpg flavour of the configured PostgreSQL URL."""
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(
+        hide_password=False
+    )
+
+
+class _PoolMetrics:
+    """Pool mixin exporting checkout counts, wait time and pool occupancy."""
+
+    engine_label = "-"
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        connection = super()._do_get()
+        metrics.DB_POOL_WAIT.labels(self.engine_label).observe(
+            time.perf_counter() - started_at
+        )
+        metrics.DB_POOL_CHECKOUTS.labels(self.engine_label).inc()
+        metrics.observe_pool(self.engine_label, self)
+        return connection
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        metrics.observe_pool(self.engine_label, self)
+
+
+class _MeteredQueuePool(_PoolMetrics, QueuePool):
+    engine_label = "sync"
+
+
+class _MeteredAsyncQueuePool(_PoolMetrics, AsyncAdaptedQueuePool):
+    engine_label = "async"
+
+
 engine = create_engine(
     settings.database_url,
     echo=False,
     pool_pre_ping=True,
+    poolclass=_MeteredQueuePool,
+)
+
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    echo=False,
+    pool_pre_ping=True,
+    poolclass=_MeteredAsyncQueuePool,
 )
 
 
-@event.listens_for(engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Store query start time for duration logging."""
     conn.info.setdefault("query_start_time", []).append(time.perf_counter())
 
 
-@event.listens_for(engine, "after_cursor_execute")
 def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
-    """Log slow queries and optionally all queries."""
+    """Log slow queries and optionally all queries, and count them per request."""
     started_times = conn.info.get("query_start_time", [])
     if not started_times:
         return
 
     started_at = started_times.pop(-1)
     duration_ms = (time.perf_counter() - started_at) * 1000
+    metrics.observe_query(
+        "async" if conn.dialect.is_async else "sync", statement, duration_ms / 1000
+    )
 
-    if not settings.db_log_queries and duration_ms < settings.db_slow_query_ms:
-        return
+    if settings.db_log_queries or duration_ms >= settings.db_slow_query_ms:
+        event_name = "slow_query" if duration_ms >= settings.db_slow_query_ms else "query"
+        DB_LOGGER.info(
+            "%s duration_ms=%.2f rowcount=%s executemany=%s sql=%s",
+            event_name,
+            duration_ms,
+            cursor.rowcount,
+            executemany,
+            _compact_sql(statement),
+        )
 
-    event_name = "slow_query" if duration_ms >= settings.db_slow_query_ms else "query"
-    DB_LOGGER.info(
-        "%s duration_ms=%.2f rowcount=%s executemany=%s sql=%s",
-        event_name,
-        duration_ms,
-        cursor.rowcount,
-        executemany,
-        _compact_sql(statement),
-    )
+    stats = current_query_stats()
+    if stats is not None:
+        stats.record(statement, duration_ms)
 
 
-@event.listens_for(engine, "handle_error")
 def handle_db_error(exception_context):
     """Emit DB failures to the dedicated database log."""
     started_times = exception_context.connection.info.get("query_start_time", [])
     if started_times:
         started_times.pop(-1)
 
+    if isinstance(exception_context.original_exception, QueryBudgetExceeded):
+        return
+
     DB_LOGGER.error(
         "db_error error=%s sql=%s",
         exception_context.original_exception,
@@ -68,7 +124,22 @@ def handle_db_error(exception_context):
     )
 
 
+def _instrument(target: Engine) -> None:
+    """Attach query timing and error logging to an engine."""
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    event.listen(target, "after_cursor_execute", after_cursor_execute)
+    event.listen(target, "handle_error", handle_db_error)
+
+
+# Async engines emit cursor events from their underlying sync engine
+_instrument(engine)
+_instrument(async_engine.sync_engine)
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 
 def get_db() -> Session:
@@ -78,3 +149,45 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def in_unit_of_work(db: Session) -> bool:
+    """Whether repository writes on this session should flush rather than commit."""
+    return bool(db.info.get(UNIT_OF_WORK_KEY))
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """Run a block of repository writes as one transaction.
+
+    Inside the block repositories only flush, so every write shares a single
+    transaction and generated columns come back through ``INSERT ... RETURNING``
+    instead of a refresh after each commit. The block commits once on success
+    and rolls back on any exception. Nested blocks join the outer one.
+    """
+    if in_unit_of_work(db):
+        yield db
+        return
+
+    db.info[UNIT_OF_WORK_KEY] = True
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        db.info.pop(UNIT_OF_WORK_KEY, None)
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency to get an async database session.
+
+    Handlers using this session must eager-load every relationship their
+    templates touch; lazy loads are not available on an ``AsyncSession``.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
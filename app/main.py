@@ -1,17 +1,20 @@
+import asyncio
+import contextlib
 import logging
+import secrets
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
+from app import metrics
 from app.config import get_settings
 from app.logging_config import configure_logging
-from app.middleware.auth import AuthMiddleware
-from app.middleware.request_logging import RequestLoggingMiddleware
-from app.middleware.tenant import TenantMiddleware
+from app.middleware.request_context import RequestContextMiddleware
 from app.routes import auth, dashboard, clients, frameworks, projects, admin
-from app.routes import admin_users
+from app.routes import admin_users, evidence, search
+from app.services.session_revocation import revocation_list
 from app.templates import templates
 from app.utils.htmx import htmx_toast, is_htmx_request
 
@@ -28,7 +31,12 @@ async def lifespan(_: FastAPI):
         settings.app_name,
         settings.debug,
     )
+    revocation_task = asyncio.create_task(revocation_list.run())
     yield
+    revocation_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await revocation_task
+    metrics.mark_process_dead()
     APP_LOGGER.info("application_shutdown")
 
 
@@ -43,10 +51,8 @@ def create_app() -> FastAPI:
     # Mount static files
     app.mount("/static", StaticFiles(directory="static"), name="static")
 
-    # Add middleware (order matters - add in reverse)
-    app.add_middleware(TenantMiddleware)
-    app.add_middleware(AuthMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
+    # Resolve request id, user and tenant in a single pure-ASGI pass
+    app.add_middleware(RequestContextMiddleware)
 
     # Include routers
     app.include_router(auth.router)
@@ -56,12 +62,33 @@ def create_app() -> FastAPI:
     app.include_router(projects.router)
     app.include_router(admin.router)
     app.include_router(admin_users.router)
+    app.include_router(search.router)
+    app.include_router(evidence.router)
 
     # Root redirect
     @app.get("/")
     def root():
         return RedirectResponse(url="/auth/login")
 
+    # Liveness probe (bypasses request context middleware)
+    @app.get("/health")
+    def health():
+        return {"status": "ok"}
+
+    # Prometheus scrape target, merged across workers (bypasses request context middleware,
+    # so it carries its own bearer token check; not served at all without a token)
+    @app.get("/metrics", include_in_schema=False)
+    def prometheus_metrics(request: Request):
+        if not settings.metrics_token:
+            return Response(status_code=404)
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not secrets.compare_digest(
+            token.strip().encode(), settings.metrics_token.encode()
+        ):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+        body, content_type = metrics.render_latest()
+        return Response(body, media_type=content_type)
+
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         if is_htmx_request(request):
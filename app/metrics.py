@@ -0,0 +1,100 @@
+"""Prometheus metrics for requests, queries, the connection pools and templates.
+
+Under several uvicorn workers each process keeps its own counters, so a scrape
+would only see whichever worker answered it. Set ``PROMETHEUS_MULTIPROC_DIR``
+to an empty, writable directory before starting the server (and clear it on
+every deploy): prometheus_client then keeps values in per-process files there
+and ``render_latest`` merges all of them into one exposition.
+"""
+
+from __future__ import annotations
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+# Request and query latencies cluster well under a second; keep a tail for slow pages.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "auditpro_http_request_duration_seconds",
+    "Request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_DURATION = Histogram(
+    "auditpro_db_query_duration_seconds",
+    "Statement execution time.",
+    ["engine", "operation"],
+    buckets=QUERY_BUCKETS,
+)
+DB_POOL_CHECKOUTS = Counter(
+    "auditpro_db_pool_checkouts",
+    "Connections checked out of the pool.",
+    ["engine"],
+)
+DB_POOL_WAIT = Histogram(
+    "auditpro_db_pool_wait_seconds",
+    "Time to obtain a pooled connection, including opening a new one.",
+    ["engine"],
+    buckets=QUERY_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "auditpro_db_pool_checked_out",
+    "Connections currently checked out.",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "auditpro_db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is filling).",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+TEMPLATE_RENDER_DURATION = Histogram(
+    "auditpro_template_render_seconds",
+    "Jinja2 template render time.",
+    ["template"],
+    buckets=LATENCY_BUCKETS,
+)
+
+_SQL_OPERATIONS = ("select", "insert", "update", "delete", "with")
+
+
+def observe_query(engine: str, statement: str, seconds: float) -> None:
+    """Record a statement's duration under its leading SQL keyword."""
+    head = statement.lstrip()[:6].lower()
+    operation = next((op for op in _SQL_OPERATIONS if head.startswith(op)), "other")
+    DB_QUERY_DURATION.labels(engine, operation).observe(seconds)
+
+
+def observe_pool(engine: str, pool) -> None:
+    """Refresh the pool gauges from a QueuePool's current state."""
+    DB_POOL_CHECKED_OUT.labels(engine).set(pool.checkedout())
+    DB_POOL_OVERFLOW.labels(engine).set(pool.overflow())
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Exposition text for every worker (multiprocess) or this process."""
+    if MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared directory on shutdown."""
+    if MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(os.getpid())
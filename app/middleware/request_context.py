@@ -0,0 +1,198 @@
+"""Single-pass request context middleware.
+
+Resolves the request id, authenticated user and tenant, binds the logging
+context once, and emits the access log line and request latency metric. Implemented as a pure ASGI
+middleware so requests are not wrapped in the extra task and response
+streaming that ``BaseHTTPMiddleware`` adds per layer.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+import time
+import uuid
+from collections.abc import Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import metrics
+from app.config import get_settings
+from app.logging_config import bind_log_context, reset_log_context
+from app.query_stats import start_query_stats, stop_query_stats
+from app.services.auth_service import get_principal_from_token
+
+
+ACCESS_LOGGER = logging.getLogger("auditpro.access")
+APP_LOGGER = logging.getLogger("auditpro.app")
+SECURITY_LOGGER = logging.getLogger("auditpro.security")
+
+# Requests for these paths, or under these prefixes, bypass context resolution
+# and access logging. Probe and scrape endpoints match exactly, so that
+# "/healthcheck" or "/metrics-export" routes would still be logged.
+SKIP_PATHS = frozenset({"/health", "/metrics"})
+SKIP_PATH_PREFIXES = ("/static/",)
+
+
+ProxyNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+def parse_trusted_proxies(entries: Sequence[str]) -> tuple[ProxyNetwork, ...]:
+    """Networks from ``settings.trusted_proxies`` (a bare address is a /32 or /128)."""
+    return tuple(ipaddress.ip_network(entry.strip(), strict=False) for entry in entries)
+
+
+def _is_trusted(address: str, trusted: tuple[ProxyNetwork, ...]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def resolve_client_ip(
+    peer: str | None, forwarded_for: str, trusted: tuple[ProxyNetwork, ...]
+) -> str:
+    """The client address to log and throttle by.
+
+    X-Forwarded-For is only read when the connecting peer is a trusted
+    proxy, since any client can send the header. Each proxy appends the
+    address it received the request from, so the client is the rightmost
+    entry that is not itself a trusted proxy.
+    """
+    if peer is None:
+        return "-"
+    if not forwarded_for or not _is_trusted(peer, trusted):
+        return peer
+    hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, trusted):
+            return hop
+    return hops[0] if hops else peer
+
+
+class RequestContextMiddleware:
+    """Attach request id, user and tenant to the request and log its outcome."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        skip_paths: frozenset[str] = SKIP_PATHS,
+        skip_path_prefixes: tuple[str, ...] = SKIP_PATH_PREFIXES,
+    ):
+        self.app = app
+        self.skip_paths = skip_paths
+        self.skip_path_prefixes = skip_path_prefixes
+        settings = get_settings()
+        self.session_cookie_name = settings.session_cookie_name
+        self.trusted_proxies = parse_trusted_proxies(settings.trusted_proxies)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] in self.skip_paths
+            or scope["path"].startswith(self.skip_path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        conn = HTTPConnection(scope)
+        request_id = conn.headers.get("x-request-id") or uuid.uuid4().hex[:12]
+        client_ip = resolve_client_ip(
+            conn.client.host if conn.client else None,
+            conn.headers.get("x-forwarded-for", ""),
+            self.trusted_proxies,
+        )
+
+        stats_token = start_query_stats(scope)
+        principal = None
+        session_token = conn.cookies.get(self.session_cookie_name)
+        if session_token:
+            principal = await get_principal_from_token(session_token)
+
+        user = principal.user if principal else None
+        tenant = principal.tenant if principal else None
+        conn.state.request_id = request_id
+        conn.state.client_ip = client_ip
+        conn.state.user = user
+        conn.state.tenant = tenant
+
+        bind_log_context(
+            request_id=request_id,
+            client_ip=client_ip,
+            method=scope["method"],
+            path=scope["path"],
+            user_id=user.id if user else None,
+            tenant_id=user.tenant_id if user else None,
+        )
+        if session_token and user is None:
+            SECURITY_LOGGER.warning("invalid_or_expired_session_cookie")
+        elif user is not None and tenant is None:
+            APP_LOGGER.error("authenticated_user_missing_tenant user_id=%s", user.id)
+
+        response_start: dict = {}
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                response_start["status"] = message["status"]
+                response_start["bytes"] = headers.get("content-length", "-")
+            await send(message)
+
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception:
+            duration_ms = (time.perf_counter() - started_at) * 1000
+            stats = stop_query_stats(stats_token)
+            route = scope.get("route")
+            metrics.HTTP_REQUEST_DURATION.labels(
+                scope["method"], getattr(route, "path", "<unmatched>"), 500
+            ).observe(duration_ms / 1000)
+            APP_LOGGER.exception(
+                "request_failed duration_ms=%.2f queries=%d db_ms=%.2f",
+                duration_ms,
+                stats.count,
+                stats.duration_ms,
+            )
+            reset_log_context()
+            raise
+
+        duration_ms = (time.perf_counter() - started_at) * 1000
+        status_code = response_start.get("status", 500)
+        stats = stop_query_stats(stats_token)
+        route = scope.get("route")
+        metrics.HTTP_REQUEST_DURATION.labels(
+            scope["method"],
+            getattr(route, "path", "<unmatched>"),
+            status_code,
+        ).observe(duration_ms / 1000)
+
+        level = logging.INFO
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+
+        ACCESS_LOGGER.log(
+            level,
+            "request_completed status=%s duration_ms=%.2f bytes=%s"
+            " queries=%d db_ms=%.2f repeated_sql=%d",
+            status_code,
+            duration_ms,
+            response_start.get("bytes", "-"),
+            stats.count,
+            stats.duration_ms,
+            len(stats.flagged),
+        )
+        if stats.over_budget:
+            APP_LOGGER.warning(
+                "query_budget_exceeded route=%s queries=%d budget=%d",
+                stats.route,
+                stats.count,
+                stats.budget,
+            )
+        reset_log_context()
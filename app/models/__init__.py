@@ -3,6 +3,7 @@ from app.models.tenant import Tenant
 from app.models.user import User, UserRole
 from app.models.client import Client
 from app.models.form_draft import FormDraft
+from app.models.session_revocation import SessionRevocation
 from app.models.framework import (
     Framework,
     FrameworkSection,
@@ -25,9 +26,14 @@ from app.models.health_check import (
     ReviewScope,
     AuditSession,
     SessionControlInstance,
+    SessionControlAssessment,
+    AuditSessionStatusCounts,
+    ReviewScopeStatusCounts,
+    ControlSnapshot,
     ControlInstanceEvidenceFile,
     ControlInstanceStatus,
 )
+from app.models.evidence import EvidenceBlob
 
 __all__ = [
     "BaseModel",
@@ -37,6 +43,7 @@ __all__ = [
     "UserRole",
     "Client",
     "FormDraft",
+    "SessionRevocation",
     "Framework",
     "FrameworkSection",
     "FrameworkControl",
@@ -55,6 +62,11 @@ __all__ = [
     "ReviewScope",
     "AuditSession",
     "SessionControlInstance",
+    "SessionControlAssessment",
+    "AuditSessionStatusCounts",
+    "ReviewScopeStatusCounts",
+    "ControlSnapshot",
     "ControlInstanceEvidenceFile",
     "ControlInstanceStatus",
+    "EvidenceBlob",
 ]
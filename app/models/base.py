@@ -1,9 +1,14 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import DateTime, func
+from sqlalchemy import DDL, Column, Computed, DateTime, Index, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from typing import Any
 
+# Text search configuration of the stored search vectors; queries against
+# them must parse with the same one
+SEARCH_CONFIG = "english"
+
 
 class BaseModel(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -11,9 +16,17 @@ class BaseModel(DeclarativeBase):
     pass
 
 
+# Trigram indexes need pg_trgm; migrations create it too
+event.listen(BaseModel.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 class TimestampMixin:
     """Mixin for models with timestamp tracking."""
 
+    # Fetch server-generated timestamps with RETURNING on INSERT and UPDATE
+    # rather than leaving them expired for a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -21,3 +34,37 @@ class TimestampMixin:
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+
+
+class SearchableMixin(TimestampMixin):
+    """Timestamped model with a generated ``search_vector`` column for full-text search.
+
+    The column is in the table but not mapped: Postgres computes it on every
+    write, whatever issues it, and only search queries read it (as
+    ``Model.search_vector``), so the ORM neither loads it nor fetches it back
+    with RETURNING.
+    """
+
+    __mapper_args__ = {**TimestampMixin.__mapper_args__, "exclude_properties": ["search_vector"]}
+
+
+def search_vector_column(*weighted_columns: tuple[str, str]) -> Column:
+    """Generated ``tsvector`` over ``(column, weight)`` pairs, for a ``SearchableMixin`` model."""
+    expression = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+    return Column("search_vector", TSVECTOR, Computed(expression, persisted=True))
+
+
+def trigram_indexes(table: str, *columns: str) -> list[Index]:
+    """GIN trigram index per column, so ``ILIKE '%term%'`` on it need not scan the table."""
+    return [
+        Index(
+            f"ix_{table}_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        for column in columns
+    ]
@@ -1,13 +1,19 @@
 import uuid
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, trigram_indexes
 
 
 class Client(BaseModel, TimestampMixin):
     """Client/customer model."""
 
     __tablename__ = "clients"
+    __table_args__ = (
+        # Clients list sort key (see ClientRepository.LIST_SORT)
+        Index("ix_clients_tenant_id_name", "tenant_id", "name", "id"),
+        # Client autocomplete and list search (see ClientRepository.search)
+        *trigram_indexes("clients", "name", "industry", "contact_name", "contact_email"),
+    )
 
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tenants.id"), nullable=False
@@ -0,0 +1,66 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, event, func, inspect
+from sqlalchemy.orm import Mapped, mapped_column, object_session
+
+from app.models.base import BaseModel
+from app.models.health_check import ControlInstanceEvidenceFile, SessionControlObservationEvidence
+from app.models.project import ProjectEvidenceFile
+
+# Evidence rows that can point at a blob
+EVIDENCE_FILE_MODELS = (
+    ControlInstanceEvidenceFile, SessionControlObservationEvidence, ProjectEvidenceFile,
+)
+
+# Session.info key: blobs that lost a reference in this session, for EvidenceStore.collect
+RELEASED_BLOBS_KEY = "released_evidence_blobs"
+
+
+class EvidenceBlob(BaseModel):
+    """An uploaded evidence file, stored once per tenant and content.
+
+    ``sha256`` is the blob's key: the SHA-256 of the tenant id followed by the
+    SHA-256 of the file's bytes (``app.services.evidence_store.blob_key``), so
+    tenants never share a blob and its name says nothing about the content.
+    Control instance files, health check observation images and standard
+    observation images point at a blob through ``blob_sha256``, so the same
+    screenshot attached to many sessions and observations is one file on
+    disk. A blob is unreferenced when no row of ``EVIDENCE_FILE_MODELS``
+    points at it; that is checked against the tables themselves
+    (``EvidenceBlobRepository``), so rows removed by a database cascade or a
+    bulk delete count too. ``EvidenceStore.collect`` removes it then.
+    """
+
+    __tablename__ = "evidence_blobs"
+    __table_args__ = (Index("ix_evidence_blobs_tenant_id", "tenant_id"),)
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tenant_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("tenants.id"), nullable=False)
+    extension: Mapped[str] = mapped_column(String(16), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+def _release(target, sha256: str | None) -> None:
+    # Only what the ORM deletes or moves is seen here; the reconcile script
+    # finds blobs released any other way
+    if sha256:
+        object_session(target).info.setdefault(RELEASED_BLOBS_KEY, set()).add(sha256)
+
+
+def _release_deleted_reference(mapper, connection, target) -> None:
+    # before_delete: the row (and an expired blob_sha256) can still be loaded
+    _release(target, target.blob_sha256)
+
+
+def _release_moved_reference(mapper, connection, target) -> None:
+    for sha256 in inspect(target).attrs.blob_sha256.history.deleted:
+        _release(target, sha256)
+
+
+for _model in EVIDENCE_FILE_MODELS:
+    event.listen(_model, "before_delete", _release_deleted_reference)
+    event.listen(_model, "after_update", _release_moved_reference)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, String, Text, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import BaseModel, TimestampMixin
@@ -16,6 +16,7 @@ class FormDraft(BaseModel, TimestampMixin):
             "draft_key",
             name="uq_form_drafts_tenant_user_key",
         ),
+        Index("ix_form_drafts_user_id", "user_id"),
     )
 
     tenant_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,14 +1,19 @@
 import uuid
-from sqlalchemy import String, Text, ForeignKey, Integer
+from sqlalchemy import (
+    DDL, FetchedValue, String, Text, ForeignKey, Integer, Index, event, or_, select, update,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.models.base import BaseModel, TimestampMixin
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
+from app.models.base import BaseModel, SearchableMixin, TimestampMixin, search_vector_column
 
 
 class Framework(BaseModel, TimestampMixin):
     """Compliance framework model (e.g., ISO 27001, SOC 2)."""
 
     __tablename__ = "frameworks"
+    __table_args__ = (
+        Index("ix_frameworks_tenant_id", "tenant_id"),
+    )
 
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tenants.id"), nullable=False
@@ -16,6 +21,12 @@ class Framework(BaseModel, TimestampMixin):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     version: Mapped[str] = mapped_column(String(50), nullable=True)
+    # Bumped whenever the framework, its sections or controls change through
+    # the ORM, so cached catalogs (app.services.framework_catalog) can tell
+    # they are stale
+    catalog_revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Relationships
     sections: Mapped[list["FrameworkSection"]] = relationship(
@@ -27,6 +38,10 @@ class FrameworkSection(BaseModel, TimestampMixin):
     """Section/domain within a framework (e.g., Access Control)."""
 
     __tablename__ = "framework_sections"
+    __table_args__ = (
+        Index("ix_framework_sections_framework_id_order", "framework_id", "order"),
+        Index("ix_framework_sections_parent_section_id", "parent_section_id"),
+    )
 
     framework_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("frameworks.id"), nullable=False
@@ -45,10 +60,14 @@ class FrameworkSection(BaseModel, TimestampMixin):
     )
 
 
-class FrameworkControl(BaseModel, TimestampMixin):
+class FrameworkControl(BaseModel, SearchableMixin):
     """Individual control within a framework section."""
 
     __tablename__ = "framework_controls"
+    __table_args__ = (
+        Index("ix_framework_controls_framework_section_id", "framework_section_id"),
+        Index("ix_framework_controls_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     framework_section_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("framework_sections.id"), nullable=False
@@ -62,15 +81,93 @@ class FrameworkControl(BaseModel, TimestampMixin):
     check_points_text: Mapped[str] = mapped_column(Text, nullable=True)
     workflow_definition: Mapped[dict] = mapped_column(JSONB, nullable=True)
     assessment_checklist: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    # Content hash of the snapshot fields, set by a trigger on every insert and
+    # update however the row is written (see SNAPSHOT_HASH_TRIGGER)
+    snapshot_hash: Mapped[str] = mapped_column(
+        String(64), nullable=False, server_default=FetchedValue(), server_onupdate=FetchedValue()
+    )
+    search_vector = search_vector_column(
+        ("control_id", "A"),
+        ("name", "A"),
+        ("description", "B"),
+        ("requirements_text", "B"),
+        ("implementation_guidance", "C"),
+        ("testing_procedures_text", "C"),
+        ("check_points_text", "C"),
+    )
 
     # Relationships
     section: Mapped["FrameworkSection"] = relationship(back_populates="controls")
 
 
+# FrameworkControl fields copied into a session's control snapshot, in hash order
+SNAPSHOT_FIELDS = (
+    "description",
+    "requirements_text",
+    "testing_procedures_text",
+    "check_points_text",
+    "assessment_checklist",
+)
+
+
+# Keeps snapshot_hash current for ORM and Core writes, migrations and manual
+# SQL alike. The hash is taken over the jsonb text form of the fields, which
+# PostgreSQL renders canonically (object keys sorted, fixed spacing), so the
+# same content hashes the same whichever table it is read from. Those
+# functions are only STABLE, so this cannot be a generated column.
+SNAPSHOT_HASH_TRIGGER = DDL(
+    f"""
+    CREATE OR REPLACE FUNCTION framework_controls_snapshot_hash() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.snapshot_hash := encode(sha256(convert_to(CAST(jsonb_build_array(
+            {", ".join(f"NEW.{name}" for name in SNAPSHOT_FIELDS)}
+        ) AS TEXT), 'UTF8')), 'hex');
+        RETURN NEW;
+    END
+    $$;
+    CREATE TRIGGER framework_controls_snapshot_hash
+        BEFORE INSERT OR UPDATE ON framework_controls
+        FOR EACH ROW EXECUTE FUNCTION framework_controls_snapshot_hash();
+    """
+)
+event.listen(FrameworkControl.__table__, "after_create", SNAPSHOT_HASH_TRIGGER)
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_catalog_revisions(session: Session, flush_context) -> None:
+    """Bump catalog_revision of every framework whose tree this flush changed."""
+    framework_ids: set[uuid.UUID] = set()
+    section_ids: set[uuid.UUID] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Framework):
+            if obj in session.dirty and session.is_modified(obj):
+                framework_ids.add(obj.id)
+        elif isinstance(obj, FrameworkSection):
+            framework_ids.add(obj.framework_id)
+        elif isinstance(obj, FrameworkControl):
+            section_ids.add(obj.framework_section_id)
+    if not framework_ids and not section_ids:
+        return
+    session.connection().execute(
+        update(Framework)
+        .where(or_(
+            Framework.id.in_(framework_ids),
+            Framework.id.in_(
+                select(FrameworkSection.framework_id).where(FrameworkSection.id.in_(section_ids))
+            ),
+        ))
+        .values(catalog_revision=Framework.catalog_revision + 1)
+    )
+
+
 class ChecklistItem(BaseModel, TimestampMixin):
     """Checklist item associated with a control."""
 
     __tablename__ = "checklist_items"
+    __table_args__ = (
+        Index("ix_checklist_items_framework_control_id", "framework_control_id"),
+    )
 
     framework_control_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("framework_controls.id"), nullable=False
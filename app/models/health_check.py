@@ -1,11 +1,14 @@
 """Models for PCI DSS Health Check audits and related structures."""
 
 import uuid
+from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Text, Enum as SQLEnum, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import (
+    DateTime, String, Text, Enum as SQLEnum, ForeignKey, Integer, UniqueConstraint, Index, func,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, SearchableMixin, TimestampMixin, search_vector_column
 from sqlalchemy.dialects.postgresql import JSONB
 
 if TYPE_CHECKING:
@@ -31,6 +34,9 @@ class ReviewScopeType(BaseModel, TimestampMixin):
     """
 
     __tablename__ = "review_scope_types"
+    __table_args__ = (
+        Index("ix_review_scope_types_framework_id_sort_order", "framework_id", "sort_order"),
+    )
 
     framework_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("frameworks.id"), nullable=False
@@ -69,6 +75,7 @@ class ControlToReviewScopeMapping(BaseModel, TimestampMixin):
             "framework_control_id",
             name="uq_review_scope_mapping",
         ),
+        Index("ix_control_to_review_scope_mappings_control_id", "framework_control_id"),
     )
 
     # Relationships
@@ -85,6 +92,10 @@ class ReviewScope(BaseModel, TimestampMixin):
     """
 
     __tablename__ = "review_scopes"
+    __table_args__ = (
+        Index("ix_review_scopes_project_id_sort_order", "project_id", "sort_order"),
+        Index("ix_review_scopes_review_scope_type_id", "review_scope_type_id"),
+    )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id"), nullable=False
@@ -113,6 +124,10 @@ class AuditSession(BaseModel, TimestampMixin):
     """
 
     __tablename__ = "audit_sessions"
+    __table_args__ = (
+        Index("ix_audit_sessions_review_scope_id", "review_scope_id"),
+        Index("ix_audit_sessions_project_id", "project_id"),
+    )
 
     review_scope_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("review_scopes.id"), nullable=False
@@ -132,14 +147,46 @@ class AuditSession(BaseModel, TimestampMixin):
     )
 
 
-class SessionControlInstance(BaseModel, TimestampMixin):
+class ControlSnapshot(BaseModel):
+    """Control text captured when a session is seeded, shared by identical copies.
+
+    Rows are keyed by a hash of their content and never updated, so every
+    instance seeded from the same control text points at one row and keeps
+    that text after the framework control is edited.
+    """
+
+    __tablename__ = "control_snapshots"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    requirements_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    testing_procedures_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    check_points_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    assessment_checklist: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class SessionControlInstance(BaseModel):
     """Snapshot of a control in an audit session.
 
-    Captures the control's state at session creation time, plus assessment status.
+    Captures the control's state at session creation time. The mutable
+    assessment (status, notes, assessor, reviewer) lives in the narrow
+    ``SessionControlAssessment`` row, exposed here under the same names.
     """
 
     __tablename__ = "session_control_instances"
+    __table_args__ = (
+        Index("ix_session_control_instances_audit_session_id", "audit_session_id"),
+        Index("ix_session_control_instances_framework_control_id", "framework_control_id"),
+        Index("ix_session_control_instances_control_snapshot_hash", "control_snapshot_hash"),
+    )
 
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
     audit_session_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("audit_sessions.id"), nullable=False
     )
@@ -148,11 +195,111 @@ class SessionControlInstance(BaseModel, TimestampMixin):
     )
     control_id_snapshot: Mapped[str] = mapped_column(String(50), nullable=False)
     control_title_snapshot: Mapped[str] = mapped_column(String(255), nullable=False)
-    control_description_snapshot: Mapped[str] = mapped_column(Text, nullable=True)
-    requirements_text_snapshot: Mapped[str] = mapped_column(Text, nullable=True)
-    testing_procedures_text_snapshot: Mapped[str] = mapped_column(Text, nullable=True)
-    check_points_text_snapshot: Mapped[str] = mapped_column(Text, nullable=True)
-    assessment_checklist_snapshot: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    control_snapshot_hash: Mapped[str] = mapped_column(
+        ForeignKey("control_snapshots.content_hash"), nullable=False
+    )
+
+    # Relationships
+    audit_session: Mapped["AuditSession"] = relationship(back_populates="control_instances")
+    framework_control: Mapped["FrameworkControl"] = relationship()
+    assessment: Mapped["SessionControlAssessment"] = relationship(
+        back_populates="control_instance",
+        lazy="joined",
+        innerjoin=True,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    evidence_files: Mapped[list["ControlInstanceEvidenceFile"]] = relationship(
+        back_populates="control_instance", cascade="all, delete-orphan"
+    )
+    observations: Mapped[list["SessionControlObservation"]] = relationship(
+        back_populates="control_instance", cascade="all, delete-orphan"
+    )
+    snapshot: Mapped["ControlSnapshot"] = relationship()
+
+    # Assessment state lives in the session_control_assessments row
+    @property
+    def status(self) -> ControlInstanceStatus:
+        return self.assessment.status
+
+    @status.setter
+    def status(self, value: ControlInstanceStatus) -> None:
+        self.assessment.status = value
+
+    @property
+    def notes(self) -> str | None:
+        return self.assessment.notes
+
+    @notes.setter
+    def notes(self, value: str | None) -> None:
+        self.assessment.notes = value
+
+    @property
+    def assessed_by_id(self) -> uuid.UUID | None:
+        return self.assessment.assessed_by_id
+
+    @assessed_by_id.setter
+    def assessed_by_id(self, value: uuid.UUID | None) -> None:
+        self.assessment.assessed_by_id = value
+
+    @property
+    def reviewed_by_id(self) -> uuid.UUID | None:
+        return self.assessment.reviewed_by_id
+
+    @reviewed_by_id.setter
+    def reviewed_by_id(self, value: uuid.UUID | None) -> None:
+        self.assessment.reviewed_by_id = value
+
+    @property
+    def updated_at(self) -> datetime:
+        return self.assessment.updated_at
+
+    # Snapshot text lives in the shared control_snapshots row
+    @property
+    def control_description_snapshot(self) -> str | None:
+        return self.snapshot.description
+
+    @property
+    def requirements_text_snapshot(self) -> str | None:
+        return self.snapshot.requirements_text
+
+    @property
+    def testing_procedures_text_snapshot(self) -> str | None:
+        return self.snapshot.testing_procedures_text
+
+    @property
+    def check_points_text_snapshot(self) -> str | None:
+        return self.snapshot.check_points_text
+
+    @property
+    def assessment_checklist_snapshot(self) -> dict | None:
+        return self.snapshot.assessment_checklist
+
+
+class SessionControlAssessment(BaseModel):
+    """Mutable assessment state of one session control instance.
+
+    Split from the instance's snapshot columns so status saves rewrite a narrow
+    row and per-session status counts read only this table.
+    """
+
+    __tablename__ = "session_control_assessments"
+    __table_args__ = (
+        Index(
+            "ix_session_control_assessments_audit_session_id_status", "audit_session_id", "status"
+        ),
+        Index("ix_session_control_assessments_assessed_by_id", "assessed_by_id"),
+        Index("ix_session_control_assessments_reviewed_by_id", "reviewed_by_id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    session_control_instance_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("session_control_instances.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Copied from the instance so status counts need no join
+    audit_session_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("audit_sessions.id"), nullable=False
+    )
     status: Mapped[ControlInstanceStatus] = mapped_column(
         SQLEnum(ControlInstanceStatus, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
@@ -165,28 +312,100 @@ class SessionControlInstance(BaseModel, TimestampMixin):
     reviewed_by_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("users.id"), nullable=True
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
     # Relationships
-    audit_session: Mapped["AuditSession"] = relationship(back_populates="control_instances")
-    framework_control: Mapped["FrameworkControl"] = relationship()
+    control_instance: Mapped["SessionControlInstance"] = relationship(
+        back_populates="assessment"
+    )
     assessed_by: Mapped["User | None"] = relationship(
         "User", foreign_keys=[assessed_by_id]
     )
     reviewed_by: Mapped["User | None"] = relationship(
         "User", foreign_keys=[reviewed_by_id]
     )
-    evidence_files: Mapped[list["ControlInstanceEvidenceFile"]] = relationship(
-        back_populates="control_instance", cascade="all, delete-orphan"
+
+
+# Column per status in the status count tables, in ControlInstanceStatus order
+STATUS_COUNT_COLUMNS = [f"{status.value}_count" for status in ControlInstanceStatus]
+
+
+class StatusCountsMixin:
+    """One control instance count per ``ControlInstanceStatus``."""
+
+    not_started_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
     )
-    observations: Mapped[list["SessionControlObservation"]] = relationship(
-        back_populates="control_instance", cascade="all, delete-orphan"
+    draft_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    pass_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    fail_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    na_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    @classmethod
+    def count_column(cls, status: ControlInstanceStatus):
+        """The column counting instances in ``status``."""
+        return getattr(cls, f"{ControlInstanceStatus(status).value}_count")
+
+    def counts(self) -> dict[str, int]:
+        """``{status value: count}`` with every status present."""
+        return {
+            status.value: getattr(self, name)
+            for status, name in zip(ControlInstanceStatus, STATUS_COUNT_COLUMNS)
+        }
+
+
+class AuditSessionStatusCounts(StatusCountsMixin, BaseModel):
+    """Control instance counts per status for one audit session.
+
+    Kept in step with ``session_control_assessments`` by the repository in
+    the same transaction as every seed, status change and delete, so progress
+    is read from one row instead of counted from the session's instances.
+    """
+
+    __tablename__ = "audit_session_status_counts"
+    __table_args__ = (
+        Index("ix_audit_session_status_counts_review_scope_id", "review_scope_id"),
+    )
+
+    audit_session_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("audit_sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+    review_scope_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("review_scopes.id", ondelete="CASCADE"), nullable=False
+    )
+
+
+class ReviewScopeStatusCounts(StatusCountsMixin, BaseModel):
+    """Control instance counts per status summed over a review scope's sessions."""
+
+    __tablename__ = "review_scope_status_counts"
+    __table_args__ = (
+        Index("ix_review_scope_status_counts_project_id", "project_id"),
+    )
+
+    review_scope_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("review_scopes.id", ondelete="CASCADE"), primary_key=True
+    )
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id"), nullable=False
     )
 
 
-class ControlInstanceEvidenceFile(BaseModel, TimestampMixin):
+class ControlInstanceEvidenceFile(BaseModel, SearchableMixin):
     """Evidence (text note or file) attached to a control instance."""
 
     __tablename__ = "control_instance_evidence_files"
+    __table_args__ = (
+        Index("ix_control_instance_evidence_files_instance_id", "session_control_instance_id"),
+        Index("ix_control_instance_evidence_files_blob_sha256", "blob_sha256"),
+        Index(
+            "ix_control_instance_evidence_files_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
 
     session_control_instance_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("session_control_instances.id"), nullable=False
@@ -198,6 +417,10 @@ class ControlInstanceEvidenceFile(BaseModel, TimestampMixin):
     filename: Mapped[str] = mapped_column(String(255), nullable=True)  # For file
     file_path: Mapped[str] = mapped_column(String(512), nullable=True)  # For file
     file_size: Mapped[int] = mapped_column(Integer, nullable=True)  # For file
+    blob_sha256: Mapped[str | None] = mapped_column(
+        ForeignKey("evidence_blobs.sha256"), nullable=True
+    )  # For file; None for files stored before the blob store
+    search_vector = search_vector_column(("content", "A"))
 
     # Relationships
     control_instance: Mapped["SessionControlInstance"] = relationship(
@@ -205,16 +428,25 @@ class ControlInstanceEvidenceFile(BaseModel, TimestampMixin):
     )
 
 
-class SessionControlObservation(BaseModel, TimestampMixin):
+class SessionControlObservation(BaseModel, SearchableMixin):
     """Observation (finding) documented during control assessment."""
 
     __tablename__ = "session_control_observations"
+    __table_args__ = (
+        Index("ix_session_control_observations_instance_id", "session_control_instance_id"),
+        Index(
+            "ix_session_control_observations_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
 
     session_control_instance_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("session_control_instances.id"), nullable=False
     )
     observation_text: Mapped[str] = mapped_column(Text, nullable=False)
     recommendation_text: Mapped[str] = mapped_column(Text, nullable=True)
+    search_vector = search_vector_column(("observation_text", "A"), ("recommendation_text", "B"))
 
     # Relationships
     control_instance: Mapped["SessionControlInstance"] = relationship(
@@ -225,10 +457,22 @@ class SessionControlObservation(BaseModel, TimestampMixin):
     )
 
 
-class SessionControlObservationEvidence(BaseModel, TimestampMixin):
+class SessionControlObservationEvidence(BaseModel, SearchableMixin):
     """Evidence (text note or file) attached to an observation."""
 
     __tablename__ = "session_control_observation_evidence"
+    __table_args__ = (
+        Index(
+            "ix_session_control_observation_evidence_observation_id",
+            "session_control_observation_id",
+        ),
+        Index("ix_session_control_observation_evidence_blob_sha256", "blob_sha256"),
+        Index(
+            "ix_session_control_observation_evidence_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
 
     session_control_observation_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("session_control_observations.id"), nullable=False
@@ -240,6 +484,10 @@ class SessionControlObservationEvidence(BaseModel, TimestampMixin):
     filename: Mapped[str] = mapped_column(String(255), nullable=True)  # For image
     file_path: Mapped[str] = mapped_column(String(512), nullable=True)  # For image
     file_size: Mapped[int] = mapped_column(Integer, nullable=True)  # For image
+    blob_sha256: Mapped[str | None] = mapped_column(
+        ForeignKey("evidence_blobs.sha256"), nullable=True
+    )  # For image; None for images stored before the blob store
+    search_vector = search_vector_column(("content", "A"))
 
     # Relationships
     observation: Mapped["SessionControlObservation"] = relationship(
@@ -1,9 +1,18 @@
 import uuid
 from enum import Enum
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Text, Enum as SQLEnum, ForeignKey, Integer
+from sqlalchemy import (
+    String,
+    Text,
+    Enum as SQLEnum,
+    ForeignKey,
+    Integer,
+    Index,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, SearchableMixin, TimestampMixin, search_vector_column
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -39,6 +48,27 @@ class Project(BaseModel, TimestampMixin):
     """Assessment/audit project model."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_tenant_id_parent_project_id", "tenant_id", "parent_project_id"),
+        Index("ix_projects_parent_project_id", "parent_project_id"),
+        Index("ix_projects_client_id", "client_id"),
+        Index("ix_projects_framework_id", "framework_id"),
+        Index("ix_projects_owner_id", "owner_id"),
+        # Projects list sort keys (see ProjectRepository.LIST_SORTS); the list
+        # only shows top-level projects
+        Index(
+            "ix_projects_list_recent", "tenant_id", "updated_at", "id",
+            postgresql_where=text("parent_project_id IS NULL"),
+        ),
+        Index(
+            "ix_projects_list_name", "tenant_id", "name", "id",
+            postgresql_where=text("parent_project_id IS NULL"),
+        ),
+        Index(
+            "ix_projects_list_status", "tenant_id", "status", "name", "id",
+            postgresql_where=text("parent_project_id IS NULL"),
+        ),
+    )
 
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tenants.id"), nullable=False
@@ -103,6 +133,10 @@ class ProjectMember(BaseModel, TimestampMixin):
     """Team member assignment to a project."""
 
     __tablename__ = "project_members"
+    __table_args__ = (
+        Index("ix_project_members_project_id_user_id", "project_id", "user_id"),
+        Index("ix_project_members_user_id_project_id", "user_id", "project_id"),
+    )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id"), nullable=False
@@ -117,10 +151,21 @@ class ProjectMember(BaseModel, TimestampMixin):
     user: Mapped["User"] = relationship("User", foreign_keys=[user_id])
 
 
-class ProjectResponse(BaseModel, TimestampMixin):
+class ProjectResponse(BaseModel, SearchableMixin):
     """Response to a framework control within a project."""
 
     __tablename__ = "project_responses"
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "framework_control_id", name="uq_project_responses_project_control"
+        ),
+        Index("ix_project_responses_framework_control_id", "framework_control_id"),
+        Index("ix_project_responses_assigned_to_id", "assigned_to_id"),
+        # Pending response counts per project, answered from the index alone
+        # (see ProjectRepository.dashboard_summary)
+        Index("ix_project_responses_project_id_status", "project_id", "status"),
+        Index("ix_project_responses_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id"), nullable=False
@@ -138,15 +183,25 @@ class ProjectResponse(BaseModel, TimestampMixin):
     assigned_to_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("users.id"), nullable=True
     )
+    search_vector = search_vector_column(
+        ("finding", "A"), ("recommendation", "B"), ("response_text", "C")
+    )
 
     # Relationships
     control: Mapped["FrameworkControl"] = relationship()
 
 
-class ProjectObservation(BaseModel, TimestampMixin):
+class ProjectObservation(BaseModel, SearchableMixin):
     """Observation with recommendation for a specific control in a project."""
 
     __tablename__ = "project_observations"
+    __table_args__ = (
+        Index(
+            "ix_project_observations_project_id_control_id", "project_id", "framework_control_id"
+        ),
+        Index("ix_project_observations_framework_control_id", "framework_control_id"),
+        Index("ix_project_observations_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("projects.id"), nullable=False
@@ -156,6 +211,7 @@ class ProjectObservation(BaseModel, TimestampMixin):
     )
     observation_text: Mapped[str] = mapped_column(Text, nullable=False)
     recommendation_text: Mapped[str] = mapped_column(Text, nullable=False)
+    search_vector = search_vector_column(("observation_text", "A"), ("recommendation_text", "B"))
 
     # Relationships
     evidence_files: Mapped[list["ProjectEvidenceFile"]] = relationship(
@@ -163,10 +219,15 @@ class ProjectObservation(BaseModel, TimestampMixin):
     )
 
 
-class ProjectEvidenceFile(BaseModel, TimestampMixin):
+class ProjectEvidenceFile(BaseModel, SearchableMixin):
     """Evidence file or text note attachment for an observation."""
 
     __tablename__ = "project_evidence_files"
+    __table_args__ = (
+        Index("ix_project_evidence_files_project_observation_id", "project_observation_id"),
+        Index("ix_project_evidence_files_blob_sha256", "blob_sha256"),
+        Index("ix_project_evidence_files_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     project_observation_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("project_observations.id"), nullable=False
@@ -178,6 +239,10 @@ class ProjectEvidenceFile(BaseModel, TimestampMixin):
     filename: Mapped[str] = mapped_column(String(255), nullable=True)  # For images
     file_path: Mapped[str] = mapped_column(String(512), nullable=True)  # For images
     file_size: Mapped[int] = mapped_column(Integer, nullable=True)  # For images
+    blob_sha256: Mapped[str | None] = mapped_column(
+        ForeignKey("evidence_blobs.sha256"), nullable=True
+    )  # For images; None for images stored before the blob store
+    search_vector = search_vector_column(("content", "A"))
 
     # Relationships
     observation: Mapped["ProjectObservation"] = relationship(
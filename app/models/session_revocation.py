@@ -0,0 +1,34 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel, TimestampMixin
+
+
+class SessionRevocation(BaseModel, TimestampMixin):
+    """A revoked session token, or a cut-off for all of a user's tokens.
+
+    A ``principal`` row revokes nothing: it tells every worker to drop its
+    cached copy of a user whose name, role or active flag changed.
+    ``created_at`` is the revocation time; workers poll rows newer than the
+    last one they have seen.
+    """
+
+    __tablename__ = "session_revocations"
+    __table_args__ = (
+        Index("ix_session_revocations_created_at", "created_at"),
+        Index("ix_session_revocations_user_id", "user_id"),
+    )
+
+    kind: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )  # 'session', 'user' or 'principal'
+    subject: Mapped[str] = mapped_column(
+        String(64), nullable=False
+    )  # Session id for 'session', user id for 'user' and 'principal'
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -1,8 +1,8 @@
 import uuid
 from enum import Enum
-from sqlalchemy import String, Boolean, Enum as SQLEnum, ForeignKey
+from sqlalchemy import String, Boolean, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, trigram_indexes
 
 
 class UserRole(str, Enum):
@@ -23,6 +23,11 @@ class User(BaseModel, TimestampMixin):
     """User account model."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_tenant_id_full_name", "tenant_id", "full_name"),
+        # Auditor autocomplete (see UserRepository.search)
+        *trigram_indexes("users", "full_name", "email"),
+    )
 
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tenants.id"), nullable=False
@@ -2,7 +2,7 @@
 
 import uuid
 from enum import Enum
-from sqlalchemy import String, Text, Enum as SQLEnum, ForeignKey, UniqueConstraint
+from sqlalchemy import String, Text, Enum as SQLEnum, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel, TimestampMixin
@@ -24,6 +24,7 @@ class WorkflowExecution(BaseModel, TimestampMixin):
         UniqueConstraint(
             "project_id", "framework_control_id", name="uq_workflow_project_control"
         ),
+        Index("ix_workflow_executions_framework_control_id", "framework_control_id"),
     )
 
     project_id: Mapped[uuid.UUID] = mapped_column(
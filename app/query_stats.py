@@ -0,0 +1,101 @@
+"""Per-request database statement accounting.
+
+The engine hooks in ``app.database`` report every statement to the
+``QueryStats`` bound to the current request, which counts statements and DB
+time, flags SQL repeated often enough to look like an N+1 loop, and enforces
+the route's statement budget. The stats object lives in a context variable, so
+it follows the request into threadpool handlers and async-engine greenlets;
+statements run outside a request (startup, background tasks) are ignored.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar, Token
+
+from starlette.types import Scope
+
+from app.config import get_settings
+
+DB_LOGGER = logging.getLogger("auditpro.db")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in debug mode when a request runs more statements than its budget."""
+
+
+class QueryStats:
+    """Statement count, DB time and repeated SQL for one request."""
+
+    __slots__ = ("scope", "count", "duration_ms", "repeats", "flagged", "over_budget", "_budget")
+
+    def __init__(self, scope: Scope | None = None):
+        self.scope = scope
+        self.count = 0
+        self.duration_ms = 0.0
+        self.repeats: dict[str, int] = {}
+        self.flagged: list[str] = []
+        self.over_budget = False
+        self._budget: int | None = None
+
+    @property
+    def route(self) -> str:
+        """Path template of the matched route, or the raw path before routing."""
+        if self.scope is None:
+            return "-"
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+    @property
+    def budget(self) -> int:
+        if self._budget is not None:
+            return self._budget
+        settings = get_settings()
+        budget = settings.db_query_budgets.get(self.route, settings.db_query_budget)
+        if self.scope is not None and "route" in self.scope:
+            self._budget = budget  # only cache once routing has resolved the template
+        return budget
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        settings = get_settings()
+        self.count += 1
+        self.duration_ms += duration_ms
+
+        seen = self.repeats.get(statement, 0) + 1
+        self.repeats[statement] = seen
+        if seen == settings.db_n_plus_one_threshold:
+            self.flagged.append(statement)
+            DB_LOGGER.warning(
+                "n_plus_one_suspected route=%s repeats=%d sql=%s",
+                self.route,
+                seen,
+                " ".join(statement.split()),
+            )
+
+        if not self.over_budget and self.count > self.budget:
+            self.over_budget = True
+            if settings.debug:
+                raise QueryBudgetExceeded(
+                    f"{self.route} ran more than {self.budget} statements; "
+                    "see db_query_budgets to raise the budget for this route"
+                )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar("auditpro_query_stats", default=None)
+
+
+def start_query_stats(scope: Scope | None = None) -> Token:
+    """Begin accounting for the current request."""
+    return _query_stats.set(QueryStats(scope))
+
+
+def stop_query_stats(token: Token) -> QueryStats | None:
+    """Finish accounting and return the request's stats."""
+    stats = _query_stats.get()
+    _query_stats.reset(token)
+    return stats
+
+
+def current_query_stats() -> QueryStats | None:
+    """Stats for the current request, or None outside a request."""
+    return _query_stats.get()
@@ -1,22 +1,33 @@
 """Repository pattern for multi-tenant data access."""
 
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 from app.repositories.client import ClientRepository
+from app.repositories.evidence_blob import EvidenceBlobRepository
 from app.repositories.form_draft import FormDraftRepository
 from app.repositories.framework import FrameworkRepository
-from app.repositories.project import ProjectRepository
-from app.repositories.response import ProjectResponseRepository
+from app.repositories.project import AsyncProjectRepository, ProjectRepository
+from app.repositories.response import (
+    AsyncProjectResponseRepository,
+    ProjectResponseRepository,
+)
+from app.repositories.session_revocation import SessionRevocationRepository
 from app.repositories.workflow import WorkflowExecutionRepository
 from app.repositories.user import UserRepository
-from app.repositories.health_check import HealthCheckRepository
+from app.repositories.health_check import AsyncHealthCheckRepository, HealthCheckRepository
 
 __all__ = [
+    "AsyncBaseRepository",
+    "AsyncHealthCheckRepository",
+    "AsyncProjectRepository",
+    "AsyncProjectResponseRepository",
     "BaseRepository",
     "ClientRepository",
+    "EvidenceBlobRepository",
     "FormDraftRepository",
     "FrameworkRepository",
     "ProjectRepository",
     "ProjectResponseRepository",
+    "SessionRevocationRepository",
     "WorkflowExecutionRepository",
     "UserRepository",
     "HealthCheckRepository",
@@ -2,12 +2,49 @@
 
 from typing import Generic, TypeVar, List
 from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, literal_column, select
+
+from app.database import in_unit_of_work
 
 T = TypeVar("T")
 
 
+def commit_or_flush(db: Session, instance=None, attribute_names: list[str] | None = None) -> None:
+    """Commit and reload ``instance``, or only flush inside a unit of work.
+
+    A flush leaves the transaction to the enclosing ``unit_of_work`` block and
+    needs no reload: generated columns come back on ``INSERT/UPDATE ... RETURNING``
+    and nothing is expired.
+    """
+    if in_unit_of_work(db):
+        db.flush()
+        return
+    db.commit()
+    if instance is not None:
+        db.refresh(instance, attribute_names)
+
+
+# Shortest query that has trigrams for a gin_trgm_ops index to look up
+TRIGRAM_MIN_LENGTH = 3
+
+
+def autocomplete_sort_key(column, query: str):
+    """``column`` as the ORDER BY of a LIMITed ``ILIKE '%query%'`` lookup.
+
+    Short queries match most rows, so walking an index on ``column`` until the
+    LIMIT is reached is fastest. From ``TRIGRAM_MIN_LENGTH`` on, the matches
+    can be few and clustered in ``column`` order (every "Meridian ..." client
+    sorts together), and a walk would read past everything before them; sorting
+    on ``column || ''`` instead, which no index provides, has the planner fetch
+    the matches through the trigram indexes and sort just those.
+    """
+    if len(query) < TRIGRAM_MIN_LENGTH:
+        return column
+    return column.concat(literal_column("''"))
+
+
 class BaseRepository(Generic[T]):
     """Base repository with tenant-scoped CRUD operations."""
 
@@ -37,8 +74,7 @@ class BaseRepository(Generic[T]):
         """Create a new record (caller must include tenant_id)."""
         instance = self.model(**kwargs)
         self.db.add(instance)
-        self.db.commit()
-        self.db.refresh(instance)
+        self._commit(instance)
         return instance
 
     def update(self, tenant_id: UUID, id: UUID, **kwargs) -> T | None:
@@ -54,8 +90,7 @@ class BaseRepository(Generic[T]):
             if hasattr(instance, key):
                 setattr(instance, key, value)
 
-        self.db.commit()
-        self.db.refresh(instance)
+        self._commit(instance)
         return instance
 
     def delete(self, tenant_id: UUID, id: UUID) -> bool:
@@ -68,5 +103,70 @@ class BaseRepository(Generic[T]):
             return False
 
         self.db.delete(instance)
-        self.db.commit()
+        self._commit()
+        return True
+
+    def _commit(self, instance=None, attribute_names: list[str] | None = None) -> None:
+        """Commit this repository's writes unless a unit of work owns the transaction."""
+        commit_or_flush(self.db, instance, attribute_names)
+
+
+class AsyncBaseRepository(Generic[T]):
+    """Async counterpart of BaseRepository for handlers using ``get_async_db``."""
+
+    model: type[T] = None
+
+    def __init__(self, db: AsyncSession):
+        """Initialize repository with an async database session."""
+        self.db = db
+
+    async def get_all(self, tenant_id: UUID) -> List[T]:
+        """Get all records for a tenant."""
+        if not hasattr(self.model, "tenant_id"):
+            raise NotImplementedError(f"{self.model.__name__} does not support tenant_id")
+        result = await self.db.scalars(
+            select(self.model).where(self.model.tenant_id == tenant_id)
+        )
+        return list(result)
+
+    async def get_by_id(self, tenant_id: UUID, id: UUID) -> T | None:
+        """Get a single record by ID for a tenant."""
+        if not hasattr(self.model, "tenant_id"):
+            raise NotImplementedError(f"{self.model.__name__} does not support tenant_id")
+        return await self.db.scalar(
+            select(self.model).where(
+                and_(self.model.id == id, self.model.tenant_id == tenant_id)
+            )
+        )
+
+    async def create(self, **kwargs) -> T:
+        """Create a new record (caller must include tenant_id)."""
+        instance = self.model(**kwargs)
+        self.db.add(instance)
+        await self.db.commit()
+        await self.db.refresh(instance)
+        return instance
+
+    async def update(self, tenant_id: UUID, id: UUID, **kwargs) -> T | None:
+        """Update a record by ID for a tenant."""
+        instance = await self.get_by_id(tenant_id, id)
+        if not instance:
+            return None
+
+        for key, value in kwargs.items():
+            if hasattr(instance, key):
+                setattr(instance, key, value)
+
+        await self.db.commit()
+        await self.db.refresh(instance)
+        return instance
+
+    async def delete(self, tenant_id: UUID, id: UUID) -> bool:
+        """Delete a record by ID for a tenant."""
+        instance = await self.get_by_id(tenant_id, id)
+        if not instance:
+            return False
+
+        await self.db.delete(instance)
+        await self.db.commit()
         return True
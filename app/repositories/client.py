@@ -3,9 +3,20 @@
 from typing import List
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
 from app.models.client import Client
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, autocomplete_sort_key
+from app.repositories.pagination import Page, SortKey, paginate
+from app.repositories.read_models import ClientListRow, ClientSearchRow
+from app.services.autocomplete_cache import autocomplete_cache, contains_pattern, normalize_query
+
+
+def _client_matches(row: ClientSearchRow, query: str) -> bool:
+    """Whether a cached row matches a normalized query, as ``search`` filters."""
+    return any(
+        value and query in value.lower()
+        for value in (row.name, row.industry, row.contact_name, row.contact_email)
+    )
 
 
 class ClientRepository(BaseRepository[Client]):
@@ -13,40 +24,87 @@ class ClientRepository(BaseRepository[Client]):
 
     model = Client
 
+    LIST_SORT = SortKey("name", (Client.name, Client.id))
+
+    # Clients offered by the project form's autocomplete
+    SEARCH_LIMIT = 10
+
     def __init__(self, db: Session):
         """Initialize client repository."""
         super().__init__(db)
 
-    def search(self, tenant_id: UUID, query: str) -> List[Client]:
-        """Search clients by name, industry, or contact info."""
-        if not query or not query.strip():
-            return self.get_all(tenant_id)
+    def search(self, tenant_id: UUID, query: str) -> List[ClientSearchRow]:
+        """Search clients by name, industry, or contact info (for autocomplete).
+
+        Matches use the trigram indexes on those columns; results are cached
+        per tenant and normalized query (see ``autocomplete_cache``).
+        """
+        query = normalize_query(query)
+        if not query:
+            return []
+        cached = autocomplete_cache.get("clients", tenant_id, query, _client_matches)
+        if cached is not None:
+            return cached
 
-        search_term = f"%{query.lower()}%"
-        return self.db.query(Client).filter(
-            and_(
+        pattern = contains_pattern(query)
+        rows = self.db.execute(
+            select(
+                Client.id,
+                Client.name,
+                Client.industry,
+                Client.contact_name,
+                Client.contact_email,
+            )
+            .where(
                 Client.tenant_id == tenant_id,
                 or_(
-                    Client.name.ilike(search_term),
-                    Client.industry.ilike(search_term),
-                    Client.contact_name.ilike(search_term),
-                    Client.contact_email.ilike(search_term),
+                    Client.name.ilike(pattern, escape="\\"),
+                    Client.industry.ilike(pattern, escape="\\"),
+                    Client.contact_name.ilike(pattern, escape="\\"),
+                    Client.contact_email.ilike(pattern, escape="\\"),
                 ),
             )
+            .order_by(autocomplete_sort_key(Client.name, query), Client.id)
+            .limit(self.SEARCH_LIMIT + 1)
         ).all()
+        results = [ClientSearchRow(*row) for row in rows[: self.SEARCH_LIMIT]]
+        autocomplete_cache.put(
+            "clients", tenant_id, query, results, complete=len(rows) <= self.SEARCH_LIMIT
+        )
+        return results
 
-    def filter_clients(
-        self, tenant_id: UUID, industry: str | None = None, search: str | None = None
-    ) -> List[Client]:
-        """Filter clients by optional industry and search term."""
-        query = self.db.query(Client).filter(Client.tenant_id == tenant_id)
+    def create(self, **kwargs) -> Client:
+        """Create a client and drop the tenant's cached autocomplete results."""
+        client = super().create(**kwargs)
+        autocomplete_cache.invalidate_tenant("clients", client.tenant_id)
+        return client
+
+    def update(self, tenant_id: UUID, id: UUID, **kwargs) -> Client | None:
+        """Update a client and drop the tenant's cached autocomplete results."""
+        client = super().update(tenant_id, id, **kwargs)
+        if client:
+            autocomplete_cache.invalidate_tenant("clients", tenant_id)
+        return client
+
+    def delete(self, tenant_id: UUID, id: UUID) -> bool:
+        """Delete a client and drop the tenant's cached autocomplete results."""
+        deleted = super().delete(tenant_id, id)
+        if deleted:
+            autocomplete_cache.invalidate_tenant("clients", tenant_id)
+        return deleted
+
+    def _list_filters(
+        self, tenant_id: UUID, industry: str | None, search: str | None
+    ) -> list:
+        """WHERE clauses shared by ``filter_clients`` and ``list_client_rows``."""
+        filters = [Client.tenant_id == tenant_id]
 
         if industry and industry.strip():
-            query = query.filter(Client.industry.ilike(industry))
+            filters.append(Client.industry.ilike(industry))
 
         if search and search.strip():
             search_term = f"%{search.lower()}%"
-            query = query.filter(
+            filters.append(
                 or_(
                     Client.name.ilike(search_term),
                     Client.contact_name.ilike(search_term),
@@ -54,7 +112,38 @@ class ClientRepository(BaseRepository[Client]):
                 )
             )
 
-        return query.all()
+        return filters
+
+    def filter_clients(
+        self, tenant_id: UUID, industry: str | None = None, search: str | None = None
+    ) -> List[Client]:
+        """Filter clients by optional industry and search term."""
+        filters = self._list_filters(tenant_id, industry, search)
+        return self.db.query(Client).filter(*filters).all()
+
+    def list_client_rows(
+        self,
+        tenant_id: UUID,
+        industry: str | None = None,
+        search: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> Page[ClientListRow]:
+        """A page of ``filter_clients`` by name, as list rows.
+
+        Only the columns the clients table shows are loaded.
+
+        Raises ``InvalidCursor`` for a cursor not issued for this list.
+        """
+        filters = self._list_filters(tenant_id, industry, search)
+        query = select(
+            Client.id,
+            Client.name,
+            Client.industry,
+            Client.contact_name,
+            Client.contact_email,
+        ).where(*filters)
+        return paginate(self.db, query, self.LIST_SORT, ClientListRow, cursor, limit)
 
     def get_distinct_industries(self, tenant_id: UUID) -> List[str]:
         """Get distinct industries for a tenant, ordered alphabetically."""
@@ -0,0 +1,98 @@
+"""Repository for content-addressed evidence blobs."""
+
+import uuid
+from typing import List
+
+from sqlalchemy import delete, exists, func, not_, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.evidence import EVIDENCE_FILE_MODELS, EvidenceBlob
+from app.repositories.base import commit_or_flush
+
+
+def _lock_key(sha256: str) -> int:
+    """Advisory lock key for a blob: the first 64 bits of its hash, signed."""
+    return int.from_bytes(bytes.fromhex(sha256[:16]), "big", signed=True)
+
+
+def _unreferenced():
+    """Blob rows no evidence row points at (each table's blob_sha256 index answers it)."""
+    return not_(
+        or_(
+            *(
+                exists().where(model.blob_sha256 == EvidenceBlob.sha256)
+                for model in EVIDENCE_FILE_MODELS
+            )
+        )
+    )
+
+
+class EvidenceBlobRepository:
+    """Record evidence blobs and find the ones no evidence row points at.
+
+    References are read from the evidence tables at the time of asking, so
+    rows removed outside the ORM (a cascade, a bulk delete, manual SQL) are
+    accounted for.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def lock(self, sha256: str) -> None:
+        """Serialize work on one blob until the transaction ends.
+
+        Storing and removing the same blob take this lock, so a file is never
+        unlinked between an upload finding it on disk and its reference
+        being committed.
+        """
+        self.db.execute(select(func.pg_advisory_xact_lock(_lock_key(sha256))))
+
+    def add(self, tenant_id: uuid.UUID, sha256: str, extension: str, size: int) -> str:
+        """Create the blob row if it is not there yet.
+
+        Returns the blob's stored extension: that of the first upload of these
+        bytes, which names the file on disk even if this one was sent as
+        ``.jpeg`` rather than ``.jpg``.
+        """
+        self.db.execute(
+            insert(EvidenceBlob)
+            .values(sha256=sha256, tenant_id=tenant_id, extension=extension, size=size)
+            .on_conflict_do_nothing(index_elements=["sha256"])
+        )
+        stored_extension = self.db.scalar(
+            select(EvidenceBlob.extension).where(EvidenceBlob.sha256 == sha256)
+        )
+        commit_or_flush(self.db)
+        return stored_extension
+
+    def get_for_tenant(self, tenant_id: uuid.UUID, sha256: str) -> EvidenceBlob | None:
+        """A blob, if it belongs to the tenant."""
+        return self.db.scalar(
+            select(EvidenceBlob).where(
+                EvidenceBlob.sha256 == sha256, EvidenceBlob.tenant_id == tenant_id
+            )
+        )
+
+    def exists(self, sha256: str) -> bool:
+        """Whether a blob row exists (committed, or written in this transaction)."""
+        found = self.db.scalar(select(EvidenceBlob.sha256).where(EvidenceBlob.sha256 == sha256))
+        return found is not None
+
+    def remove_unreferenced(self, sha256: str) -> EvidenceBlob | None:
+        """Delete the blob row if nothing references it; return the removed blob."""
+        blob = self.db.scalars(
+            delete(EvidenceBlob)
+            .where(EvidenceBlob.sha256 == sha256, _unreferenced())
+            .returning(EvidenceBlob)
+        ).one_or_none()
+        commit_or_flush(self.db)
+        return blob
+
+    def list_unreferenced(self) -> List[EvidenceBlob]:
+        """Blobs no evidence row points at."""
+        return self.db.query(EvidenceBlob).filter(_unreferenced()).all()
+
+    def list_file_names(self) -> set[str]:
+        """File names (``<sha256><extension>``) of every recorded blob."""
+        return set(self.db.scalars(select(EvidenceBlob.sha256 + EvidenceBlob.extension)))
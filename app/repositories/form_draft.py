@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert
 
 from app.models.form_draft import FormDraft
 from app.repositories.base import BaseRepository
@@ -37,25 +38,17 @@ class FormDraftRepository(BaseRepository[FormDraft]):
         path: str | None = None,
         form_action: str | None = None,
     ) -> FormDraft:
-        """Create or update a persisted draft for the current user."""
-        draft = self.get_by_key(tenant_id, user_id, draft_key)
-        if draft is None:
-            draft = FormDraft(
-                tenant_id=tenant_id,
-                user_id=user_id,
-                draft_key=draft_key,
-                path=path,
-                form_action=form_action,
-                payload_json=payload_json,
-            )
-            self.db.add(draft)
-        else:
-            draft.path = path
-            draft.form_action = form_action
-            draft.payload_json = payload_json
-
-        self.db.commit()
-        self.db.refresh(draft)
+        """Create or update a persisted draft for the current user in one statement."""
+        values = {"path": path, "form_action": form_action, "payload_json": payload_json}
+        stmt = insert(FormDraft).values(
+            tenant_id=tenant_id, user_id=user_id, draft_key=draft_key, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_form_drafts_tenant_user_key",
+            set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()},
+        ).returning(FormDraft)
+        draft = self.db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        self._commit()
         return draft
 
     def clear_by_key(
@@ -70,5 +63,5 @@ class FormDraftRepository(BaseRepository[FormDraft]):
             return False
 
         self.db.delete(draft)
-        self.db.commit()
+        self._commit()
         return True
@@ -2,9 +2,12 @@
 
 from typing import List
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, contains_eager, joinedload
 from app.models.framework import Framework, FrameworkSection, FrameworkControl
 from app.repositories.base import BaseRepository
+from app.repositories.pagination import Page, SortKey, paginate
+from app.repositories.read_models import ControlListRow
 
 
 class FrameworkRepository(BaseRepository[Framework]):
@@ -12,6 +15,13 @@ class FrameworkRepository(BaseRepository[Framework]):
 
     model = Framework
 
+    # Spans three tables, so no index serves it: each page sorts the tenant's
+    # controls, but only the page's rows are sent and rendered
+    CONTROL_LIST_SORT = SortKey(
+        "catalog",
+        (Framework.name, FrameworkSection.order, FrameworkControl.control_id, FrameworkControl.id),
+    )
+
     def __init__(self, db: Session):
         """Initialize framework repository."""
         super().__init__(db)
@@ -36,6 +46,57 @@ class FrameworkRepository(BaseRepository[Framework]):
             .joinedload(FrameworkSection.controls)
         ).first()
 
+    def get_catalog_revision(self, tenant_id: UUID, id: UUID) -> int | None:
+        """Current catalog revision of a tenant's framework, or None if not found."""
+        return self.db.query(Framework.catalog_revision).filter(
+            Framework.tenant_id == tenant_id,
+            Framework.id == id
+        ).scalar()
+
+    def get_control_with_framework(
+        self, tenant_id: UUID, control_id: UUID
+    ) -> FrameworkControl | None:
+        """Get one of a tenant's controls with its section and framework loaded."""
+        return self.db.query(FrameworkControl).join(
+            FrameworkControl.section
+        ).join(
+            FrameworkSection.framework
+        ).filter(
+            Framework.tenant_id == tenant_id,
+            FrameworkControl.id == control_id
+        ).options(
+            contains_eager(FrameworkControl.section).contains_eager(FrameworkSection.framework)
+        ).first()
+
+    def list_control_rows(
+        self, tenant_id: UUID, cursor: str | None = None, limit: int | None = None
+    ) -> Page[ControlListRow]:
+        """A page of the tenant's controls as list rows, in framework and section order.
+
+        Reads only the columns the controls list shows, and whether each text
+        column is filled in rather than the text itself. Raises
+        ``InvalidCursor`` for a cursor not issued for this list.
+        """
+        def filled(column):
+            return func.coalesce(func.length(column), 0) > 0
+
+        query = (
+            select(
+                FrameworkControl.id,
+                FrameworkControl.control_id,
+                FrameworkControl.name,
+                FrameworkSection.name,
+                Framework.name,
+                filled(FrameworkControl.requirements_text),
+                filled(FrameworkControl.testing_procedures_text),
+                filled(FrameworkControl.check_points_text),
+            )
+            .join(FrameworkControl.section)
+            .join(FrameworkSection.framework)
+            .where(Framework.tenant_id == tenant_id)
+        )
+        return paginate(self.db, query, self.CONTROL_LIST_SORT, ControlListRow, cursor, limit)
+
 
 # Add relationships to Framework model (these would be defined in the model file)
 # For now, they're assumed to exist based on the FK structure
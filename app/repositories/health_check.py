@@ -1,23 +1,86 @@
 """Health check repository for review scopes and review scope types."""
 
+from functools import lru_cache
 from typing import List
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, not_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import (
+    and_,
+    bindparam,
+    case,
+    delete,
+    exists,
+    literal,
+    not_,
+    or_,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
+from app.models.framework import SNAPSHOT_FIELDS, FrameworkControl
 from app.models.health_check import (
     ReviewScope,
     ReviewScopeType,
     AuditSession,
     SessionControlInstance,
+    SessionControlAssessment,
+    AuditSessionStatusCounts,
+    ReviewScopeStatusCounts,
+    ControlSnapshot,
     ControlInstanceEvidenceFile,
     SessionControlObservation,
     SessionControlObservationEvidence,
     ControlToReviewScopeMapping,
     ControlInstanceStatus,
+    STATUS_COUNT_COLUMNS,
 )
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
 from app.utils.rich_text import sanitize_rich_text
 
+@lru_cache(maxsize=None)
+def _status_change_statement(status: ControlInstanceStatus):
+    """Move an instance's count to ``status`` in its session and review scope counts.
+
+    Execute with an ``instance_id`` parameter. Reads the stored status under
+    a row lock, so it must run before the new status is flushed; concurrent
+    saves of the same instance queue on that lock and each moves the count
+    from the status the previous one left. Nothing is updated when the
+    status is unchanged. Built once per status, as constructing it costs
+    more than running it.
+    """
+    previous = (
+        select(SessionControlAssessment.audit_session_id, SessionControlAssessment.status)
+        .where(SessionControlAssessment.session_control_instance_id == bindparam("instance_id"))
+        .with_for_update()
+        .cte("previous")
+    )
+
+    def shift(model, old_status):
+        return {
+            model.count_column(s): model.count_column(s)
+            + case((old_status == s, -1), else_=0)
+            + (1 if s == status else 0)
+            for s in ControlInstanceStatus
+        }
+
+    moved = (
+        update(AuditSessionStatusCounts)
+        .where(
+            AuditSessionStatusCounts.audit_session_id == previous.c.audit_session_id,
+            previous.c.status != status,
+        )
+        .values(shift(AuditSessionStatusCounts, previous.c.status))
+        .returning(AuditSessionStatusCounts.review_scope_id, previous.c.status)
+        .cte("moved")
+    )
+    return (
+        update(ReviewScopeStatusCounts)
+        .where(ReviewScopeStatusCounts.review_scope_id == moved.c.review_scope_id)
+        .values(shift(ReviewScopeStatusCounts, moved.c.status))
+    )
+
 
 class HealthCheckRepository(BaseRepository[ReviewScope]):
     """Repository for ReviewScope with review-scope-aware queries."""
@@ -55,12 +118,16 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         ).order_by(ReviewScopeType.sort_order).all()
 
     def get_review_scopes_for_project(self, project_id: UUID) -> List[ReviewScope]:
-        """Get all review scopes for a project with eager-loaded related data."""
+        """Get all review scopes for a project with their type and sessions.
+
+        Control instances are not loaded; status counts come from
+        ``app.services.health_check_stats``.
+        """
         return self.db.query(ReviewScope).filter(
             ReviewScope.project_id == project_id
         ).options(
             joinedload(ReviewScope.review_scope_type),
-            joinedload(ReviewScope.sessions).joinedload(AuditSession.control_instances)
+            selectinload(ReviewScope.sessions),
         ).order_by(ReviewScope.sort_order).all()
 
     def get_review_scope_by_id(self, review_scope_id: UUID) -> ReviewScope | None:
@@ -86,10 +153,25 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             sort_order=sort_order,
         )
         self.db.add(review_scope)
-        self.db.commit()
-        self.db.refresh(review_scope, ["review_scope_type", "sessions"])
+        self._commit(review_scope, ["review_scope_type", "sessions"])
         return review_scope
 
+    def add_review_scopes_to_project(
+        self, project_id: UUID, review_scope_type_ids: List[UUID]
+    ) -> List[ReviewScope]:
+        """Add one review scope per type, ordered as given, in a single insert."""
+        review_scopes = [
+            ReviewScope(
+                project_id=project_id,
+                review_scope_type_id=review_scope_type_id,
+                sort_order=i,
+            )
+            for i, review_scope_type_id in enumerate(review_scope_type_ids)
+        ]
+        self.db.add_all(review_scopes)
+        self._commit()
+        return review_scopes
+
     def remove_review_scope(self, review_scope_id: UUID) -> bool:
         """Delete a review scope and cascade to its sessions."""
         review_scope = self.db.query(ReviewScope).filter(
@@ -98,7 +180,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         if not review_scope:
             return False
         self.db.delete(review_scope)
-        self.db.commit()
+        self._commit()
         return True
 
     # === Review Scope Detail ===
@@ -131,8 +213,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             description=description,
         )
         self.db.add(session)
-        self.db.commit()
-        self.db.refresh(session, ["review_scope", "control_instances"])
+        self._commit(session, ["review_scope", "control_instances"])
         return session
 
     def get_session_by_id(self, session_id: UUID) -> AuditSession | None:
@@ -144,42 +225,129 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         ).first()
 
     def delete_session(self, session_id: UUID) -> bool:
-        """Delete a session (cascades to control instances via model relationship)."""
+        """Delete a session (cascades to control instances via model relationship).
+
+        The control instances are deleted and flushed first, locking their
+        assessments, and only then are the session's status counts
+        subtracted from its review scope's: the order in which a status save
+        locks the same rows, so a save running concurrently waits rather than
+        deadlocks. The session row, and with it its own counts, goes last.
+        """
         session = self.db.query(AuditSession).filter(
             AuditSession.id == session_id
         ).first()
         if not session:
             return False
+        for instance in session.control_instances:
+            self.db.delete(instance)
+        self.db.flush()
+        self.db.expire(session, ["control_instances"])
+        removed = (
+            delete(AuditSessionStatusCounts)
+            .where(AuditSessionStatusCounts.audit_session_id == session_id)
+            .returning(AuditSessionStatusCounts)
+            .cte("removed")
+        )
+        self.db.execute(
+            update(ReviewScopeStatusCounts)
+            .where(ReviewScopeStatusCounts.review_scope_id == removed.c.review_scope_id)
+            .values({
+                name: getattr(ReviewScopeStatusCounts, name) - removed.c[name]
+                for name in STATUS_COUNT_COLUMNS
+            })
+        )
         self.db.delete(session)
-        self.db.commit()
+        self._commit()
         return True
 
     # === Control Instance Seeding ===
 
     def seed_control_instances(self, session: AuditSession, review_scope_type_id: UUID) -> int:
         """Create SessionControlInstance rows for all controls mapped to this review scope type.
-        Returns count of instances created."""
-        mappings = self.db.query(ControlToReviewScopeMapping).filter(
+        Returns count of instances created.
+
+        Runs as two INSERT ... SELECT statements, so nothing is loaded into the
+        session: the first copies the text of controls whose snapshot hash is
+        not yet in ``control_snapshots``, the second creates the instances
+        pointing at their snapshot by that hash, and their not-started
+        assessments from its RETURNING rows.
+        """
+        content_hash = FrameworkControl.snapshot_hash
+        mapped_controls = select(FrameworkControl).join(
+            ControlToReviewScopeMapping,
+            ControlToReviewScopeMapping.framework_control_id == FrameworkControl.id,
+        ).where(
             ControlToReviewScopeMapping.review_scope_type_id == review_scope_type_id
-        ).options(joinedload(ControlToReviewScopeMapping.framework_control)).all()
-
-        for mapping in mappings:
-            ctrl = mapping.framework_control
-            instance = SessionControlInstance(
-                audit_session_id=session.id,
-                framework_control_id=ctrl.id,
-                control_id_snapshot=ctrl.control_id,
-                control_title_snapshot=ctrl.name,
-                control_description_snapshot=ctrl.description,
-                requirements_text_snapshot=ctrl.requirements_text,
-                testing_procedures_text_snapshot=ctrl.testing_procedures_text,
-                check_points_text_snapshot=ctrl.check_points_text,
-                assessment_checklist_snapshot=ctrl.assessment_checklist,
-                status=ControlInstanceStatus.NOT_STARTED,
+        )
+
+        snapshot_fields = [getattr(FrameworkControl, name) for name in SNAPSHOT_FIELDS]
+        self.db.execute(
+            insert(ControlSnapshot).from_select(
+                ["content_hash", *SNAPSHOT_FIELDS],
+                mapped_controls.with_only_columns(content_hash, *snapshot_fields)
+                .where(~exists().where(ControlSnapshot.content_hash == content_hash))
+                .distinct(content_hash),
+            ).on_conflict_do_nothing(index_elements=["content_hash"])
+        )
+
+        instances = SessionControlInstance.__table__
+        assessments = SessionControlAssessment.__table__
+        created = (
+            insert(instances)
+            .from_select(
+                [
+                    "id",
+                    "audit_session_id",
+                    "framework_control_id",
+                    "control_id_snapshot",
+                    "control_title_snapshot",
+                    "control_snapshot_hash",
+                ],
+                mapped_controls.with_only_columns(
+                    func.gen_random_uuid(),
+                    literal(session.id, instances.c.audit_session_id.type),
+                    FrameworkControl.id,
+                    FrameworkControl.control_id,
+                    FrameworkControl.name,
+                    content_hash,
+                ),
+            )
+            .returning(instances.c.id, instances.c.audit_session_id)
+            .cte("created")
+        )
+        result = self.db.execute(
+            insert(assessments).from_select(
+                ["session_control_instance_id", "audit_session_id", "status"],
+                select(
+                    created.c.id,
+                    created.c.audit_session_id,
+                    literal(ControlInstanceStatus.NOT_STARTED, assessments.c.status.type),
+                ),
+            )
+        )
+        self._add_seeded_counts(session, result.rowcount)
+        self.db.expire(session, ["control_instances"])
+        self._commit()
+        return result.rowcount
+
+    def _add_seeded_counts(self, session: AuditSession, count: int) -> None:
+        """Add ``count`` not-started instances to the session and review scope counts."""
+        for model, key, values in (
+            (AuditSessionStatusCounts, "audit_session_id", {
+                "audit_session_id": session.id, "review_scope_id": session.review_scope_id,
+            }),
+            (ReviewScopeStatusCounts, "review_scope_id", {
+                "review_scope_id": session.review_scope_id, "project_id": session.project_id,
+            }),
+        ):
+            self.db.execute(
+                insert(model)
+                .values(**values, not_started_count=count)
+                .on_conflict_do_update(
+                    index_elements=[key],
+                    set_={"not_started_count": model.not_started_count + count},
+                )
             )
-            self.db.add(instance)
-        self.db.commit()
-        return len(mappings)
 
     # === Control Instance Queries ===
 
@@ -194,11 +362,12 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         ).order_by(SessionControlInstance.control_id_snapshot).all()
 
     def get_control_instance_by_id(self, instance_id: UUID) -> SessionControlInstance | None:
-        """Single instance with evidence_files."""
+        """Single instance with evidence_files and its snapshot text."""
         return self.db.query(SessionControlInstance).filter(
             SessionControlInstance.id == instance_id
         ).options(
-            joinedload(SessionControlInstance.evidence_files)
+            joinedload(SessionControlInstance.evidence_files),
+            joinedload(SessionControlInstance.snapshot),
         ).first()
 
     def update_control_instance(
@@ -212,11 +381,11 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         instance = self.get_control_instance_by_id(instance_id)
         if not instance:
             return None
+        self.db.execute(_status_change_statement(status), {"instance_id": instance.id})
         instance.status = status
         instance.notes = notes
         instance.assessed_by_id = assessed_by_id
-        self.db.commit()
-        self.db.refresh(instance, ["evidence_files"])
+        self._commit(instance, ["evidence_files", "assessment"])
         return instance
 
     # === Evidence CRUD ===
@@ -231,8 +400,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             content=content,
         )
         self.db.add(ev)
-        self.db.commit()
-        self.db.refresh(ev)
+        self._commit(ev)
         return ev
 
     def add_file_evidence(
@@ -241,6 +409,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         filename: str,
         file_path: str,
         file_size: int,
+        blob_sha256: str | None = None,
     ) -> ControlInstanceEvidenceFile:
         """Add a file as evidence."""
         ev = ControlInstanceEvidenceFile(
@@ -249,10 +418,10 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             filename=filename,
             file_path=file_path,
             file_size=file_size,
+            blob_sha256=blob_sha256,
         )
         self.db.add(ev)
-        self.db.commit()
-        self.db.refresh(ev)
+        self._commit(ev)
         return ev
 
     def get_evidence_by_id(self, evidence_id: UUID) -> ControlInstanceEvidenceFile | None:
@@ -271,7 +440,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         if not ev:
             return False
         self.db.delete(ev)
-        self.db.commit()
+        self._commit()
         return True
 
     # === Observations ===
@@ -279,7 +448,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
     def get_control_instance_with_observations(
         self, instance_id: UUID
     ) -> SessionControlInstance | None:
-        """Load control instance with observations and their evidence files."""
+        """Load control instance with observations, their evidence files and the snapshot text."""
         return self.db.query(SessionControlInstance).filter(
             SessionControlInstance.id == instance_id
         ).options(
@@ -287,6 +456,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
                 SessionControlObservation.evidence_files
             ),
             joinedload(SessionControlInstance.evidence_files),
+            joinedload(SessionControlInstance.snapshot),
         ).first()
 
     def create_observation(
@@ -302,10 +472,51 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             recommendation_text=sanitize_rich_text(recommendation_text),
         )
         self.db.add(obs)
-        self.db.commit()
-        self.db.refresh(obs, ["evidence_files"])
+        self._commit(obs, ["evidence_files"])
         return obs
 
+    def save_control_assessment(
+        self,
+        instance: SessionControlInstance,
+        status: ControlInstanceStatus,
+        notes: str | None,
+        assessed_by_id: UUID | None,
+        new_observations: List[tuple[str, str | None, str | None]],
+        recommendations: dict[UUID, str | None],
+    ) -> SessionControlInstance:
+        """Save a control panel submission with a single flush.
+
+        ``instance`` must have its observations loaded (see
+        ``get_control_instance_with_observations``). ``new_observations`` holds
+        (observation text, recommendation, optional note) tuples and
+        ``recommendations`` maps ids of the instance's own observations to their
+        new recommendation; ids belonging to other instances are ignored. New
+        observations and their notes are each written with one multi-row
+        INSERT, and unchanged recommendations issue no UPDATE.
+        """
+        self.db.execute(_status_change_statement(status), {"instance_id": instance.id})
+        instance.status = status
+        instance.notes = notes
+        instance.assessed_by_id = assessed_by_id
+
+        for obs in instance.observations:
+            if obs.id in recommendations:
+                obs.recommendation_text = sanitize_rich_text(recommendations[obs.id])
+
+        for observation_text, recommendation_text, note in new_observations:
+            obs = SessionControlObservation(
+                observation_text=observation_text,
+                recommendation_text=sanitize_rich_text(recommendation_text),
+            )
+            if note:
+                obs.evidence_files.append(
+                    SessionControlObservationEvidence(evidence_type="text_note", content=note)
+                )
+            instance.observations.append(obs)
+
+        self._commit()
+        return instance
+
     def update_observation_recommendation(self, observation_id: UUID, recommendation_text: str | None) -> bool:
         """Update the recommendation text of an existing observation."""
         obs = self.db.query(SessionControlObservation).filter(
@@ -314,7 +525,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         if not obs:
             return False
         obs.recommendation_text = sanitize_rich_text(recommendation_text)
-        self.db.commit()
+        self._commit()
         return True
 
     def delete_observation(self, observation_id: UUID) -> bool:
@@ -325,7 +536,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         if not obs:
             return False
         self.db.delete(obs)
-        self.db.commit()
+        self._commit()
         return True
 
     def get_observation_by_id(
@@ -348,8 +559,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             content=content,
         )
         self.db.add(ev)
-        self.db.commit()
-        self.db.refresh(ev)
+        self._commit(ev)
         return ev
 
     def add_observation_image(
@@ -358,6 +568,7 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         filename: str,
         file_path: str,
         file_size: int,
+        blob_sha256: str | None = None,
     ) -> SessionControlObservationEvidence:
         """Add an image as evidence to an observation."""
         ev = SessionControlObservationEvidence(
@@ -366,10 +577,10 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
             filename=filename,
             file_path=file_path,
             file_size=file_size,
+            blob_sha256=blob_sha256,
         )
         self.db.add(ev)
-        self.db.commit()
-        self.db.refresh(ev)
+        self._commit(ev)
         return ev
 
     def delete_observation_evidence(self, evidence_id: UUID) -> bool:
@@ -380,19 +591,209 @@ class HealthCheckRepository(BaseRepository[ReviewScope]):
         if not ev:
             return False
         self.db.delete(ev)
-        self.db.commit()
+        self._commit()
         return True
 
     # === Stats ===
 
     def get_session_stats(self, session_id: UUID) -> dict:
         """Return count by status for a session's control instances."""
-        rows = self.db.query(
-            SessionControlInstance.status, func.count()
-        ).filter(
-            SessionControlInstance.audit_session_id == session_id
-        ).group_by(SessionControlInstance.status).all()
-        stats = {s.value: 0 for s in ControlInstanceStatus}
-        for status, count in rows:
-            stats[status] = count
-        return stats
+        counts = self.db.get(AuditSessionStatusCounts, session_id, populate_existing=True)
+        if counts is None:
+            return {s.value: 0 for s in ControlInstanceStatus}
+        return counts.counts()
+
+    def get_review_scope_status_counts(self, project_id: UUID) -> List[ReviewScopeStatusCounts]:
+        """Stored status counts of every review scope in a project."""
+        return self.db.query(ReviewScopeStatusCounts).filter(
+            ReviewScopeStatusCounts.project_id == project_id
+        ).all()
+
+    def get_session_status_counts(self, review_scope_id: UUID) -> List[AuditSessionStatusCounts]:
+        """Stored status counts of every session in a review scope."""
+        return self.db.query(AuditSessionStatusCounts).filter(
+            AuditSessionStatusCounts.review_scope_id == review_scope_id
+        ).all()
+
+    def repair_status_counts(self, project_id: UUID) -> tuple[List[UUID], List[UUID]]:
+        """Recount a project's stored status counts from its assessments.
+
+        Returns the ids of the sessions and review scopes whose stored counts
+        were wrong or missing and have been rewritten; rows that already
+        match are not updated. The project's count rows are locked first, so
+        a save running concurrently either lands before the recount and is
+        included in it, or waits and applies its change on top. Does not
+        commit.
+        """
+        self.db.execute(
+            select(AuditSessionStatusCounts.audit_session_id)
+            .join(AuditSession, AuditSession.id == AuditSessionStatusCounts.audit_session_id)
+            .where(AuditSession.project_id == project_id)
+            .with_for_update(of=AuditSessionStatusCounts)
+        )
+        self.db.execute(
+            select(ReviewScopeStatusCounts.review_scope_id)
+            .where(ReviewScopeStatusCounts.project_id == project_id)
+            .with_for_update()
+        )
+
+        session_counts = select(
+            AuditSession.id,
+            AuditSession.review_scope_id,
+            *(
+                func.count(SessionControlAssessment.session_control_instance_id)
+                .filter(SessionControlAssessment.status == status)
+                for status in ControlInstanceStatus
+            ),
+        ).outerjoin(
+            SessionControlAssessment, SessionControlAssessment.audit_session_id == AuditSession.id
+        ).where(AuditSession.project_id == project_id).group_by(AuditSession.id)
+        sessions = self.db.scalars(
+            self._upsert_counts(
+                AuditSessionStatusCounts,
+                ["audit_session_id", "review_scope_id"],
+                session_counts,
+            ).returning(AuditSessionStatusCounts.audit_session_id)
+        ).all()
+
+        review_scope_counts = select(
+            ReviewScope.id,
+            ReviewScope.project_id,
+            *(
+                func.coalesce(func.sum(getattr(AuditSessionStatusCounts, name)), 0)
+                for name in STATUS_COUNT_COLUMNS
+            ),
+        ).outerjoin(
+            AuditSessionStatusCounts, AuditSessionStatusCounts.review_scope_id == ReviewScope.id
+        ).where(ReviewScope.project_id == project_id).group_by(ReviewScope.id)
+        review_scopes = self.db.scalars(
+            self._upsert_counts(
+                ReviewScopeStatusCounts,
+                ["review_scope_id", "project_id"],
+                review_scope_counts,
+            ).returning(ReviewScopeStatusCounts.review_scope_id)
+        ).all()
+        return sessions, review_scopes
+
+    @staticmethod
+    def _upsert_counts(model, key_columns: List[str], counts_select):
+        """INSERT ... SELECT of count rows that overwrites only rows which differ."""
+        stmt = insert(model).from_select([*key_columns, *STATUS_COUNT_COLUMNS], counts_select)
+        return stmt.on_conflict_do_update(
+            index_elements=key_columns[:1],
+            set_={name: stmt.excluded[name] for name in STATUS_COUNT_COLUMNS},
+            where=or_(*(
+                getattr(model, name) != stmt.excluded[name] for name in STATUS_COUNT_COLUMNS
+            )),
+        )
+
+
+class AsyncHealthCheckRepository(AsyncBaseRepository[ReviewScope]):
+    """Async variant of HealthCheckRepository for the session assessment pages.
+
+    Every loader eager-loads the relationships the health-check templates
+    traverse, since an ``AsyncSession`` cannot lazy-load them on access.
+    """
+
+    model = ReviewScope
+
+    def __init__(self, db: AsyncSession):
+        """Initialize async health check repository."""
+        super().__init__(db)
+
+    async def get_review_scope_with_sessions(
+        self, review_scope_id: UUID
+    ) -> ReviewScope | None:
+        """Load a review scope with sessions for the detail page."""
+        return await self.db.scalar(
+            select(ReviewScope)
+            .where(ReviewScope.id == review_scope_id)
+            .options(
+                joinedload(ReviewScope.review_scope_type),
+                selectinload(ReviewScope.sessions),
+            )
+        )
+
+    async def get_session_by_id(self, session_id: UUID) -> AuditSession | None:
+        """Get a session by ID with its review scope and type."""
+        return await self.db.scalar(
+            select(AuditSession)
+            .where(AuditSession.id == session_id)
+            .options(
+                joinedload(AuditSession.review_scope).joinedload(
+                    ReviewScope.review_scope_type
+                )
+            )
+        )
+
+    async def get_control_instances_for_session(
+        self, session_id: UUID
+    ) -> List[SessionControlInstance]:
+        """All instances ordered by control_id_snapshot, with evidence_files loaded."""
+        result = await self.db.scalars(
+            select(SessionControlInstance)
+            .where(SessionControlInstance.audit_session_id == session_id)
+            .options(selectinload(SessionControlInstance.evidence_files))
+            .order_by(SessionControlInstance.control_id_snapshot)
+        )
+        return list(result)
+
+    async def get_control_instance_by_id(
+        self, instance_id: UUID
+    ) -> SessionControlInstance | None:
+        """Single instance with evidence_files, its session and its snapshot text."""
+        return await self.db.scalar(
+            select(SessionControlInstance)
+            .where(SessionControlInstance.id == instance_id)
+            .options(
+                selectinload(SessionControlInstance.evidence_files),
+                joinedload(SessionControlInstance.audit_session),
+                joinedload(SessionControlInstance.snapshot),
+            )
+        )
+
+    async def get_control_instance_with_observations(
+        self, instance_id: UUID
+    ) -> SessionControlInstance | None:
+        """Load a control instance with everything the control panel renders."""
+        return await self.db.scalar(
+            select(SessionControlInstance)
+            .where(SessionControlInstance.id == instance_id)
+            .options(
+                selectinload(SessionControlInstance.observations).selectinload(
+                    SessionControlObservation.evidence_files
+                ),
+                selectinload(SessionControlInstance.evidence_files),
+                joinedload(SessionControlInstance.audit_session)
+                .joinedload(AuditSession.review_scope)
+                .joinedload(ReviewScope.review_scope_type),
+                joinedload(SessionControlInstance.snapshot),
+            )
+            .execution_options(populate_existing=True)
+        )
+
+    async def update_control_instance(
+        self,
+        instance_id: UUID,
+        status: ControlInstanceStatus,
+        notes: str | None,
+        assessed_by_id: UUID | None,
+    ) -> SessionControlInstance | None:
+        """Update control instance status and notes."""
+        instance = await self.get_control_instance_by_id(instance_id)
+        if not instance:
+            return None
+        await self.db.execute(_status_change_statement(status), {"instance_id": instance.id})
+        instance.status = status
+        instance.notes = notes
+        instance.assessed_by_id = assessed_by_id
+        await self.db.commit()
+        await self.db.refresh(instance, ["evidence_files"])
+        return instance
+
+    async def get_session_stats(self, session_id: UUID) -> dict:
+        """Return count by status for a session's control instances."""
+        counts = await self.db.get(AuditSessionStatusCounts, session_id, populate_existing=True)
+        if counts is None:
+            return {s.value: 0 for s in ControlInstanceStatus}
+        return counts.counts()
@@ -41,7 +41,7 @@ class ProjectObservationRepository(BaseRepository[ProjectObservation]):
             recommendation_text=recommendation_text,
         )
         self.db.add(observation)
-        self.db.commit()
+        self._commit()
         return observation
 
     def delete_observation(self, observation_id: uuid.UUID) -> bool:
@@ -51,7 +51,7 @@ class ProjectObservationRepository(BaseRepository[ProjectObservation]):
         ).first()
         if observation:
             self.db.delete(observation)
-            self.db.commit()
+            self._commit()
             return True
         return False
 
@@ -68,11 +68,16 @@ class ProjectObservationRepository(BaseRepository[ProjectObservation]):
             content=content,
         )
         self.db.add(evidence)
-        self.db.commit()
+        self._commit()
         return evidence
 
     def add_image(
-        self, observation_id: uuid.UUID, filename: str, file_path: str, file_size: int
+        self,
+        observation_id: uuid.UUID,
+        filename: str,
+        file_path: str,
+        file_size: int,
+        blob_sha256: str | None = None,
     ) -> ProjectEvidenceFile:
         evidence = ProjectEvidenceFile(
             id=uuid.uuid4(),
@@ -81,9 +86,10 @@ class ProjectObservationRepository(BaseRepository[ProjectObservation]):
             filename=filename,
             file_path=file_path,
             file_size=file_size,
+            blob_sha256=blob_sha256,
         )
         self.db.add(evidence)
-        self.db.commit()
+        self._commit()
         return evidence
 
     def delete_evidence(self, evidence_id: uuid.UUID) -> bool:
@@ -92,6 +98,6 @@ class ProjectObservationRepository(BaseRepository[ProjectObservation]):
         ).first()
         if evidence:
             self.db.delete(evidence)
-            self.db.commit()
+            self._commit()
             return True
         return False
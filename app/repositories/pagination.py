@@ -0,0 +1,136 @@
+"""Keyset (cursor) pagination for list pages.
+
+A ``SortKey`` orders a list by columns that end in a unique one (the id), so
+every row has a distinct position. A page is the first ``limit`` rows after
+the cursor: the cursor carries the sort key values of the previous page's
+last row, and the next page is read with a row comparison such as
+``(name, id) > (:name, :id)``. With an index on the filter and sort columns
+each page is an index range scan that stops after ``limit`` rows, however
+deep into the list it is, unlike OFFSET paging which reads and discards
+every earlier row.
+
+Cursors are opaque to the client (URL-safe base64 of JSON) and name the sort
+they were issued for; ``InvalidCursor`` is raised for anything else. They
+only choose where a page starts, the tenant and other filters are always
+applied, so a hand-edited cursor cannot reach other rows.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class InvalidCursor(ValueError):
+    """A cursor that was not issued for this list and sort."""
+
+
+@dataclass(frozen=True, slots=True)
+class SortKey:
+    """A list ordering: columns all ascending or all descending, the last one unique."""
+
+    name: str
+    columns: tuple
+    descending: bool = False
+
+    def order_by(self) -> list:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def after(self, values: Sequence[Any]):
+        """WHERE clause for the rows that sort after ``values``."""
+        key = tuple_(*self.columns)
+        bound = tuple_(*values, types=[column.type for column in self.columns])
+        return key < bound if self.descending else key > bound
+
+    def encode(self, values: Sequence[Any]) -> str:
+        """The cursor for the row with these sort key values."""
+        payload = [self.name, *(_to_json(value) for value in values)]
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        """Sort key values from a cursor issued by ``encode``."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        except (binascii.Error, ValueError) as exc:
+            raise InvalidCursor(cursor) from exc
+        if (
+            not isinstance(payload, list)
+            or len(payload) != len(self.columns) + 1
+            or payload[0] != self.name
+        ):
+            raise InvalidCursor(cursor)
+        try:
+            return [
+                _from_json(column.type.python_type, value)
+                for column, value in zip(self.columns, payload[1:])
+            ]
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _from_json(python_type: type, value: Any) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if not isinstance(value, python_type):
+        return python_type(value)
+    return value
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """One page of a list and the cursor for the next one (None on the last page)."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def paginate(
+    db: Session,
+    query: Select,
+    sort: SortKey,
+    make_row: Callable[..., T],
+    cursor: str | None = None,
+    limit: int | None = None,
+) -> Page[T]:
+    """Run ``query`` for one page ordered by ``sort``.
+
+    ``make_row`` builds an item from a result row's selected columns, passed
+    positionally (a row dataclass works as is). The sort columns are appended
+    to the query to build the next cursor from; with no ``limit`` every row
+    after the cursor is returned.
+    """
+    keyed = query.add_columns(*sort.columns).order_by(*sort.order_by())
+    if cursor:
+        keyed = keyed.where(sort.after(sort.decode(cursor)))
+    if limit is not None:
+        keyed = keyed.limit(limit + 1)
+    rows = db.execute(keyed).all()
+
+    width = len(sort.columns)
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = sort.encode(rows[-1][-width:])
+    return Page([make_row(*row[:-width]) for row in rows], next_cursor)
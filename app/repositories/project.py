@@ -2,13 +2,42 @@
 
 from typing import List
 from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
-from app.models.project import Project, ProjectStatus, ProjectMember
+from sqlalchemy import Select, and_, func, join, or_, select, true
+from app.models.project import (
+    Project,
+    ProjectMember,
+    ProjectResponse,
+    ProjectStatus,
+    ResponseStatus,
+)
 from app.models.client import Client
-from app.models.framework import Framework
+from app.models.framework import Framework, FrameworkControl, FrameworkSection
 from app.models.user import User, UserRole
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.repositories.pagination import Page, SortKey, paginate
+from app.repositories.read_models import (
+    DashboardProjectRow,
+    DashboardSummary,
+    NamedRef,
+    ProjectListRow,
+    SegmentProgressRow,
+)
+from app.services.dashboard_cache import invalidate_tenant_after_commit
+
+
+def _project_list_row(
+    id, name, status, project_type, client_name, framework_name
+) -> ProjectListRow:
+    return ProjectListRow(
+        id,
+        name,
+        status,
+        project_type,
+        NamedRef(client_name) if client_name is not None else None,
+        NamedRef(framework_name) if framework_name is not None else None,
+    )
 
 
 class ProjectRepository(BaseRepository[Project]):
@@ -16,10 +45,37 @@ class ProjectRepository(BaseRepository[Project]):
 
     model = Project
 
+    # Projects list orderings, each backed by a partial index on top-level projects
+    LIST_SORTS = {
+        "recent": SortKey("recent", (Project.updated_at, Project.id), descending=True),
+        "name": SortKey("name", (Project.name, Project.id)),
+        "status": SortKey("status", (Project.status, Project.name, Project.id)),
+    }
+
     def __init__(self, db: Session):
         """Initialize project repository."""
         super().__init__(db)
 
+    def create(self, **kwargs) -> Project:
+        """Create a project and drop the tenant's cached dashboard summaries."""
+        project = super().create(**kwargs)
+        invalidate_tenant_after_commit(self.db, project.tenant_id)
+        return project
+
+    def update(self, tenant_id: UUID, id: UUID, **kwargs) -> Project | None:
+        """Update a project and drop the tenant's cached dashboard summaries."""
+        project = super().update(tenant_id, id, **kwargs)
+        if project:
+            invalidate_tenant_after_commit(self.db, tenant_id)
+        return project
+
+    def delete(self, tenant_id: UUID, id: UUID) -> bool:
+        """Delete a project and drop the tenant's cached dashboard summaries."""
+        deleted = super().delete(tenant_id, id)
+        if deleted:
+            invalidate_tenant_after_commit(self.db, tenant_id)
+        return deleted
+
     def get_all_with_details(self, tenant_id: UUID, user: User | None = None) -> List[Project]:
         """Get all top-level projects for a tenant with eager-loaded client and framework.
 
@@ -79,6 +135,39 @@ class ProjectRepository(BaseRepository[Project]):
             joinedload(Project.framework)
         ).all()
 
+    def _list_filters(
+        self,
+        tenant_id: UUID,
+        status: ProjectStatus | None,
+        client_id: UUID | None,
+        framework_id: UUID | None,
+        search: str | None,
+        user: User | None,
+    ) -> list:
+        """WHERE clauses shared by ``filter_projects``, ``list_project_rows`` and the dashboard."""
+        filters = [Project.tenant_id == tenant_id, Project.parent_project_id.is_(None)]
+
+        if user and user.role == UserRole.AUDITOR:
+            member_subq = select(ProjectMember.project_id).where(
+                ProjectMember.user_id == user.id
+            )
+            filters.append(or_(Project.owner_id == user.id, Project.id.in_(member_subq)))
+
+        if status:
+            filters.append(Project.status == status)
+
+        if client_id:
+            filters.append(Project.client_id == client_id)
+
+        if framework_id:
+            filters.append(Project.framework_id == framework_id)
+
+        if search and search.strip():
+            search_term = f"%{search.lower()}%"
+            filters.append(Project.name.ilike(search_term))
+
+        return filters
+
     def filter_projects(
         self,
         tenant_id: UUID,
@@ -92,39 +181,176 @@ class ProjectRepository(BaseRepository[Project]):
 
         When user is an Auditor, only returns projects they own or are a member of.
         """
-        query = self.db.query(Project).filter(
-            and_(
-                Project.tenant_id == tenant_id,
-                Project.parent_project_id.is_(None),
-            )
-        )
+        filters = self._list_filters(tenant_id, status, client_id, framework_id, search, user)
+        return self.db.query(Project).filter(*filters).options(
+            joinedload(Project.client),
+            joinedload(Project.framework),
+        ).all()
 
-        if user and user.role == UserRole.AUDITOR:
-            member_subq = self.db.query(ProjectMember.project_id).filter(
-                ProjectMember.user_id == user.id
-            )
-            query = query.filter(
-                or_(Project.owner_id == user.id, Project.id.in_(member_subq))
-            )
+    def list_project_rows(
+        self,
+        tenant_id: UUID,
+        status: ProjectStatus | None = None,
+        client_id: UUID | None = None,
+        framework_id: UUID | None = None,
+        search: str | None = None,
+        user: User | None = None,
+        sort: str = "recent",
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> Page[ProjectListRow]:
+        """A page of ``filter_projects`` as list rows: only the columns the projects table shows.
 
-        if status:
-            query = query.filter(Project.status == status)
+        ``sort`` is a ``LIST_SORTS`` key; unknown ones fall back to "recent".
+        Raises ``InvalidCursor`` for a cursor not issued for that sort.
+        """
+        filters = self._list_filters(tenant_id, status, client_id, framework_id, search, user)
+        query = (
+            select(
+                Project.id,
+                Project.name,
+                Project.status,
+                Project.project_type,
+                Client.name,
+                Framework.name,
+            )
+            .outerjoin(Client, Project.client_id == Client.id)
+            .outerjoin(Framework, Project.framework_id == Framework.id)
+            .where(*filters)
+        )
+        sort_key = self.LIST_SORTS.get(sort) or self.LIST_SORTS["recent"]
+        return paginate(self.db, query, sort_key, _project_list_row, cursor, limit)
 
-        if client_id:
-            query = query.filter(Project.client_id == client_id)
+    def _framework_sizes(self, tenant_id: UUID):
+        """Subquery of the control count of each of the tenant's frameworks.
 
-        if framework_id:
-            query = query.filter(Project.framework_id == framework_id)
+        Counted once per framework rather than per project that uses it.
+        """
+        return (
+            select(
+                FrameworkSection.framework_id,
+                func.count(FrameworkControl.id).label("controls"),
+            )
+            .join(FrameworkControl, FrameworkControl.framework_section_id == FrameworkSection.id)
+            .join(Framework, Framework.id == FrameworkSection.framework_id)
+            .where(Framework.tenant_id == tenant_id)
+            .group_by(FrameworkSection.framework_id)
+            .subquery("framework_sizes")
+        )
 
-        if search and search.strip():
-            search_term = f"%{search.lower()}%"
-            query = query.filter(Project.name.ilike(search_term))
+    def dashboard_summary(self, tenant_id: UUID, user: User | None = None) -> DashboardSummary:
+        """The dashboard's counts and active project progress in one statement.
 
-        return query.options(
-            joinedload(Project.client),
-            joinedload(Project.framework),
+        Project counts cover the top-level projects ``filter_projects`` returns
+        for the user; pending responses, clients and frameworks are counted for
+        the whole tenant. Each in-progress project comes with its framework's
+        control count and how many of those controls it has a response for,
+        most recently updated first.
+        """
+        filters = self._list_filters(tenant_id, None, None, None, None, user)
+        counts = (
+            select(
+                func.count().label("total_projects"),
+                func.count()
+                .filter(Project.status == ProjectStatus.IN_PROGRESS)
+                .label("active_projects"),
+                func.count()
+                .filter(Project.status == ProjectStatus.COMPLETED)
+                .label("completed_assessments"),
+                # count(*) so the (project_id, status) index answers it alone
+                select(func.count())
+                .select_from(ProjectResponse)
+                .join(Project, Project.id == ProjectResponse.project_id)
+                .where(
+                    Project.tenant_id == tenant_id,
+                    ProjectResponse.status.in_(
+                        [ResponseStatus.NOT_STARTED, ResponseStatus.DRAFT]
+                    ),
+                )
+                .scalar_subquery()
+                .label("pending_responses"),
+                select(func.count(Client.id))
+                .where(Client.tenant_id == tenant_id)
+                .scalar_subquery()
+                .label("total_clients"),
+                select(func.count(Framework.id))
+                .where(Framework.tenant_id == tenant_id)
+                .scalar_subquery()
+                .label("total_frameworks"),
+            )
+            .where(*filters)
+            .cte("counts")
+        )
+        framework_sizes = self._framework_sizes(tenant_id)
+        # Responses to the framework's controls per active project, in one
+        # grouped join rather than a subquery per project
+        active_filters = [*filters, Project.status == ProjectStatus.IN_PROGRESS]
+        responded = (
+            select(
+                ProjectResponse.project_id,
+                func.count().label("responses"),
+            )
+            .join(Project, Project.id == ProjectResponse.project_id)
+            .join(FrameworkControl, FrameworkControl.id == ProjectResponse.framework_control_id)
+            .join(FrameworkSection, FrameworkSection.id == FrameworkControl.framework_section_id)
+            .where(*active_filters, FrameworkSection.framework_id == Project.framework_id)
+            .group_by(ProjectResponse.project_id)
+            .subquery("responded")
+        )
+        active = (
+            select(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.status,
+                Project.project_type,
+                Client.name.label("client_name"),
+                Framework.name.label("framework_name"),
+                func.coalesce(framework_sizes.c.controls, 0).label("total_controls"),
+                func.coalesce(responded.c.responses, 0).label("responded_count"),
+                Project.updated_at,
+            )
+            .outerjoin(Client, Project.client_id == Client.id)
+            .outerjoin(Framework, Project.framework_id == Framework.id)
+            .outerjoin(framework_sizes, framework_sizes.c.framework_id == Project.framework_id)
+            .outerjoin(responded, responded.c.project_id == Project.id)
+            .where(*active_filters)
+            .subquery("active")
+        )
+        # Counts always come back as one row; the outer join repeats them on
+        # each active project's row
+        rows = self.db.execute(
+            select(counts, active)
+            .select_from(counts.outerjoin(active, true()))
+            .order_by(active.c.updated_at.desc(), active.c.id)
         ).all()
 
+        first = rows[0]
+        projects = tuple(
+            DashboardProjectRow(
+                row.id,
+                row.name,
+                row.description,
+                row.status,
+                row.project_type,
+                NamedRef(row.client_name) if row.client_name is not None else None,
+                NamedRef(row.framework_name) if row.framework_name is not None else None,
+                row.total_controls,
+                row.responded_count,
+            )
+            for row in rows
+            if row.id is not None
+        )
+        return DashboardSummary(
+            first.total_projects,
+            first.active_projects,
+            first.completed_assessments,
+            first.pending_responses,
+            first.total_clients,
+            first.total_frameworks,
+            projects,
+        )
+
     def get_children(
         self, tenant_id: UUID, parent_project_id: UUID
     ) -> List[Project]:
@@ -139,6 +365,71 @@ class ProjectRepository(BaseRepository[Project]):
             joinedload(Project.framework)
         ).all()
 
+    def segment_progress(
+        self, tenant_id: UUID, parent_project_id: UUID
+    ) -> tuple[SegmentProgressRow, ...]:
+        """A parent project's segments with their control progress, in one statement.
+
+        Each segment comes with its framework's control count, how many of
+        those controls it has a response for and the responses per status,
+        oldest segment first. The statement count does not grow with the
+        number of segments.
+        """
+        framework_sizes = self._framework_sizes(tenant_id)
+        segment_filters = [
+            Project.tenant_id == tenant_id,
+            Project.parent_project_id == parent_project_id,
+        ]
+        # Responses to the segment's framework controls, counted in the
+        # segment's own group rather than in a subquery joined back to it
+        responses = join(
+            ProjectResponse,
+            FrameworkControl,
+            FrameworkControl.id == ProjectResponse.framework_control_id,
+        ).join(FrameworkSection, FrameworkSection.id == FrameworkControl.framework_section_id)
+        rows = self.db.execute(
+            select(
+                Project.id,
+                Project.name,
+                Project.description,
+                Project.status,
+                func.coalesce(framework_sizes.c.controls, 0).label("total_controls"),
+                func.count(ProjectResponse.id).label("responded_count"),
+                *(
+                    func.count(ProjectResponse.id)
+                    .filter(ProjectResponse.status == status)
+                    .label(status.value)
+                    for status in ResponseStatus
+                ),
+            )
+            .outerjoin(framework_sizes, framework_sizes.c.framework_id == Project.framework_id)
+            .outerjoin(
+                responses,
+                and_(
+                    ProjectResponse.project_id == Project.id,
+                    FrameworkSection.framework_id == Project.framework_id,
+                ),
+            )
+            .where(*segment_filters)
+            .group_by(Project.id, framework_sizes.c.controls)
+            .order_by(Project.created_at, Project.id)
+        ).all()
+        return tuple(
+            SegmentProgressRow(
+                row.id,
+                row.name,
+                row.description,
+                row.status,
+                row.total_controls,
+                row.responded_count,
+                row.not_started,
+                row.draft,
+                row.complied,
+                row.not_complied,
+            )
+            for row in rows
+        )
+
     def create_segment(
         self,
         tenant_id: UUID,
@@ -161,6 +452,105 @@ class ProjectRepository(BaseRepository[Project]):
             status=ProjectStatus.NOT_STARTED,
         )
         self.db.add(segment)
-        self.db.commit()
-        self.db.refresh(segment, ["client", "framework"])
+        self._commit(segment, ["client", "framework"])
         return segment
+
+
+class AsyncProjectRepository(AsyncBaseRepository[Project]):
+    """Async variant of ProjectRepository for the hot read paths."""
+
+    model = Project
+
+    def __init__(self, db: AsyncSession):
+        """Initialize async project repository."""
+        super().__init__(db)
+
+    async def get_by_id_with_details(
+        self, tenant_id: UUID, id: UUID
+    ) -> Project | None:
+        """Get a project by ID with client and framework details."""
+        return await self.db.scalar(
+            select(Project)
+            .where(and_(Project.id == id, Project.tenant_id == tenant_id))
+            .options(joinedload(Project.client), joinedload(Project.framework))
+        )
+
+    async def get_by_id_with_framework_tree(
+        self, tenant_id: UUID, id: UUID
+    ) -> Project | None:
+        """Get a project with its framework's sections and controls loaded.
+
+        Used by pages that render the framework tree from ``project.framework``.
+        """
+        return await self.db.scalar(
+            select(Project)
+            .where(and_(Project.id == id, Project.tenant_id == tenant_id))
+            .options(
+                joinedload(Project.client),
+                joinedload(Project.framework)
+                .selectinload(Framework.sections)
+                .selectinload(FrameworkSection.controls),
+            )
+        )
+
+    def _scoped_to_user(self, query: Select, user: User | None) -> Select:
+        """Restrict auditors to projects they own or are a member of."""
+        if user and user.role == UserRole.AUDITOR:
+            member_subq = select(ProjectMember.project_id).where(
+                ProjectMember.user_id == user.id
+            )
+            query = query.where(
+                or_(Project.owner_id == user.id, Project.id.in_(member_subq))
+            )
+        return query
+
+    async def filter_projects(
+        self,
+        tenant_id: UUID,
+        status: ProjectStatus | None = None,
+        client_id: UUID | None = None,
+        framework_id: UUID | None = None,
+        search: str | None = None,
+        user: User | None = None,
+    ) -> List[Project]:
+        """Filter top-level projects by optional criteria."""
+        query = select(Project).where(
+            and_(
+                Project.tenant_id == tenant_id,
+                Project.parent_project_id.is_(None),
+            )
+        )
+        query = self._scoped_to_user(query, user)
+
+        if status:
+            query = query.where(Project.status == status)
+
+        if client_id:
+            query = query.where(Project.client_id == client_id)
+
+        if framework_id:
+            query = query.where(Project.framework_id == framework_id)
+
+        if search and search.strip():
+            query = query.where(Project.name.ilike(f"%{search.lower()}%"))
+
+        result = await self.db.scalars(
+            query.options(joinedload(Project.client), joinedload(Project.framework))
+        )
+        return list(result)
+
+    async def get_children(
+        self, tenant_id: UUID, parent_project_id: UUID
+    ) -> List[Project]:
+        """Get all sub-projects (segments) for a parent project."""
+        result = await self.db.scalars(
+            select(Project)
+            .where(
+                and_(
+                    Project.tenant_id == tenant_id,
+                    Project.parent_project_id == parent_project_id,
+                )
+            )
+            .options(joinedload(Project.client), joinedload(Project.framework))
+        )
+        return list(result)
@@ -0,0 +1,160 @@
+"""Column-projected rows for list pages, autocomplete and the dashboard.
+
+The project, client, user and control lists render a handful of columns per
+row, but loading them as ORM entities also loads every other column (control
+text and JSONB checklists included) and registers each row in the session's
+identity map. The ``*_rows`` repository methods select only the columns the
+list templates read and build these slotted rows from them. Attribute names
+match the ORM models, so the row partials render either.
+
+Rows are plain per-request values: they are not attached to a session, have
+no relationships beyond the ``NamedRef`` stand-ins and are not tracked for
+changes. Autocomplete and dashboard rows are frozen, as their caches share
+them between requests.
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from app.models.project import ProjectStatus, ProjectType
+from app.models.user import AuthProvider, UserRole
+
+
+@dataclass(slots=True)
+class NamedRef:
+    """Name of a related row (a project's client or framework).
+
+    Ids are left out on purpose: parsing three UUIDs per row instead of one
+    is most of the cost of a long project list.
+    """
+
+    name: str
+
+
+@dataclass(slots=True)
+class ProjectListRow:
+    id: uuid.UUID
+    name: str
+    status: ProjectStatus
+    project_type: ProjectType
+    client: NamedRef | None
+    framework: NamedRef | None
+
+
+@dataclass(slots=True)
+class ClientListRow:
+    id: uuid.UUID
+    name: str
+    industry: str | None
+    contact_name: str | None
+    contact_email: str | None
+
+
+@dataclass(slots=True)
+class UserListRow:
+    id: uuid.UUID
+    email: str
+    full_name: str
+    role: UserRole
+    is_active: bool
+    auth_provider: AuthProvider
+
+
+@dataclass(slots=True)
+class ControlListRow:
+    """A control with its section and framework names.
+
+    The ``has_*`` flags say whether the text column is non-empty; the text
+    itself is only loaded by the control editor.
+    """
+
+    id: uuid.UUID
+    control_id: str
+    name: str
+    section_name: str
+    framework_name: str
+    has_requirements: bool
+    has_testing_procedures: bool
+    has_check_points: bool
+
+
+@dataclass(frozen=True, slots=True)
+class UserSearchRow:
+    """An auditor offered by the share modal's autocomplete."""
+
+    id: uuid.UUID
+    full_name: str
+    email: str
+
+
+@dataclass(frozen=True, slots=True)
+class ClientSearchRow:
+    """A client offered by the project form's autocomplete."""
+
+    id: uuid.UUID
+    name: str
+    industry: str | None
+    contact_name: str | None
+    contact_email: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardProjectRow:
+    """An active project card: the project with its control progress."""
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    status: ProjectStatus
+    project_type: ProjectType
+    client: NamedRef | None
+    framework: NamedRef | None
+    total_controls: int
+    responded_count: int
+
+    @property
+    def progress_pct(self) -> int:
+        if not self.total_controls:
+            return 0
+        return round(self.responded_count / self.total_controls * 100)
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentProgressRow:
+    """A parent project's segment row: the segment with its control progress.
+
+    ``responded_count`` counts controls with a response in any status; the
+    status counts break those responses down.
+    """
+
+    id: uuid.UUID
+    name: str
+    description: str | None
+    status: ProjectStatus
+    total_controls: int
+    responded_count: int
+    not_started_count: int
+    draft_count: int
+    complied_count: int
+    not_complied_count: int
+
+    @property
+    def progress_pct(self) -> int:
+        if not self.total_controls:
+            return 0
+        return round(self.responded_count / self.total_controls * 100)
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardSummary:
+    """The dashboard's stat tiles and active project cards for one user."""
+
+    total_projects: int
+    active_projects: int
+    completed_assessments: int
+    pending_responses: int
+    total_clients: int
+    total_frameworks: int
+    projects: tuple[DashboardProjectRow, ...]
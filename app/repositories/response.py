@@ -2,14 +2,32 @@
 
 from typing import List
 from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
 from app.models.project import ProjectResponse, ResponseStatus
 from app.models.project import Project
-from app.repositories.base import BaseRepository
+from app.repositories.base import AsyncBaseRepository, BaseRepository
+from app.services.dashboard_cache import dashboard_cache, invalidate_tenant_after_commit
 from app.utils.rich_text import sanitize_rich_text
 
 
+def _upsert_statement(project_id: UUID, control_id: UUID, **values):
+    """INSERT ... ON CONFLICT DO UPDATE ... RETURNING for one control's response.
+
+    Concurrent saves of the same control resolve to one row (last write wins)
+    instead of racing a SELECT against the INSERT.
+    """
+    stmt = insert(ProjectResponse).values(
+        project_id=project_id, framework_control_id=control_id, **values
+    )
+    return stmt.on_conflict_do_update(
+        constraint="uq_project_responses_project_control",
+        set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()},
+    ).returning(ProjectResponse)
+
+
 class ProjectResponseRepository(BaseRepository[ProjectResponse]):
     """Repository for ProjectResponse model with project context."""
 
@@ -48,36 +66,27 @@ class ProjectResponseRepository(BaseRepository[ProjectResponse]):
         recommendation: str | None = None,
         auditor_notes: str | None = None,
     ) -> ProjectResponse:
-        """Create or update a response for a control."""
-        response_text = sanitize_rich_text(response_text)
-        finding = sanitize_rich_text(finding)
-        recommendation = sanitize_rich_text(recommendation)
-        auditor_notes = sanitize_rich_text(auditor_notes)
-
-        response = self.get_by_control(project_id, control_id)
-
-        if response:
-            response.response_text = response_text
-            response.status = status
-            response.finding = finding
-            response.recommendation = recommendation
-            response.auditor_notes = auditor_notes
-            self.db.commit()
-            self.db.refresh(response)
-        else:
-            response = self.model(
-                project_id=project_id,
-                framework_control_id=control_id,
-                response_text=response_text,
-                status=status,
-                finding=finding,
-                recommendation=recommendation,
-                auditor_notes=auditor_notes,
-            )
-            self.db.add(response)
-            self.db.commit()
-            self.db.refresh(response)
+        """Create or update a response for a control in one statement.
 
+        Drops the tenant's cached dashboard summaries, whose progress and
+        pending counts the response is part of.
+        """
+        # Usually already in the identity map: the route loaded the project
+        tenant_id = self.db.get(Project, project_id).tenant_id
+        response = self.db.scalars(
+            _upsert_statement(
+                project_id,
+                control_id,
+                response_text=sanitize_rich_text(response_text),
+                status=status,
+                finding=sanitize_rich_text(finding),
+                recommendation=sanitize_rich_text(recommendation),
+                auditor_notes=sanitize_rich_text(auditor_notes),
+            ),
+            execution_options={"populate_existing": True},
+        ).one()
+        self._commit()
+        invalidate_tenant_after_commit(self.db, tenant_id)
         return response
 
     def count_pending_for_tenant(self, tenant_id: UUID) -> int:
@@ -92,3 +101,82 @@ class ProjectResponseRepository(BaseRepository[ProjectResponse]):
                 ),
             )
         ).count()
+
+
+class AsyncProjectResponseRepository(AsyncBaseRepository[ProjectResponse]):
+    """Async variant of ProjectResponseRepository."""
+
+    model = ProjectResponse
+
+    def __init__(self, db: AsyncSession):
+        """Initialize async response repository."""
+        super().__init__(db)
+
+    async def get_for_project(self, project_id: UUID) -> List[ProjectResponse]:
+        """Get all responses for a project with eager-loaded control."""
+        result = await self.db.scalars(
+            select(ProjectResponse)
+            .where(ProjectResponse.project_id == project_id)
+            .options(joinedload(ProjectResponse.control))
+        )
+        return list(result)
+
+    async def get_by_control(
+        self, project_id: UUID, control_id: UUID
+    ) -> ProjectResponse | None:
+        """Get response for a specific control in a project."""
+        return await self.db.scalar(
+            select(ProjectResponse).where(
+                and_(
+                    ProjectResponse.project_id == project_id,
+                    ProjectResponse.framework_control_id == control_id,
+                )
+            )
+        )
+
+    async def upsert(
+        self,
+        project_id: UUID,
+        control_id: UUID,
+        response_text: str | None = None,
+        status: ResponseStatus = ResponseStatus.NOT_STARTED,
+        finding: str | None = None,
+        recommendation: str | None = None,
+        auditor_notes: str | None = None,
+    ) -> ProjectResponse:
+        """Create or update a response for a control in one statement.
+
+        Drops the tenant's cached dashboard summaries, as the sync upsert does.
+        """
+        tenant_id = (await self.db.get(Project, project_id)).tenant_id
+        result = await self.db.scalars(
+            _upsert_statement(
+                project_id,
+                control_id,
+                response_text=sanitize_rich_text(response_text),
+                status=status,
+                finding=sanitize_rich_text(finding),
+                recommendation=sanitize_rich_text(recommendation),
+                auditor_notes=sanitize_rich_text(auditor_notes),
+            ),
+            execution_options={"populate_existing": True},
+        )
+        response = result.one()
+        await self.db.commit()
+        dashboard_cache.invalidate_tenant(tenant_id)
+        return response
+
+    async def count_pending_for_tenant(self, tenant_id: UUID) -> int:
+        """Count pending/draft responses for a tenant across all projects."""
+        return await self.db.scalar(
+            select(func.count(ProjectResponse.id))
+            .join(Project, ProjectResponse.project_id == Project.id)
+            .where(
+                and_(
+                    Project.tenant_id == tenant_id,
+                    ProjectResponse.status.in_(
+                        [ResponseStatus.NOT_STARTED, ResponseStatus.DRAFT]
+                    ),
+                )
+            )
+        )
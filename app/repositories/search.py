@@ -0,0 +1,366 @@
+"""Ranked full-text search over a tenant's controls, findings, observations and evidence notes.
+
+Each searchable table has a generated ``search_vector`` column (see
+``SearchableMixin``) with a GIN index, weighted so that titles and findings
+outrank supporting text. A search parses the query with
+``websearch_to_tsquery`` (quoted phrases, ``or``, ``-word``), matches every
+source through its GIN index, ranks the matches with ``ts_rank_cd`` and keeps
+the best ``limit`` across all sources. Snippets are built with ``ts_headline``
+for those rows only, as it re-parses the text.
+
+Sources are scoped the way their pages are: controls by their framework's
+tenant, everything else by its project's tenant and, for auditors, to
+projects they own or are members of.
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from markupsafe import Markup, escape
+from sqlalchemy import Float, String, Uuid, func, literal, null, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.base import SEARCH_CONFIG
+from app.models.framework import Framework, FrameworkControl, FrameworkSection
+from app.models.health_check import (
+    AuditSession,
+    ControlInstanceEvidenceFile,
+    SessionControlInstance,
+    SessionControlObservation,
+    SessionControlObservationEvidence,
+)
+from app.models.project import (
+    Project,
+    ProjectEvidenceFile,
+    ProjectMember,
+    ProjectObservation,
+    ProjectResponse,
+)
+from app.models.user import User, UserRole
+
+# Result kinds, in the order the search page offers them as filters
+SEARCH_KINDS = {
+    "finding": "Findings",
+    "observation": "Observations",
+    "evidence": "Evidence notes",
+    "control": "Controls",
+}
+
+# ts_headline marks matches with these; SearchHit.snippet_html turns them
+# into <mark> after escaping the text around them
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    "MaxFragments=2, MaxWords=30, MinWords=12, FragmentDelimiter= … "
+)
+
+# ts_rank_cd normalization: divide by 1 + log(document length), so long
+# control text does not outrank a short finding that says the same
+RANK_NORMALIZATION = 1
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """One search result, with what its page link needs."""
+
+    kind: str
+    id: uuid.UUID
+    title: str
+    snippet: str
+    rank: float
+    context: str | None
+    project_id: uuid.UUID | None
+    review_scope_id: uuid.UUID | None
+    session_id: uuid.UUID | None
+    framework_id: uuid.UUID | None
+
+    @property
+    def url(self) -> str:
+        if self.framework_id is not None:
+            return f"/frameworks/{self.framework_id}"
+        if self.session_id is not None:
+            return (
+                f"/projects/{self.project_id}/review-scopes/{self.review_scope_id}"
+                f"/sessions/{self.session_id}"
+            )
+        return f"/projects/{self.project_id}"
+
+    @property
+    def snippet_html(self) -> Markup:
+        """The snippet, escaped, with matched words in ``<mark>``."""
+        html = str(escape(self.snippet))
+        return Markup(html.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>"))
+
+
+class SearchRepository:
+    """Full-text search across the searchable tables of one tenant."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        tenant_id: uuid.UUID,
+        query: str,
+        user: User | None = None,
+        kinds: list[str] | None = None,
+        limit: int = 50,
+    ) -> list[SearchHit]:
+        """The best ``limit`` matches for ``query``, best first.
+
+        ``kinds`` restricts the results to those ``SEARCH_KINDS``; a query
+        with no searchable words (empty, or only stop words) matches nothing.
+        """
+        if not query or not query.strip():
+            return []
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query.strip())
+        branches = [
+            branch
+            for kind, build in self._sources()
+            if not kinds or kind in kinds
+            for branch in build(tsquery, tenant_id, user)
+        ]
+        if not branches:
+            return []
+
+        hits = union_all(*branches).subquery("hits")
+        best = (
+            select(hits)
+            .order_by(hits.c.rank.desc(), hits.c.id)
+            .limit(limit)
+            .subquery("best")
+        )
+        # The headline is computed in the outer query, for the kept rows only
+        rows = self.db.execute(
+            select(
+                best.c.kind,
+                best.c.id,
+                best.c.title,
+                func.ts_headline(SEARCH_CONFIG, best.c.body, tsquery, HEADLINE_OPTIONS),
+                best.c.rank,
+                best.c.context,
+                best.c.project_id,
+                best.c.review_scope_id,
+                best.c.session_id,
+                best.c.framework_id,
+            ).order_by(best.c.rank.desc(), best.c.id)
+        ).all()
+        return [SearchHit(*row) for row in rows]
+
+    def _sources(self):
+        return (
+            ("control", self._controls),
+            ("finding", self._findings),
+            ("observation", self._observations),
+            ("evidence", self._evidence_notes),
+        )
+
+    @staticmethod
+    def _hit_columns(
+        kind: str,
+        model,
+        tsquery,
+        title,
+        body,
+        context,
+        project_id=None,
+        review_scope_id=None,
+        session_id=None,
+        framework_id=None,
+    ) -> list:
+        """The select list every branch of the union shares."""
+        no_id = null().cast(Uuid)
+        return [
+            literal(kind, String).label("kind"),
+            model.id.label("id"),
+            title.label("title"),
+            body.label("body"),
+            func.ts_rank_cd(model.search_vector, tsquery, RANK_NORMALIZATION)
+            .cast(Float)
+            .label("rank"),
+            context.label("context"),
+            (project_id if project_id is not None else no_id).label("project_id"),
+            (review_scope_id if review_scope_id is not None else no_id).label("review_scope_id"),
+            (session_id if session_id is not None else no_id).label("session_id"),
+            (framework_id if framework_id is not None else no_id).label("framework_id"),
+        ]
+
+    @staticmethod
+    def _project_access(tenant_id: uuid.UUID, user: User | None) -> list:
+        """WHERE clauses for the projects a user may see, as ``_list_filters`` applies."""
+        filters = [Project.tenant_id == tenant_id]
+        if user and user.role == UserRole.AUDITOR:
+            member_subq = select(ProjectMember.project_id).where(ProjectMember.user_id == user.id)
+            filters.append(or_(Project.owner_id == user.id, Project.id.in_(member_subq)))
+        return filters
+
+    def _project_hit_columns(self, kind: str, model, tsquery, body) -> list:
+        """Select list for a row of a standard project, titled by its framework control."""
+        return self._hit_columns(
+            kind,
+            model,
+            tsquery,
+            title=func.concat_ws(" ", FrameworkControl.control_id, FrameworkControl.name),
+            body=body,
+            context=Project.name,
+            project_id=Project.id,
+        )
+
+    def _session_hit_columns(self, kind: str, model, tsquery, body) -> list:
+        """Select list for a row of a health check session, titled by its control snapshot."""
+        return self._hit_columns(
+            kind,
+            model,
+            tsquery,
+            title=func.concat_ws(
+                " ",
+                SessionControlInstance.control_id_snapshot,
+                SessionControlInstance.control_title_snapshot,
+            ),
+            body=body,
+            context=Project.name,
+            project_id=Project.id,
+            review_scope_id=AuditSession.review_scope_id,
+            session_id=AuditSession.id,
+        )
+
+    def _controls(self, tsquery, tenant_id, user) -> list:
+        control = FrameworkControl
+        return [
+            select(
+                *self._hit_columns(
+                    "control",
+                    control,
+                    tsquery,
+                    title=func.concat_ws(" ", control.control_id, control.name),
+                    body=func.concat_ws(
+                        " ",
+                        control.description,
+                        control.requirements_text,
+                        control.implementation_guidance,
+                        control.testing_procedures_text,
+                        control.check_points_text,
+                    ),
+                    context=Framework.name,
+                    framework_id=Framework.id,
+                )
+            )
+            .join(FrameworkSection, FrameworkSection.id == control.framework_section_id)
+            .join(Framework, Framework.id == FrameworkSection.framework_id)
+            .where(control.search_vector.bool_op("@@")(tsquery), Framework.tenant_id == tenant_id)
+        ]
+
+    def _findings(self, tsquery, tenant_id, user) -> list:
+        response = ProjectResponse
+        body = func.concat_ws(
+            " ", response.finding, response.recommendation, response.response_text
+        )
+        return [
+            select(*self._project_hit_columns("finding", response, tsquery, body))
+            .join(Project, Project.id == response.project_id)
+            .join(FrameworkControl, FrameworkControl.id == response.framework_control_id)
+            .where(
+                response.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            )
+        ]
+
+    def _observations(self, tsquery, tenant_id, user) -> list:
+        project_observation = ProjectObservation
+        session_observation = SessionControlObservation
+        return [
+            select(
+                *self._project_hit_columns(
+                    "observation",
+                    project_observation,
+                    tsquery,
+                    func.concat_ws(
+                        " ",
+                        project_observation.observation_text,
+                        project_observation.recommendation_text,
+                    ),
+                )
+            )
+            .join(Project, Project.id == project_observation.project_id)
+            .join(FrameworkControl, FrameworkControl.id == project_observation.framework_control_id)
+            .where(
+                project_observation.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            ),
+            select(
+                *self._session_hit_columns(
+                    "observation",
+                    session_observation,
+                    tsquery,
+                    func.concat_ws(
+                        " ",
+                        session_observation.observation_text,
+                        session_observation.recommendation_text,
+                    ),
+                )
+            )
+            .join(
+                SessionControlInstance,
+                SessionControlInstance.id == session_observation.session_control_instance_id,
+            )
+            .join(AuditSession, AuditSession.id == SessionControlInstance.audit_session_id)
+            .join(Project, Project.id == AuditSession.project_id)
+            .where(
+                session_observation.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            ),
+        ]
+
+    def _evidence_notes(self, tsquery, tenant_id, user) -> list:
+        project_note = ProjectEvidenceFile
+        instance_note = ControlInstanceEvidenceFile
+        observation_note = SessionControlObservationEvidence
+        return [
+            select(
+                *self._project_hit_columns("evidence", project_note, tsquery, project_note.content)
+            )
+            .join(ProjectObservation, ProjectObservation.id == project_note.project_observation_id)
+            .join(Project, Project.id == ProjectObservation.project_id)
+            .join(FrameworkControl, FrameworkControl.id == ProjectObservation.framework_control_id)
+            .where(
+                project_note.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            ),
+            select(
+                *self._session_hit_columns(
+                    "evidence", instance_note, tsquery, instance_note.content
+                )
+            )
+            .join(
+                SessionControlInstance,
+                SessionControlInstance.id == instance_note.session_control_instance_id,
+            )
+            .join(AuditSession, AuditSession.id == SessionControlInstance.audit_session_id)
+            .join(Project, Project.id == AuditSession.project_id)
+            .where(
+                instance_note.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            ),
+            select(
+                *self._session_hit_columns(
+                    "evidence", observation_note, tsquery, observation_note.content
+                )
+            )
+            .join(
+                SessionControlObservation,
+                SessionControlObservation.id == observation_note.session_control_observation_id,
+            )
+            .join(
+                SessionControlInstance,
+                SessionControlInstance.id == SessionControlObservation.session_control_instance_id,
+            )
+            .join(AuditSession, AuditSession.id == SessionControlInstance.audit_session_id)
+            .join(Project, Project.id == AuditSession.project_id)
+            .where(
+                observation_note.search_vector.bool_op("@@")(tsquery),
+                *self._project_access(tenant_id, user),
+            ),
+        ]
@@ -0,0 +1,62 @@
+"""Repository for revoked session tokens."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.session_revocation import SessionRevocation
+from app.repositories.base import commit_or_flush
+
+
+class SessionRevocationRepository:
+    """Record and read session revocations."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _add(self, kind: str, subject: str, user_id: UUID) -> SessionRevocation:
+        max_age = timedelta(seconds=get_settings().session_cookie_max_age)
+        revocation = SessionRevocation(
+            kind=kind,
+            subject=subject,
+            user_id=user_id,
+            expires_at=datetime.now(timezone.utc) + max_age,
+        )
+        self.db.add(revocation)
+        commit_or_flush(self.db, revocation)
+        return revocation
+
+    def revoke_session(self, session_id: str, user_id: UUID) -> SessionRevocation:
+        """Revoke a single session token by its session id."""
+        return self._add("session", session_id, user_id)
+
+    def revoke_user(self, user_id: UUID) -> SessionRevocation:
+        """Revoke every token issued to a user up to now."""
+        return self._add("user", str(user_id), user_id)
+
+    def record_principal_change(self, user_id: UUID) -> SessionRevocation:
+        """Tell every worker to evict a user's cached principal (revokes nothing)."""
+        return self._add("principal", str(user_id), user_id)
+
+    def list_since(self, since: datetime | None) -> List[SessionRevocation]:
+        """Unexpired revocations created after ``since`` (all when None)."""
+        query = self.db.query(SessionRevocation).filter(
+            SessionRevocation.expires_at > datetime.now(timezone.utc)
+        )
+        if since is not None:
+            query = query.filter(SessionRevocation.created_at > since)
+        return query.order_by(SessionRevocation.created_at).all()
+
+    def purge_expired(self) -> int:
+        """Delete revocations whose tokens would have expired anyway."""
+        result = self.db.execute(
+            delete(SessionRevocation).where(
+                SessionRevocation.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        commit_or_flush(self.db)
+        return result.rowcount
@@ -3,11 +3,21 @@
 from typing import List
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
+from app.database import unit_of_work
 from app.models.user import User, UserRole
-from app.repositories.base import BaseRepository
-from app.utils.security import hash_password
+from app.repositories.base import BaseRepository, autocomplete_sort_key
+from app.repositories.pagination import Page, SortKey, paginate
+from app.repositories.read_models import UserListRow, UserSearchRow
+from app.repositories.session_revocation import SessionRevocationRepository
+from app.services.autocomplete_cache import autocomplete_cache, contains_pattern, normalize_query
+from app.services.principal_cache import principal_cache
+
+
+def _user_matches(row: UserSearchRow, query: str) -> bool:
+    """Whether a cached row matches a normalized query, as ``search`` filters."""
+    return query in row.full_name.lower() or query in row.email.lower()
 
 
 class UserRepository(BaseRepository[User]):
@@ -15,6 +25,11 @@ class UserRepository(BaseRepository[User]):
 
     model = User
 
+    LIST_SORT = SortKey("name", (User.full_name, User.id))
+
+    # Auditors offered by the share modal's autocomplete
+    SEARCH_LIMIT = 10
+
     def __init__(self, db: Session):
         super().__init__(db)
 
@@ -27,6 +42,23 @@ class UserRepository(BaseRepository[User]):
             .all()
         )
 
+    def list_user_rows(
+        self, tenant_id: UUID, cursor: str | None = None, limit: int | None = None
+    ) -> Page[UserListRow]:
+        """A page of ``get_all`` as list rows: only the columns the users table shows.
+
+        Raises ``InvalidCursor`` for a cursor not issued for this list.
+        """
+        query = select(
+            User.id,
+            User.email,
+            User.full_name,
+            User.role,
+            User.is_active,
+            User.auth_provider,
+        ).where(User.tenant_id == tenant_id)
+        return paginate(self.db, query, self.LIST_SORT, UserListRow, cursor, limit)
+
     def get_auditors(self, tenant_id: UUID) -> List[User]:
         """Get all auditor-role users for a tenant (for share modal)."""
         return (
@@ -36,22 +68,37 @@ class UserRepository(BaseRepository[User]):
             .all()
         )
 
-    def search(self, tenant_id: UUID, q: str) -> List[User]:
-        """Search auditors by name or email (for autocomplete)."""
-        term = f"%{q.lower()}%"
-        return (
-            self.db.query(User)
-            .filter(
-                and_(
-                    User.tenant_id == tenant_id,
-                    User.role == UserRole.AUDITOR,
-                    User.is_active == True,
-                    (User.full_name.ilike(term) | User.email.ilike(term)),
-                )
+    def search(self, tenant_id: UUID, q: str) -> List[UserSearchRow]:
+        """Search active auditors by name or email (for autocomplete).
+
+        Matches use the trigram indexes on ``full_name`` and ``email``;
+        results are cached per tenant and normalized query (see
+        ``autocomplete_cache``).
+        """
+        query = normalize_query(q)
+        if not query:
+            return []
+        cached = autocomplete_cache.get("users", tenant_id, query, _user_matches)
+        if cached is not None:
+            return cached
+
+        pattern = contains_pattern(query)
+        rows = self.db.execute(
+            select(User.id, User.full_name, User.email)
+            .where(
+                User.tenant_id == tenant_id,
+                User.role == UserRole.AUDITOR,
+                User.is_active == True,
+                User.full_name.ilike(pattern, escape="\\") | User.email.ilike(pattern, escape="\\"),
             )
-            .limit(10)
-            .all()
+            .order_by(autocomplete_sort_key(User.full_name, query), User.id)
+            .limit(self.SEARCH_LIMIT + 1)
+        ).all()
+        results = [UserSearchRow(*row) for row in rows[: self.SEARCH_LIMIT]]
+        autocomplete_cache.put(
+            "users", tenant_id, query, results, complete=len(rows) <= self.SEARCH_LIMIT
         )
+        return results
 
     def get_by_email(self, email: str) -> User | None:
         """Get a user by email (global — email must be unique)."""
@@ -63,20 +110,23 @@ class UserRepository(BaseRepository[User]):
         email: str,
         full_name: str,
         role: UserRole,
-        password: str,
+        password_hash: str,
     ) -> User:
-        """Create a new user with a hashed password."""
+        """Create a new user from an already-hashed password.
+
+        Hash with ``password_hasher.hash`` so bcrypt stays off the event loop.
+        """
         user = User(
             tenant_id=tenant_id,
             email=email,
             full_name=full_name,
             role=role,
-            password_hash=hash_password(password),
+            password_hash=password_hash,
             is_active=True,
         )
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self._commit(user)
+        autocomplete_cache.invalidate_tenant("users", tenant_id)
         return user
 
     def update_user(
@@ -87,7 +137,14 @@ class UserRepository(BaseRepository[User]):
         role: UserRole | None = None,
         is_active: bool | None = None,
     ) -> User | None:
-        """Update user fields."""
+        """Update user fields.
+
+        Evicts the user's cached principal when their name, role or active
+        flag changes so the next request sees the new values: here directly,
+        on other workers through a ``principal`` row on the revocation feed.
+        Deactivating a user also revokes every session token issued to them
+        so far. Both rows are written in the same transaction as the change.
+        """
         user = (
             self.db.query(User)
             .filter(and_(User.id == user_id, User.tenant_id == tenant_id))
@@ -95,12 +152,22 @@ class UserRepository(BaseRepository[User]):
         )
         if not user:
             return None
-        if full_name is not None:
-            user.full_name = full_name
-        if role is not None:
-            user.role = role
-        if is_active is not None:
-            user.is_active = is_active
-        self.db.commit()
-        self.db.refresh(user)
+        changed = False
+        with unit_of_work(self.db):
+            if full_name is not None and full_name != user.full_name:
+                user.full_name = full_name
+                changed = True
+            if role is not None and role != user.role:
+                user.role = role
+                changed = True
+            if is_active is not None and is_active != user.is_active:
+                user.is_active = is_active
+                changed = True
+                if not is_active:
+                    SessionRevocationRepository(self.db).revoke_user(user.id)
+            if changed:
+                SessionRevocationRepository(self.db).record_principal_change(user.id)
+        if changed:
+            principal_cache.invalidate(user.id)
+            autocomplete_cache.invalidate_tenant("users", tenant_id)
         return user
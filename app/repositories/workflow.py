@@ -3,8 +3,10 @@
 from typing import Any
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, literal
+from sqlalchemy.dialects.postgresql import JSONB, insert
 from app.models.workflow import WorkflowExecution, WorkflowExecutionStatus
+from app.repositories.base import commit_or_flush
 
 
 class WorkflowExecutionRepository:
@@ -27,18 +29,52 @@ class WorkflowExecutionRepository:
     def get_or_create(
         self, project_id: UUID, control_id: UUID
     ) -> WorkflowExecution:
-        """Get existing execution or create a new one."""
+        """Get existing execution or create a new one.
+
+        Reads first because nearly every call finds the row. A missing row is
+        inserted with ON CONFLICT DO NOTHING, so two first visits racing each
+        other cannot fail on the unique constraint; the loser re-reads.
+        """
         execution = self.get_for_project_control(project_id, control_id)
-        if not execution:
-            execution = WorkflowExecution(
-                project_id=project_id,
-                framework_control_id=control_id,
-                answers={},
-                status=WorkflowExecutionStatus.NOT_STARTED,
-            )
-            self.db.add(execution)
-            self.db.commit()
-            self.db.refresh(execution)
+        if execution is None:
+            execution = self.db.scalars(
+                insert(WorkflowExecution)
+                .values(
+                    project_id=project_id,
+                    framework_control_id=control_id,
+                    answers={},
+                    status=WorkflowExecutionStatus.NOT_STARTED,
+                )
+                .on_conflict_do_nothing(constraint="uq_workflow_project_control")
+                .returning(WorkflowExecution)
+            ).one_or_none()
+            commit_or_flush(self.db)
+            if execution is None:
+                execution = self.get_for_project_control(project_id, control_id)
+        return execution
+
+    def _upsert(self, project_id: UUID, control_id: UUID, **values) -> WorkflowExecution:
+        """Insert or update the execution in one statement and return the row.
+
+        ``values`` are written on insert and on conflict; ``answers`` on
+        conflict is merged into the stored answers rather than replacing them.
+        """
+        stmt = insert(WorkflowExecution).values(
+            project_id=project_id, framework_control_id=control_id, **values
+        )
+        updates = {key: stmt.excluded[key] for key in values}
+        updates["updated_at"] = func.now()
+        if values.get("answers"):
+            updates["answers"] = func.coalesce(
+                WorkflowExecution.answers, literal({}, JSONB)
+            ).op("||")(stmt.excluded.answers)
+        execution = self.db.scalars(
+            stmt.on_conflict_do_update(
+                constraint="uq_workflow_project_control", set_=updates
+            ).returning(WorkflowExecution),
+            execution_options={"populate_existing": True},
+        ).one()
+        commit_or_flush(self.db)
         return execution
 
     def upsert_answer(
@@ -52,28 +88,22 @@ class WorkflowExecutionRepository:
         generated_finding: str | None = None,
     ) -> WorkflowExecution:
         """Record an answer for a workflow node."""
-        execution = self.get_or_create(project_id, control_id)
-
-        # Merge the new answer into existing answers
-        answers = dict(execution.answers) if execution.answers else {}
-        answers[node_id] = answer
-
-        execution.answers = answers
-        execution.current_node_id = current_node_id
-        execution.status = status
-        execution.generated_finding = generated_finding
-
-        self.db.commit()
-        self.db.refresh(execution)
-        return execution
+        return self._upsert(
+            project_id,
+            control_id,
+            answers={node_id: answer},
+            current_node_id=current_node_id,
+            status=status,
+            generated_finding=generated_finding,
+        )
 
     def reset(self, project_id: UUID, control_id: UUID) -> WorkflowExecution:
         """Reset a workflow execution to start over."""
-        execution = self.get_or_create(project_id, control_id)
-        execution.answers = {}
-        execution.current_node_id = None
-        execution.status = WorkflowExecutionStatus.NOT_STARTED
-        execution.generated_finding = None
-        self.db.commit()
-        self.db.refresh(execution)
-        return execution
+        return self._upsert(
+            project_id,
+            control_id,
+            answers={},
+            current_node_id=None,
+            status=WorkflowExecutionStatus.NOT_STARTED,
+            generated_finding=None,
+        )
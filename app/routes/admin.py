@@ -1,13 +1,20 @@
 """Admin routes for template management."""
+import uuid
+
 from fastapi import APIRouter, Request, Depends, HTTPException, Form
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from sqlalchemy.orm import Session
+from app.config import get_settings
 from app.database import get_db
+from app.models.framework import FrameworkControl
 from app.models.user import UserRole
 from app.repositories.framework import FrameworkRepository
+from app.repositories.pagination import InvalidCursor
+from app.services.framework_catalog import framework_catalog_cache
 
 from app.templates import templates
+from app.utils.htmx import is_htmx_request
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -93,39 +100,53 @@ async def components_showcase_phase3(request: Request, db: Session = Depends(get
 
 
 @router.get("/controls", response_class=HTMLResponse)
-async def list_controls(request: Request, db: Session = Depends(get_db)):
-    """List all framework controls for editing."""
+async def list_controls(request: Request, db: Session = Depends(get_db), cursor: str | None = None):
+    """List the tenant's framework controls for editing, a page at a time.
+
+    HTMX requests with a cursor are the table's infinite scroll and get only
+    the next page of rows.
+    """
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
     if user.role != UserRole.ADMIN:
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    # Fetch all frameworks with controls
-    framework_repo = FrameworkRepository(db)
-    frameworks = framework_repo.get_all_with_sections(user.tenant_id)
-
-    # Flatten controls with section info
-    controls_list = []
-    for framework in frameworks:
-        for section in framework.sections:
-            for control in section.controls:
-                controls_list.append({
-                    "control": control,
-                    "section": section,
-                    "framework": framework,
-                })
-
+    try:
+        page = FrameworkRepository(db).list_control_rows(
+            user.tenant_id, cursor=cursor, limit=get_settings().list_page_size
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    template = (
+        "admin/_control_rows.html"
+        if cursor and is_htmx_request(request)
+        else "admin/controls_list.html"
+    )
     return templates.TemplateResponse(
-        "admin/controls_list.html",
+        template,
         {
             "request": request,
             "user": user,
-            "controls": controls_list,
+            "controls": page.items,
+            "next_cursor": page.next_cursor,
         },
     )
 
 
+def _get_control(db: Session, tenant_id, control_id: str) -> FrameworkControl:
+    """Load one of the tenant's controls with its section and framework, or 404."""
+    try:
+        control_uuid = uuid.UUID(control_id)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Control not found")
+    control = FrameworkRepository(db).get_control_with_framework(tenant_id, control_uuid)
+    if not control:
+        raise HTTPException(status_code=404, detail="Control not found")
+    return control
+
+
 @router.get("/controls/{control_id}/edit", response_class=HTMLResponse)
 async def edit_control(control_id: str, request: Request, db: Session = Depends(get_db)):
     """Edit control template (requirements, procedures, check points)."""
@@ -135,29 +156,9 @@ async def edit_control(control_id: str, request: Request, db: Session = Depends(
     if user.role != UserRole.ADMIN:
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    # Find the control
-    framework_repo = FrameworkRepository(db)
-    frameworks = framework_repo.get_all_with_sections(user.tenant_id)
-
-    control = None
-    section = None
-    framework = None
-
-    for fw in frameworks:
-        for sec in fw.sections:
-            for ctrl in sec.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    section = sec
-                    framework = fw
-                    break
-            if control:
-                break
-        if control:
-            break
-
-    if not control:
-        raise HTTPException(status_code=404, detail="Control not found")
+    control = _get_control(db, user.tenant_id, control_id)
+    section = control.section
+    framework = section.framework
 
     return templates.TemplateResponse(
         "admin/control_edit.html",
@@ -188,28 +189,9 @@ async def save_control(
         return RedirectResponse(url="/dashboard", status_code=302)
 
     # Find and update the control
-    framework_repo = FrameworkRepository(db)
-    frameworks = framework_repo.get_all_with_sections(user.tenant_id)
-
-    control = None
-    section = None
-    framework = None
-
-    for fw in frameworks:
-        for sec in fw.sections:
-            for ctrl in sec.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    section = sec
-                    framework = fw
-                    break
-            if control:
-                break
-        if control:
-            break
-
-    if not control:
-        raise HTTPException(status_code=404, detail="Control not found")
+    control = _get_control(db, user.tenant_id, control_id)
+    section = control.section
+    framework = section.framework
 
     # Update control
     control.requirements_text = requirements_text if requirements_text.strip() else None
@@ -217,6 +199,8 @@ async def save_control(
     control.check_points_text = check_points_text if check_points_text.strip() else None
 
     db.commit()
+    # Other workers see the bumped catalog revision on their next lookup
+    framework_catalog_cache.invalidate(framework.id)
 
     # Redirect back to edit page with success message
     import json
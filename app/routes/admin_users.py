@@ -1,15 +1,18 @@
 """User management routes (admin only)."""
 
-from fastapi import APIRouter, Request, Depends
+from fastapi import APIRouter, Request, Depends, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import UserRole
+from app.repositories.pagination import InvalidCursor
 from app.repositories.user import UserRepository
 from app.templates import templates
 from app.utils.htmx import htmx_toast
+from app.utils.security import PasswordHashPoolBusy, password_hasher
 
 router = APIRouter(prefix="/admin/users", tags=["admin-users"])
 
@@ -19,29 +22,42 @@ def _require_admin(user):
     return user is not None and user.role == UserRole.ADMIN
 
 
+def _users_page_context(
+    request: Request, user, repo: UserRepository, cursor: str | None = None
+) -> dict:
+    """Template context for a page of the users table."""
+    try:
+        page = repo.list_user_rows(
+            user.tenant_id, cursor=cursor, limit=get_settings().list_page_size
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"request": request, "user": user, "users": page.items, "next_cursor": page.next_cursor}
+
+
 @router.get("", response_class=HTMLResponse)
-async def list_users(request: Request, db: Session = Depends(get_db)):
-    """List all users in the tenant (admin only)."""
+async def list_users(request: Request, db: Session = Depends(get_db), cursor: str | None = None):
+    """List the tenant's users a page at a time (admin only).
+
+    HTMX requests with a cursor are the table's infinite scroll and get only
+    the next page of rows.
+    """
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
     if not _require_admin(user):
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    repo = UserRepository(db)
-    users = repo.get_all(user.tenant_id)
+    context = _users_page_context(request, user, UserRepository(db), cursor)
 
     is_htmx = request.headers.get("HX-Request") == "true"
     if is_htmx:
         return templates.TemplateResponse(
-            "admin/_users_table.html",
-            {"request": request, "user": user, "users": users},
+            "admin/_user_rows.html" if cursor else "admin/_users_table.html",
+            context,
         )
 
-    return templates.TemplateResponse(
-        "admin/users.html",
-        {"request": request, "user": user, "users": users},
-    )
+    return templates.TemplateResponse("admin/users.html", context)
 
 
 @router.get("/search", response_class=HTMLResponse)
@@ -121,18 +137,30 @@ async def create_user(request: Request, db: Session = Depends(get_db)):
             },
         )
 
+    try:
+        password_hash = await password_hasher.hash(password)
+    except PasswordHashPoolBusy:
+        return templates.TemplateResponse(
+            "admin/_user_form.html",
+            {
+                "request": request,
+                "user": user,
+                "edit_user": None,
+                "error": "The server is busy. Please try again in a moment.",
+            },
+        )
+
     repo.create_user(
         tenant_id=user.tenant_id,
         email=email,
         full_name=full_name,
         role=role,
-        password=password,
+        password_hash=password_hash,
     )
 
-    users = repo.get_all(user.tenant_id)
     return templates.TemplateResponse(
         "admin/_users_table.html",
-        {"request": request, "user": user, "users": users},
+        _users_page_context(request, user, repo),
         headers=htmx_toast("User created successfully"),
     )
 
@@ -169,10 +197,9 @@ async def approve_user(user_id: str, request: Request, db: Session = Depends(get
     repo = UserRepository(db)
     repo.update_user(tenant_id=user.tenant_id, user_id=user_id, is_active=True)
 
-    users = repo.get_all(user.tenant_id)
     return templates.TemplateResponse(
         "admin/_users_table.html",
-        {"request": request, "user": user, "users": users},
+        _users_page_context(request, user, repo),
         headers=htmx_toast("User approved"),
     )
 
@@ -209,9 +236,8 @@ async def update_user(user_id: str, request: Request, db: Session = Depends(get_
         is_active=is_active,
     )
 
-    users = repo.get_all(user.tenant_id)
     return templates.TemplateResponse(
         "admin/_users_table.html",
-        {"request": request, "user": user, "users": users},
+        _users_page_context(request, user, repo),
         headers=htmx_toast("User updated successfully"),
     )
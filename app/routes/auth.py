@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import secrets
@@ -17,7 +18,9 @@ from app.services.auth_service import (
     get_or_create_azure_user,
     initiate_azure_flow,
 )
-from app.utils.security import session_manager
+from app.services.login_throttle import login_throttle
+from app.services.session_revocation import revoke_session
+from app.utils.security import PasswordHashPoolBusy, session_manager
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 from app.templates import templates
@@ -44,21 +47,48 @@ async def login(
 ):
     """Handle login form submission."""
     normalized_email = email.strip().lower()
-    user = authenticate_user(email, password, db)
+    client_ip = getattr(request.state, "client_ip", "-")
 
-    if not user:
-        SECURITY_LOGGER.warning("login_failed email=%s", normalized_email)
+    def _login_error(message: str, status_code: int, headers: dict | None = None):
         return templates.TemplateResponse(
             "auth/login.html",
             {
                 "request": request,
-                "error": "Invalid email or password",
+                "error": message,
                 "azure_ad_enabled": settings.azure_ad_enabled,
             },
-            status_code=401,
-            headers=htmx_toast("Invalid email or password", "error")
+            status_code=status_code,
+            headers=htmx_toast(message, "error", headers),
         )
 
+    retry_after = login_throttle.retry_after(client_ip, normalized_email)
+    if retry_after:
+        SECURITY_LOGGER.warning(
+            "login_throttled email=%s retry_after=%s", normalized_email, retry_after
+        )
+        return _login_error(
+            "Too many failed sign-in attempts. Please try again later.",
+            429,
+            {"Retry-After": str(retry_after)},
+        )
+
+    try:
+        user = await authenticate_user(email, password, db)
+    except PasswordHashPoolBusy:
+        SECURITY_LOGGER.warning("login_hash_pool_busy email=%s", normalized_email)
+        return _login_error(
+            "The server is busy. Please try again in a moment.",
+            503,
+            {"Retry-After": "1"},
+        )
+
+    if not user:
+        login_throttle.record_failure(client_ip, normalized_email)
+        SECURITY_LOGGER.warning("login_failed email=%s", normalized_email)
+        return _login_error("Invalid email or password", 401)
+
+    login_throttle.record_success(normalized_email)
+
     # Create session token
     bind_log_context(user_id=user.id, tenant_id=user.tenant_id)
     SECURITY_LOGGER.info("login_success email=%s", user.email)
@@ -82,10 +112,16 @@ async def login(
 
 @router.post("/logout")
 async def logout(request: Request):
-    """Handle logout."""
+    """Handle logout and revoke the session token server-side."""
     user = getattr(request.state, "user", None)
     if user:
         bind_log_context(user_id=user.id, tenant_id=user.tenant_id)
+        token_data = session_manager.decode_token(
+            request.cookies.get(settings.session_cookie_name, "")
+        )
+        session_id = token_data.get("sid") if token_data else None
+        if session_id:
+            await asyncio.to_thread(revoke_session, session_id, user.id)
         SECURITY_LOGGER.info("logout_success")
     else:
         SECURITY_LOGGER.info("logout_without_authenticated_user")
@@ -106,7 +142,7 @@ async def azure_login(request: Request):
     if not settings.azure_ad_enabled:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    flow = initiate_azure_flow()
+    flow = await asyncio.to_thread(initiate_azure_flow)
     signed_flow = session_manager.create_token({"flow": json.dumps(flow)})
 
     response = RedirectResponse(url=flow["auth_uri"], status_code=302)
@@ -158,7 +194,7 @@ async def azure_callback(
     auth_response = dict(request.query_params)
 
     # Exchange code for tokens
-    claims = exchange_azure_code(flow, auth_response)
+    claims = await asyncio.to_thread(exchange_azure_code, flow, auth_response)
     if not claims:
         SECURITY_LOGGER.warning("azure_callback_token_exchange_failed")
         return _error_redirect("Failed to authenticate with Microsoft. Please try again.")
@@ -1,14 +1,16 @@
 """Client management routes."""
 
-from fastapi import APIRouter, Request, Depends, status
+from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.database import get_db
 from app.models import Client
 from app.models.user import UserRole
 from app.repositories import ClientRepository
+from app.repositories.pagination import InvalidCursor
 
 router = APIRouter(prefix="/clients", tags=["clients"])
 from app.templates import templates
@@ -22,9 +24,17 @@ def _require_admin(user) -> bool:
 
 @router.get("", response_class=HTMLResponse)
 async def list_clients(
-    request: Request, db: Session = Depends(get_db), industry: str | None = None, q: str | None = None
+    request: Request,
+    db: Session = Depends(get_db),
+    industry: str | None = None,
+    q: str | None = None,
+    cursor: str | None = None,
 ):
-    """List all clients for the authenticated tenant with optional filtering."""
+    """List the tenant's clients a page at a time, with optional filtering.
+
+    HTMX requests with a cursor are the table's infinite scroll and get the
+    next page of rows, like a filter update gets the first one.
+    """
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
@@ -33,10 +43,25 @@ async def list_clients(
 
     repo = ClientRepository(db)
 
-    # Use filter_clients with optional criteria
-    clients = repo.filter_clients(user.tenant_id, industry=industry, search=q)
+    # Use list_client_rows with optional criteria
+    try:
+        page = repo.list_client_rows(
+            user.tenant_id,
+            industry=industry,
+            search=q,
+            cursor=cursor,
+            limit=get_settings().list_page_size,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # Build active_filters dict for form pre-population and the next page's URL
+    active_filters = {
+        "industry": industry or "",
+        "q": q or "",
+    }
 
-    # Check if this is an HTMX request (filter update)
+    # Check if this is an HTMX request (filter update or next page)
     is_htmx = request.headers.get("HX-Request") == "true"
 
     if is_htmx:
@@ -46,25 +71,22 @@ async def list_clients(
             {
                 "request": request,
                 "user": user,
-                "clients": clients,
+                "clients": page.items,
+                "next_cursor": page.next_cursor,
+                "active_filters": active_filters,
             },
         )
 
     # Get distinct industries for filter dropdown
     distinct_industries = repo.get_distinct_industries(user.tenant_id)
 
-    # Build active_filters dict for form pre-population
-    active_filters = {
-        "industry": industry or "",
-        "q": q or "",
-    }
-
     return templates.TemplateResponse(
         "clients/list.html",
         {
             "request": request,
             "user": user,
-            "clients": clients,
+            "clients": page.items,
+            "next_cursor": page.next_cursor,
             "distinct_industries": distinct_industries,
             "active_filters": active_filters,
         },
@@ -0,0 +1,41 @@
+"""Evidence file routes (the blob store, served to the uploading tenant only)."""
+
+import asyncio
+
+from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi.responses import FileResponse, RedirectResponse
+
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.repositories.evidence_blob import EvidenceBlobRepository
+from app.services.evidence_store import evidence_store
+
+router = APIRouter(prefix="/evidence", tags=["evidence"])
+
+
+@router.get("/{file_name}")
+async def evidence_file(file_name: str, request: Request, db: Session = Depends(get_db)):
+    """Serve a stored evidence file (``<key><ext>``) to users of its tenant."""
+    user = getattr(request.state, "user", None)
+    if not user:
+        return RedirectResponse(url="/auth/login", status_code=302)
+
+    sha256 = file_name.partition(".")[0]
+    blob = EvidenceBlobRepository(db).get_for_tenant(user.tenant_id, sha256)
+    # Another tenant's blob is indistinguishable from a missing one
+    if not blob or file_name != f"{blob.sha256}{blob.extension}":
+        raise HTTPException(status_code=404, detail="Evidence not found")
+
+    path = evidence_store.path_for(blob.sha256, blob.extension)
+    if not await asyncio.to_thread(path.is_file):
+        raise HTTPException(status_code=404, detail="Evidence not found")
+
+    # A key always names the same bytes, so browsers may keep it
+    return FileResponse(
+        path,
+        headers={
+            "Cache-Control": "private, max-age=31536000, immutable",
+            "X-Content-Type-Options": "nosniff",
+        },
+    )
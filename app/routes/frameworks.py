@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Framework
 from app.repositories import FrameworkRepository
+from app.services.framework_catalog import framework_catalog_cache
 
 router = APIRouter(prefix="/frameworks", tags=["frameworks"])
 from app.templates import templates
@@ -42,8 +43,7 @@ async def detail_framework(
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    repo = FrameworkRepository(db)
-    framework = repo.get_by_id_with_sections(user.tenant_id, framework_id)
+    framework = framework_catalog_cache.get(db, user.tenant_id, framework_id)
 
     if not framework:
         return RedirectResponse(url="/frameworks", status_code=302)
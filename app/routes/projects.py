@@ -4,18 +4,21 @@ import json
 import uuid
 import os
 import shutil
-from pathlib import Path
-from fastapi import APIRouter, Request, Depends, UploadFile, File
+from fastapi import APIRouter, Request, Depends, File, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse, JSONResponse
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_async_db, get_db, unit_of_work
 from app.models import Project, ProjectStatus
 from app.models.project import ResponseStatus, ProjectType
 from app.models.health_check import ControlInstanceStatus
 from app.models.workflow import WorkflowExecutionStatus
 from app.repositories import (
+    AsyncHealthCheckRepository,
+    AsyncProjectRepository,
     ProjectRepository,
     ClientRepository,
     FrameworkRepository,
@@ -26,8 +29,13 @@ from app.repositories import (
     HealthCheckRepository,
 )
 from app.models.project import ProjectMember
+from app.repositories.pagination import InvalidCursor
 from app.models.user import UserRole
 from app.services import workflow_engine
+from app.services.framework_catalog import CatalogControl, framework_catalog_cache
+from app.services.evidence_store import evidence_store
+from app.services.evidence_upload import UploadError, read_evidence_form
+from app.services.health_check_stats import load_stats
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 from app.templates import templates
@@ -37,26 +45,11 @@ from app.utils.htmx import htmx_toast, is_htmx_request
 SERVER_DRAFT_MAX_BYTES = 1_000_000
 
 
-def compute_review_scope_rollup(stats: dict) -> str:
-    """Derive a single PASS/FAIL/DRAFT/NOT_STARTED verdict from aggregated stats.
-
-    Rules (in priority order):
-    - "fail"        — if any control instance is FAIL
-    - "pass"        — if nothing is not_started or draft (all resolved: pass+na)
-    - "draft"       — if some are pass/draft but not all resolved
-    - "not_started" — if no sessions exist or everything is not_started
-    """
-    if stats.get("fail", 0) > 0:
-        return "fail"
-    total = sum(stats.values())
-    if total == 0:
-        return "not_started"
-    unresolved = stats.get("not_started", 0) + stats.get("draft", 0)
-    if unresolved == 0:
-        return "pass"
-    if stats.get("pass", 0) > 0 or stats.get("draft", 0) > 0:
-        return "draft"
-    return "not_started"
+def _upload_error_response(exc: UploadError) -> HTMLResponse:
+    """A refused evidence upload: its status with the reason as an error toast."""
+    return HTMLResponse(
+        content=str(exc), status_code=exc.status_code, headers=htmx_toast(str(exc), "error")
+    )
 
 
 @router.get("", response_class=HTMLResponse)
@@ -67,8 +60,14 @@ async def list_projects(
     client_id: str | None = None,
     framework_id: str | None = None,
     q: str | None = None,
+    sort: str | None = None,
+    cursor: str | None = None,
 ):
-    """List all projects for the authenticated tenant with optional filtering."""
+    """List the tenant's projects, a page at a time, with optional filtering and sorting.
+
+    HTMX requests with a cursor are the table's infinite scroll and get only
+    the next page of rows.
+    """
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
@@ -83,33 +82,47 @@ async def list_projects(
         except ValueError:
             pass
 
-    # Use filter_projects with optional criteria (auditors see only own projects)
-    projects = repo.filter_projects(
-        user.tenant_id,
-        status=status_enum,
-        client_id=client_id if client_id and client_id.strip() else None,
-        framework_id=framework_id if framework_id and framework_id.strip() else None,
-        search=q,
-        user=user,
-    )
+    if sort not in ProjectRepository.LIST_SORTS:
+        sort = "recent"
 
-    # Check if this is an HTMX request (filter update)
+    # Use list_project_rows with optional criteria (auditors see only own projects)
+    try:
+        page = repo.list_project_rows(
+            user.tenant_id,
+            status=status_enum,
+            client_id=client_id if client_id and client_id.strip() else None,
+            framework_id=framework_id if framework_id and framework_id.strip() else None,
+            search=q,
+            user=user,
+            sort=sort,
+            cursor=cursor,
+            limit=get_settings().list_page_size,
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    projects = page.items
+
+    # Check if this is an HTMX request (filter update or next page)
     is_htmx = request.headers.get("HX-Request") == "true"
 
+    active_filters = {
+        "status": status or "",
+        "client_id": client_id or "",
+        "framework_id": framework_id or "",
+        "q": q or "",
+    }
+
     if is_htmx:
-        # Return just the table rows
+        # Return just the next page of rows (infinite scroll) or the table (filter update)
         return templates.TemplateResponse(
-            "projects/_projects_table.html",
+            "projects/_project_rows.html" if cursor else "projects/_projects_table.html",
             {
                 "request": request,
                 "user": user,
                 "projects": projects,
-                "active_filters": {
-                    "status": status or "",
-                    "client_id": client_id or "",
-                    "framework_id": framework_id or "",
-                    "q": q or "",
-                },
+                "next_cursor": page.next_cursor,
+                "sort": sort,
+                "active_filters": active_filters,
             },
         )
 
@@ -119,20 +132,14 @@ async def list_projects(
     all_clients = client_repo.get_all(user.tenant_id)
     all_frameworks = framework_repo.get_all(user.tenant_id)
 
-    # Build active_filters dict for form pre-population
-    active_filters = {
-        "status": status or "",
-        "client_id": client_id or "",
-        "framework_id": framework_id or "",
-        "q": q or "",
-    }
-
     return templates.TemplateResponse(
         "projects/list.html",
         {
             "request": request,
             "user": user,
             "projects": projects,
+            "next_cursor": page.next_cursor,
+            "sort": sort,
             "all_clients": all_clients,
             "all_frameworks": all_frameworks,
             "active_filters": active_filters,
@@ -197,31 +204,31 @@ async def create_project(request: Request, db: Session = Depends(get_db)):
         project_type = ProjectType.STANDARD_AUDIT
 
     repo = ProjectRepository(db)
-    project = repo.create(
-        tenant_id=user.tenant_id,
-        client_id=client_id,
-        framework_id=framework_id,
-        name=name,
-        description=form_data.get("description", ""),
-        status=status,
-        owner_id=user.id,
-        project_type=project_type,
-    )
-
-    # Refresh to get related objects
-    db.refresh(project, ["client", "framework"])
+    with unit_of_work(db):
+        project = repo.create(
+            tenant_id=user.tenant_id,
+            client_id=client_id,
+            framework_id=framework_id,
+            name=name,
+            description=form_data.get("description", ""),
+            status=status,
+            owner_id=user.id,
+            project_type=project_type,
+        )
 
-    # Auto-add review scopes for PCI DSS Health Check projects
-    if project_type == ProjectType.PCI_DSS_HEALTH_CHECK:
-        hc_repo = HealthCheckRepository(db)
-        review_scope_types = hc_repo.get_review_scope_types_for_framework(project.framework_id)
-        for i, review_scope_type in enumerate(review_scope_types):
-            hc_repo.add_review_scope_to_project(project.id, review_scope_type.id, sort_order=i)
+        # Auto-add review scopes for PCI DSS Health Check projects
+        if project_type == ProjectType.PCI_DSS_HEALTH_CHECK:
+            hc_repo = HealthCheckRepository(db)
+            review_scope_types = hc_repo.get_review_scope_types_for_framework(project.framework_id)
+            hc_repo.add_review_scopes_to_project(
+                project.id, [review_scope_type.id for review_scope_type in review_scope_types]
+            )
+        project_id = project.id
 
     # Redirect isn't natively caught by HTMX headers, so we set a cookie or
     # use hx-redirect instead, but since we're using RedirectResponse it will be a 200 via HTMX's transparent redirect.
     return RedirectResponse(
-        url=f"/projects/{project.id}",
+        url=f"/projects/{project_id}",
         status_code=303,
         headers=htmx_toast("Project created successfully")
     )
@@ -291,21 +298,24 @@ async def autosave_form_draft(
         return JSONResponse({"detail": "Draft payload is too large"}, status_code=413)
 
     repo = FormDraftRepository(db)
-    draft = repo.upsert(
-        tenant_id=user.tenant_id,
-        user_id=user.id,
-        draft_key=draft_key,
-        payload_json=payload_json,
-        path=path.strip() if isinstance(path, str) and path.strip() else None,
-        form_action=form_action.strip()
-        if isinstance(form_action, str) and form_action.strip()
-        else None,
-    )
+    with unit_of_work(db):
+        draft = repo.upsert(
+            tenant_id=user.tenant_id,
+            user_id=user.id,
+            draft_key=draft_key,
+            payload_json=payload_json,
+            path=path.strip() if isinstance(path, str) and path.strip() else None,
+            form_action=form_action.strip()
+            if isinstance(form_action, str) and form_action.strip()
+            else None,
+        )
+        # Read before the commit expires it; RETURNING already loaded it
+        updated_at = draft.updated_at
 
     return JSONResponse(
         {
             "ok": True,
-            "updated_at": draft.updated_at.isoformat() if draft.updated_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None,
         }
     )
 
@@ -434,6 +444,7 @@ async def delete_project(
 
     repo = ProjectRepository(db)
     success = repo.delete(user.tenant_id, project_id)
+    await evidence_store.collect(db)
 
     if success:
         return HTMLResponse("", headers=htmx_toast("Project deleted successfully"))
@@ -515,6 +526,7 @@ async def delete_segment(
 
     repo = ProjectRepository(db)
     success = repo.delete(user.tenant_id, segment_id)
+    await evidence_store.collect(db)
 
     if success:
         return HTMLResponse("", headers=htmx_toast("Segment deleted successfully"))
@@ -573,18 +585,9 @@ async def add_review_scope(
 
     # Re-render the review-scope grid
     review_scopes = hc_repo.get_review_scopes_for_project(project.id)
-
-    # Compute review-scope stats
-    review_scope_stats = {}
-    for review_scope in review_scopes:
-        stats = {s.value: 0 for s in ControlInstanceStatus}
-        for session in review_scope.sessions:
-            for inst in session.control_instances:
-                stats[inst.status.value] = stats.get(inst.status.value, 0) + 1
-        review_scope_stats[str(review_scope.id)] = stats
-
-    # Review-scope rollup
-    review_scope_rollup = {str(d.id): compute_review_scope_rollup(review_scope_stats[str(d.id)]) for d in review_scopes}
+    stats = load_stats(db, project_id=project.id)
+    review_scope_stats = {str(d.id): stats.for_review_scope(d.id) for d in review_scopes}
+    review_scope_rollup = {str(d.id): stats.rollup(d.id) for d in review_scopes}
 
     return templates.TemplateResponse(
         "projects/health_check/_review_scopes_grid.html",
@@ -623,21 +626,13 @@ async def remove_review_scope(
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
     hc_repo.remove_review_scope(review_scope_id)
+    await evidence_store.collect(db)
 
     # Re-render the review-scope grid
     review_scopes = hc_repo.get_review_scopes_for_project(project.id)
-
-    # Compute review-scope stats
-    review_scope_stats = {}
-    for review_scope in review_scopes:
-        stats = {s.value: 0 for s in ControlInstanceStatus}
-        for session in review_scope.sessions:
-            for inst in session.control_instances:
-                stats[inst.status.value] = stats.get(inst.status.value, 0) + 1
-        review_scope_stats[str(review_scope.id)] = stats
-
-    # Review-scope rollup
-    review_scope_rollup = {str(d.id): compute_review_scope_rollup(review_scope_stats[str(d.id)]) for d in review_scopes}
+    stats = load_stats(db, project_id=project.id)
+    review_scope_stats = {str(d.id): stats.for_review_scope(d.id) for d in review_scopes}
+    review_scope_rollup = {str(d.id): stats.rollup(d.id) for d in review_scopes}
 
     return templates.TemplateResponse(
         "projects/health_check/_review_scopes_grid.html",
@@ -680,7 +675,7 @@ async def download_evidence(
     if evidence.evidence_type != "file" or not evidence.file_path:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-    file_path = evidence.file_path.lstrip("/")
+    file_path = evidence_store.local_path(evidence.file_path)
     if not os.path.exists(file_path):
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -713,17 +708,11 @@ async def review_scope_detail(
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302,
                                 headers=htmx_toast("Review scope not found.", "error"))
 
-    # Compute per-session stats
-    session_stats = {}
-    for session in review_scope.sessions:
-        session_stats[str(session.id)] = hc_repo.get_session_stats(session.id)
-
-    # Aggregate review-scope stats for the rollup
-    aggregate_stats = {s.value: 0 for s in ControlInstanceStatus}
-    for sess_stats in session_stats.values():
-        for k, v in sess_stats.items():
-            aggregate_stats[k] = aggregate_stats.get(k, 0) + v
-    rollup_status = compute_review_scope_rollup(aggregate_stats)
+    # Per-session and review-scope stats from one query
+    stats = load_stats(db, review_scope_id=review_scope.id)
+    session_stats = {str(session.id): stats.for_session(session.id) for session in review_scope.sessions}
+    review_scope_counts = stats.for_review_scope(review_scope.id)
+    rollup_status = stats.rollup(review_scope.id)
 
     breadcrumbs = [
         {"label": "Projects", "url": "/projects"},
@@ -739,6 +728,7 @@ async def review_scope_detail(
             "project": project,
             "review_scope": review_scope,
             "session_stats": session_stats,
+            "review_scope_counts": review_scope_counts,
             "rollup_status": rollup_status,
             "breadcrumbs": breadcrumbs,
         },
@@ -807,23 +797,22 @@ async def create_session(
     asset_identifier = form_data.get("asset_identifier", "").strip() or None
     description = form_data.get("description", "").strip() or None
 
-    # Create session
-    session = hc_repo.create_session(
-        review_scope_id=uuid.UUID(review_scope_id),
-        project_id=uuid.UUID(project_id),
-        name=name,
-        asset_identifier=asset_identifier,
-        description=description,
-    )
-
-    # Seed control instances for this review scope's type
-    control_count = hc_repo.seed_control_instances(session, review_scope.review_scope_type_id)
+    # Create the session and seed control instances for this review scope's type together
+    with unit_of_work(db):
+        session = hc_repo.create_session(
+            review_scope_id=uuid.UUID(review_scope_id),
+            project_id=uuid.UUID(project_id),
+            name=name,
+            asset_identifier=asset_identifier,
+            description=description,
+        )
+        control_count = hc_repo.seed_control_instances(session, review_scope.review_scope_type_id)
+        session_id = session.id
 
     # Reload the review scope and compute stats
     review_scope = hc_repo.get_review_scope_with_sessions(uuid.UUID(review_scope_id))
-    session_stats = {}
-    for s in review_scope.sessions:
-        session_stats[str(s.id)] = hc_repo.get_session_stats(s.id)
+    stats = load_stats(db, review_scope_id=review_scope.id)
+    session_stats = {str(s.id): stats.for_session(s.id) for s in review_scope.sessions}
 
     response = templates.TemplateResponse(
         "projects/health_check/_sessions_list.html",
@@ -835,7 +824,7 @@ async def create_session(
             "session_stats": session_stats,
         },
     )
-    response.headers["HX-Redirect"] = f"/projects/{project_id}/review-scopes/{review_scope_id}/sessions/{session.id}"
+    response.headers["HX-Redirect"] = f"/projects/{project_id}/review-scopes/{review_scope_id}/sessions/{session_id}"
     response.headers.update(htmx_toast(f"Session created with {control_count} controls"))
     return response
 
@@ -867,12 +856,12 @@ async def delete_session(
         return RedirectResponse(url=f"/projects/{project_id}/review-scopes/{review_scope_id}", status_code=302)
 
     hc_repo.delete_session(uuid.UUID(session_id))
+    await evidence_store.collect(db)
 
     # Reload the review scope and compute stats
     review_scope = hc_repo.get_review_scope_with_sessions(uuid.UUID(review_scope_id))
-    session_stats = {}
-    for s in review_scope.sessions:
-        session_stats[str(s.id)] = hc_repo.get_session_stats(s.id)
+    stats = load_stats(db, review_scope_id=review_scope.id)
+    session_stats = {str(s.id): stats.for_session(s.id) for s in review_scope.sessions}
 
     return templates.TemplateResponse(
         "projects/health_check/_sessions_list.html",
@@ -889,21 +878,21 @@ async def delete_session(
 
 @router.get("/{project_id}/review-scopes/{review_scope_id}/sessions/{session_id}", response_class=HTMLResponse)
 async def session_detail(
-    project_id: str, review_scope_id: str, session_id: str, request: Request, db: Session = Depends(get_db)
+    project_id: str, review_scope_id: str, session_id: str, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """Show session detail page with two-panel control assessment."""
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    repo = ProjectRepository(db)
-    project = repo.get_by_id_with_details(user.tenant_id, uuid.UUID(project_id))
+    repo = AsyncProjectRepository(db)
+    project = await repo.get_by_id_with_framework_tree(user.tenant_id, uuid.UUID(project_id))
 
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    hc_repo = HealthCheckRepository(db)
-    session = hc_repo.get_session_by_id(uuid.UUID(session_id))
+    hc_repo = AsyncHealthCheckRepository(db)
+    session = await hc_repo.get_session_by_id(uuid.UUID(session_id))
 
     if not session or session.review_scope.project_id != project.id:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302,
@@ -917,10 +906,10 @@ async def session_detail(
                                 headers=htmx_toast("Session not found.", "error"))
 
     # Load control instances
-    control_instances = hc_repo.get_control_instances_for_session(session_id)
+    control_instances = await hc_repo.get_control_instances_for_session(session.id)
 
     # Calculate stats
-    stats = hc_repo.get_session_stats(session_id)
+    stats = await hc_repo.get_session_stats(session.id)
 
     breadcrumbs = [
         {"label": "Projects", "url": "/projects"},
@@ -946,21 +935,21 @@ async def session_detail(
 
 @router.get("/{project_id}/review-scopes/{review_scope_id}/sessions/{session_id}/controls/{instance_id}/panel", response_class=HTMLResponse)
 async def get_control_panel(
-    project_id: str, review_scope_id: str, session_id: str, instance_id: str, request: Request, db: Session = Depends(get_db)
+    project_id: str, review_scope_id: str, session_id: str, instance_id: str, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """Get control assessment panel for a specific control instance."""
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    repo = ProjectRepository(db)
-    project = repo.get_by_id_with_details(user.tenant_id, uuid.UUID(project_id))
+    repo = AsyncProjectRepository(db)
+    project = await repo.get_by_id_with_details(user.tenant_id, uuid.UUID(project_id))
 
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    hc_repo = HealthCheckRepository(db)
-    instance = hc_repo.get_control_instance_with_observations(uuid.UUID(instance_id))
+    hc_repo = AsyncHealthCheckRepository(db)
+    instance = await hc_repo.get_control_instance_with_observations(uuid.UUID(instance_id))
 
     if not instance or instance.audit_session.project_id != project.id:
         return HTMLResponse("", status_code=204,
@@ -989,21 +978,21 @@ async def get_control_panel(
 
 @router.post("/{project_id}/review-scopes/{review_scope_id}/sessions/{session_id}/controls/{instance_id}", response_class=HTMLResponse)
 async def update_control(
-    project_id: str, review_scope_id: str, session_id: str, instance_id: str, request: Request, db: Session = Depends(get_db)
+    project_id: str, review_scope_id: str, session_id: str, instance_id: str, request: Request, db: AsyncSession = Depends(get_async_db)
 ):
     """Update control instance status and notes."""
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    repo = ProjectRepository(db)
-    project = repo.get_by_id_with_details(user.tenant_id, uuid.UUID(project_id))
+    repo = AsyncProjectRepository(db)
+    project = await repo.get_by_id_with_details(user.tenant_id, uuid.UUID(project_id))
 
     if not project:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    hc_repo = HealthCheckRepository(db)
-    instance = hc_repo.get_control_instance_by_id(uuid.UUID(instance_id))
+    hc_repo = AsyncHealthCheckRepository(db)
+    instance = await hc_repo.get_control_instance_by_id(uuid.UUID(instance_id))
 
     if not instance or instance.audit_session.project_id != project.id:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
@@ -1023,8 +1012,8 @@ async def update_control(
         status = ControlInstanceStatus.NOT_STARTED
 
     # Update the instance
-    hc_repo.update_control_instance(instance_id, status, notes, user.id)
-    instance = hc_repo.get_control_instance_with_observations(uuid.UUID(instance_id))
+    await hc_repo.update_control_instance(instance.id, status, notes, user.id)
+    instance = await hc_repo.get_control_instance_with_observations(instance.id)
 
     session = instance.audit_session
     review_scope = session.review_scope
@@ -1125,42 +1114,33 @@ async def create_evidence(
     if not instance or instance.audit_session_id != session.id:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-    form_data = await request.form()
-    evidence_type = (form_data.get("evidence_type") or "").strip()
+    try:
+        form = await read_evidence_form(request, evidence_store.staging_dir)
+    except UploadError as exc:
+        return _upload_error_response(exc)
+    evidence_type = form.get("evidence_type").strip()
 
     if evidence_type == "text_note":
-        content = form_data.get("content", "").strip()
+        await form.discard()
+        content = form.get("content").strip()
         if not content:
             return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
         hc_repo.add_text_evidence(instance.id, content)
 
     elif evidence_type == "file":
-        file = form_data.get("file")
-        if not file or not isinstance(file, UploadFile):
-            return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
-
-        # Validate file extension
-        allowed_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
-        file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in allowed_extensions:
+        upload = form.file
+        if not upload:
             return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-        # Create upload directory
-        upload_dir = Path(f"static/uploads/health_check/{session_id}")
-        upload_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save file
-        file_id = str(uuid.uuid4())
-        file_path = upload_dir / f"{file_id}{file_ext}"
-        file_contents = await file.read()
-        file_size = len(file_contents)
-
-        with open(file_path, "wb") as f:
-            f.write(file_contents)
+        # Keep the streamed file in the blob store (reusing an identical stored file)
+        with unit_of_work(db):
+            blob_sha256, file_path = await evidence_store.store(db, upload, user.tenant_id)
+            hc_repo.add_file_evidence(
+                instance.id, upload.filename, file_path, upload.size, blob_sha256=blob_sha256
+            )
 
-        # Store as relative path with leading /
-        relative_path = f"/{file_path}"
-        hc_repo.add_file_evidence(instance.id, file.filename, relative_path, file_size)
+    else:
+        await form.discard()
 
     # Reload instance with updated evidence
     instance = hc_repo.get_control_instance_by_id(instance.id)
@@ -1171,6 +1151,7 @@ async def create_evidence(
             "request": request,
             "user": user,
             "project": project,
+            "session": session,
             "instance": instance,
         },
         headers=htmx_toast("Evidence added"),
@@ -1200,8 +1181,8 @@ async def delete_evidence(
 
     instance = evidence.control_instance
 
-    # Delete file from disk if it's a file type
-    if evidence.evidence_type == "file" and evidence.file_path:
+    # Delete file from disk if it's a file type stored before the blob store
+    if evidence.evidence_type == "file" and evidence.file_path and not evidence.blob_sha256:
         file_path = evidence.file_path.lstrip("/")
         if os.path.exists(file_path):
             try:
@@ -1209,8 +1190,9 @@ async def delete_evidence(
             except Exception:
                 pass
 
-    # Delete the evidence record
+    # Delete the evidence record, then its blob if nothing else uses it
     hc_repo.delete_evidence(evidence_id)
+    await evidence_store.collect(db)
 
     # Reload instance with updated evidence list
     instance = hc_repo.get_control_instance_by_id(instance.id)
@@ -1221,6 +1203,7 @@ async def delete_evidence(
             "request": request,
             "user": user,
             "project": project,
+            "session": instance.audit_session,
             "instance": instance,
         },
         headers=htmx_toast("Evidence removed"),
@@ -1264,10 +1247,9 @@ async def update_control_with_observations(
     except ValueError:
         status = ControlInstanceStatus.NOT_STARTED
 
-    # Update the instance
-    hc_repo.update_control_instance(instance_id, status, notes, user.id)
-
-    # Handle observation updates and new observations
+    # Collect observation updates and new observations
+    new_observations = []
+    recommendations = {}
     idx = 0
     while True:
         obs_is_new = form_data.get(f"observation_{idx}_is_new")
@@ -1278,33 +1260,35 @@ async def update_control_with_observations(
             obs_rec = form_data.get(f"observation_{idx}_recommendation", "").strip() or None
             obs_note = form_data.get(f"observation_{idx}_note", "").strip() or None
             if obs_text:
-                new_obs = hc_repo.create_observation(instance.id, obs_text, obs_rec)
-                if obs_note:
-                    hc_repo.add_observation_text_note(new_obs.id, obs_note)
+                new_observations.append((obs_text, obs_rec, obs_note))
         elif obs_is_new == "false":
             obs_id_str = form_data.get(f"observation_{idx}_id")
             obs_rec = form_data.get(f"observation_{idx}_recommendation", "").strip() or None
             if obs_id_str:
-                hc_repo.update_observation_recommendation(uuid.UUID(obs_id_str), obs_rec)
+                recommendations[uuid.UUID(obs_id_str)] = obs_rec
         idx += 1
 
-    # Reload instance with updated observations
-    instance = hc_repo.get_control_instance_with_observations(instance.id)
-    review_scope = hc_repo.get_review_scope_with_sessions(uuid.UUID(review_scope_id))
+    # One transaction; the panel renders from the flushed objects before the
+    # commit expires them, so no reload of the instance is needed
+    with unit_of_work(db):
+        hc_repo.save_control_assessment(
+            instance, status, notes, user.id, new_observations, recommendations
+        )
+        review_scope = hc_repo.get_review_scope_with_sessions(uuid.UUID(review_scope_id))
 
-    return templates.TemplateResponse(
-        "projects/health_check/_control_panel.html",
-        {
-            "request": request,
-            "user": user,
-            "project": project,
-            "review_scope": review_scope,
-            "session": session,
-            "instance": instance,
-            "observations": instance.observations,
-        },
-        headers=htmx_toast("Assessment saved"),
-    )
+        return templates.TemplateResponse(
+            "projects/health_check/_control_panel.html",
+            {
+                "request": request,
+                "user": user,
+                "project": project,
+                "review_scope": review_scope,
+                "session": session,
+                "instance": instance,
+                "observations": instance.observations,
+            },
+            headers=htmx_toast("Assessment saved"),
+        )
 
 
 @router.delete("/{project_id}/review-scopes/{review_scope_id}/sessions/{session_id}/observations/{obs_id}", response_class=HTMLResponse)
@@ -1330,8 +1314,9 @@ async def delete_observation(
 
     instance = obs.control_instance
 
-    # Delete the observation
+    # Delete the observation, then blobs only its images used
     hc_repo.delete_observation(uuid.UUID(obs_id))
+    await evidence_store.collect(db)
 
     # Reload instance with updated observations
     instance = hc_repo.get_control_instance_with_observations(instance.id)
@@ -1454,35 +1439,21 @@ async def add_observation_image_evidence(
     if not obs or obs.control_instance.audit_session_id != uuid.UUID(session_id):
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-    form_data = await request.form()
-    file = form_data.get("file")
-
-    if not file or not isinstance(file, UploadFile):
-        return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
-
-    # Validate file extension
-    allowed_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
-    file_ext = Path(file.filename).suffix.lower()
+    try:
+        form = await read_evidence_form(request, evidence_store.staging_dir)
+    except UploadError as exc:
+        return _upload_error_response(exc)
+    upload = form.file
 
-    if file_ext not in allowed_extensions:
+    if not upload:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-    # Create upload directory
-    upload_dir = Path(f"static/uploads/health_check/{session_id}")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save file
-    file_id = str(uuid.uuid4())
-    file_path = upload_dir / f"{file_id}{file_ext}"
-    file_contents = await file.read()
-    file_size = len(file_contents)
-
-    with open(file_path, "wb") as f:
-        f.write(file_contents)
-
-    # Store as relative path with leading /
-    relative_path = f"/{file_path}"
-    hc_repo.add_observation_image(uuid.UUID(obs_id), file.filename, relative_path, file_size)
+    # Keep the streamed file in the blob store (reusing an identical stored file)
+    with unit_of_work(db):
+        blob_sha256, file_path = await evidence_store.store(db, upload, user.tenant_id)
+        hc_repo.add_observation_image(
+            uuid.UUID(obs_id), upload.filename, file_path, upload.size, blob_sha256=blob_sha256
+        )
 
     # Reload observation with updated evidence
     obs = hc_repo.get_observation_by_id(uuid.UUID(obs_id))
@@ -1532,8 +1503,8 @@ async def delete_observation_evidence(
     if not ev:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
-    # Delete file from disk if it's an image type
-    if ev.evidence_type == "image" and ev.file_path:
+    # Delete file from disk if it's an image stored before the blob store
+    if ev.evidence_type == "image" and ev.file_path and not ev.blob_sha256:
         file_path = ev.file_path.lstrip("/")
         if os.path.exists(file_path):
             try:
@@ -1541,8 +1512,9 @@ async def delete_observation_evidence(
             except Exception:
                 pass
 
-    # Delete the evidence record
+    # Delete the evidence record, then its blob if nothing else uses it
     hc_repo.delete_observation_evidence(uuid.UUID(ev_id))
+    await evidence_store.collect(db)
 
     # Reload observation with updated evidence
     obs = hc_repo.get_observation_by_id(uuid.UUID(obs_id))
@@ -1576,20 +1548,7 @@ async def get_control_row(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    # Load framework with sections and controls
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-
-    # Find the control in the framework
-    control = None
-    if framework:
-        for section in framework.sections:
-            for ctrl in section.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    break
-            if control:
-                break
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
 
     if not control:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
@@ -1626,20 +1585,7 @@ async def get_control_response_form(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    # Load framework with sections and controls
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-
-    # Find the control in the framework
-    control = None
-    if framework:
-        for section in framework.sections:
-            for ctrl in section.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    break
-            if control:
-                break
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
 
     if not control:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
@@ -1699,20 +1645,7 @@ async def save_control_response(
         auditor_notes=auditor_notes,
     )
 
-    # Load framework with sections and controls to get the control
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-
-    # Find the control in the framework
-    control = None
-    if framework:
-        for section in framework.sections:
-            for ctrl in section.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    break
-            if control:
-                break
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
 
     if not control:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
@@ -1731,15 +1664,12 @@ async def save_control_response(
     )
 
 
-def _find_control(framework, control_id: str):
-    """Find a control in a framework by its UUID string."""
-    if not framework:
-        return None
-    for section in framework.sections:
-        for ctrl in section.controls:
-            if str(ctrl.id) == control_id:
-                return ctrl
-    return None
+def _find_control(
+    db: Session, tenant_id, framework_id, control_id: str
+) -> CatalogControl | None:
+    """Find a control of a tenant's framework by its UUID string in the cached catalog."""
+    catalog = framework_catalog_cache.get(db, tenant_id, framework_id)
+    return catalog.get_control(control_id) if catalog else None
 
 
 @router.get("/{project_id}/controls/{control_id}/assessment", response_class=HTMLResponse)
@@ -1756,9 +1686,7 @@ async def get_control_assessment(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control or not control.assessment_checklist:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -1793,9 +1721,7 @@ async def submit_assessment_choice(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control or not control.assessment_checklist:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -1860,9 +1786,7 @@ async def get_control_workflow(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -1926,9 +1850,7 @@ async def submit_workflow_answer(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control or not control.workflow_definition:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -2019,9 +1941,7 @@ async def reset_workflow(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control or not control.workflow_definition:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -2070,9 +1990,7 @@ async def get_workflow_step(
     if not project:
         return RedirectResponse(url="/projects", status_code=302)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    control = _find_control(framework, control_id)
+    control = _find_control(db, user.tenant_id, project.framework_id, control_id)
     if not control or not control.workflow_definition:
         return RedirectResponse(url=f"/projects/{project_id}", status_code=302)
 
@@ -2137,24 +2055,14 @@ async def detail_project(
         review_scopes = hc_repo.get_review_scopes_for_project(project.id)
         total_sessions = sum(len(d.sessions) for d in review_scopes)
 
-        # Compute review-scope stats (pass/fail/not_started counts)
-        review_scope_stats = {}
-        for review_scope in review_scopes:
-            stats = {s.value: 0 for s in ControlInstanceStatus}
-            for session in review_scope.sessions:
-                for inst in session.control_instances:
-                    stats[inst.status.value] = stats.get(inst.status.value, 0) + 1
-            review_scope_stats[str(review_scope.id)] = stats
-
-        # Review-scope rollup: single status per review scope
-        review_scope_rollup = {str(d.id): compute_review_scope_rollup(review_scope_stats[str(d.id)]) for d in review_scopes}
+        # Review-scope stats (pass/fail/not_started counts) and rollup from one query
+        stats = load_stats(db, project_id=project.id)
+        review_scope_stats = {str(d.id): stats.for_review_scope(d.id) for d in review_scopes}
+        review_scope_rollup = {str(d.id): stats.rollup(d.id) for d in review_scopes}
 
         # Project-level assessed %
-        total_instances = sum(sum(stats.values()) for stats in review_scope_stats.values())
-        assessed_instances = sum(
-            stats.get("pass", 0) + stats.get("fail", 0) + stats.get("na", 0) + stats.get("draft", 0)
-            for stats in review_scope_stats.values()
-        )
+        total_instances = sum(stats.project.values())
+        assessed_instances = total_instances - stats.project["not_started"]
         assessed_pct = round(assessed_instances / total_instances * 100) if total_instances > 0 else 0
         review_scopes_pass = sum(1 for s in review_scope_rollup.values() if s == "pass")
 
@@ -2180,42 +2088,9 @@ async def detail_project(
 
     # Check if this is a parent project with segments
     if project.segments:
-        # Parent project view: show segments
-        segments = repo.get_children(user.tenant_id, project.id)
-
-        # Calculate progress for each segment
-        segments_with_progress = []
-        response_repo = ProjectResponseRepository(db)
-        framework_repo = FrameworkRepository(db)
-
-        for segment in segments:
-            framework = framework_repo.get_by_id_with_sections(
-                user.tenant_id, segment.framework_id
-            )
-            all_responses = response_repo.get_for_project(segment.id)
-
-            total_controls = 0
-            responded_count = 0
-            if framework:
-                for section in framework.sections:
-                    total_controls += len(section.controls)
-                    for control in section.controls:
-                        if any(r.framework_control_id == control.id for r in all_responses):
-                            responded_count += 1
-
-            progress_pct = (
-                (responded_count / total_controls * 100)
-                if total_controls > 0
-                else 0
-            )
-            segments_with_progress.append(
-                {
-                    "segment": segment,
-                    "total_controls": total_controls,
-                    "responded_count": responded_count,
-                    "progress_pct": progress_pct,
-                }
-            )
+        # Parent project view: show segments with their progress, one
+        # grouped query however many segments there are
+        segments_with_progress = repo.segment_progress(user.tenant_id, project.id)
 
         return templates.TemplateResponse(
             "projects/detail_parent.html",
@@ -2228,9 +2103,8 @@ async def detail_project(
         )
     else:
         # Segment (or standalone project) view: show controls
-        # Load framework with sections and controls
-        framework_repo = FrameworkRepository(db)
-        framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
+        # Cached framework catalog (sections and controls)
+        framework = framework_catalog_cache.get(db, user.tenant_id, project.framework_id)
 
         # Load all responses for the project
         response_repo = ProjectResponseRepository(db)
@@ -2241,11 +2115,10 @@ async def detail_project(
         total_controls = 0
         responded_count = 0
         if framework:
-            for section in framework.sections:
-                total_controls += len(section.controls)
-                for control in section.controls:
-                    if str(control.id) in responses_dict:
-                        responded_count += 1
+            total_controls = framework.control_count
+            responded_count = sum(
+                1 for resp in all_responses if resp.framework_control_id in framework.control_ids
+            )
 
         progress_pct = (responded_count / total_controls * 100) if total_controls > 0 else 0
 
@@ -2278,20 +2151,9 @@ async def get_control_details(
     if not project:
         return HTMLResponse(content="Project not found", status_code=404)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-    
-    control = None
-    section_name = "Section"
-    if framework:
-        for section in framework.sections:
-            for ctrl in section.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    section_name = section.name
-                    break
-            if control:
-                break
+    catalog = framework_catalog_cache.get(db, user.tenant_id, project.framework_id)
+    control = catalog.get_control(control_id) if catalog else None
+    section_name = catalog.section_of(control).name if control else "Section"
 
     if not control:
         return HTMLResponse(content="Control not found", status_code=404)
@@ -2385,20 +2247,9 @@ async def save_control_details(
         status = ResponseStatus.DRAFT
         response_repo.upsert(project.id, uuid.UUID(control_id), response_text, status)
 
-    framework_repo = FrameworkRepository(db)
-    framework = framework_repo.get_by_id_with_sections(user.tenant_id, project.framework_id)
-
-    control = None
-    section_name = "Section"
-    if framework:
-        for section in framework.sections:
-            for ctrl in section.controls:
-                if str(ctrl.id) == control_id:
-                    control = ctrl
-                    section_name = section.name
-                    break
-            if control:
-                break
+    catalog = framework_catalog_cache.get(db, user.tenant_id, project.framework_id)
+    control = catalog.get_control(control_id) if catalog else None
+    section_name = catalog.section_of(control).name if control else "Section"
 
     response = response_repo.get_by_control(project.id, control.id)
 
@@ -2471,6 +2322,7 @@ async def delete_project_observation(
     from app.repositories.observation import ProjectObservationRepository
     obs_repo = ProjectObservationRepository(db)
     success = obs_repo.delete_observation(observation_id)
+    await evidence_store.collect(db)
 
     if success:
         return HTMLResponse(content="Observation deleted", status_code=200, headers=htmx_toast("Observation deleted successfully"))
@@ -2532,36 +2384,25 @@ async def add_image_evidence(
     project_id: str, observation_id: str, request: Request, db: Session = Depends(get_db)
 ):
     """Upload an image as evidence for an observation."""
-    import os, shutil
-    from fastapi import UploadFile
     user = getattr(request.state, "user", None)
     if not user:
         return RedirectResponse(url="/auth/login", status_code=302)
 
-    form_data = await request.form()
-    file: UploadFile = form_data.get("file")
-    if not file or not file.filename:
+    try:
+        form = await read_evidence_form(request, evidence_store.staging_dir)
+    except UploadError as exc:
+        return _upload_error_response(exc)
+    upload = form.file
+    if not upload:
         return HTMLResponse(content="File required", status_code=400)
 
-    allowed = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"}
-    ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in allowed:
-        return HTMLResponse(content="Unsupported file type", status_code=400)
-
-    upload_dir = "static/uploads/evidence"
-    os.makedirs(upload_dir, exist_ok=True)
-    safe_name = f"{uuid.uuid4()}{ext}"
-    dest = os.path.join(upload_dir, safe_name)
-
-    with open(dest, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-
-    file_size = os.path.getsize(dest)
-    file_path = f"/static/uploads/evidence/{safe_name}"
-
     from app.repositories.observation import ProjectObservationRepository
     obs_repo = ProjectObservationRepository(db)
-    obs_repo.add_image(observation_id, file.filename, file_path, file_size)
+    with unit_of_work(db):
+        blob_sha256, file_path = await evidence_store.store(db, upload, user.tenant_id)
+        obs_repo.add_image(
+            observation_id, upload.filename, file_path, upload.size, blob_sha256=blob_sha256
+        )
     observation = obs_repo.get_observation(observation_id)
 
     return templates.TemplateResponse(
@@ -2586,14 +2427,15 @@ async def delete_evidence(
     from app.models.project import ProjectEvidenceFile
     obs_repo = ProjectObservationRepository(db)
 
-    # Delete file from disk if image
+    # Delete file from disk if an image stored before the blob store
     evidence = db.query(ProjectEvidenceFile).filter(ProjectEvidenceFile.id == evidence_id).first()
-    if evidence and evidence.evidence_type == "image" and evidence.file_path:
+    if evidence and evidence.evidence_type == "image" and evidence.file_path and not evidence.blob_sha256:
         disk_path = evidence.file_path.lstrip("/")
         if os.path.exists(disk_path):
             os.remove(disk_path)
 
     obs_repo.delete_evidence(evidence_id)
+    await evidence_store.collect(db)
     observation = obs_repo.get_observation(observation_id)
 
     return templates.TemplateResponse(
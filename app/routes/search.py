@@ -0,0 +1,51 @@
+"""Full-text search routes."""
+
+from fastapi import APIRouter, Request, Depends
+from fastapi.responses import HTMLResponse, RedirectResponse
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_db
+from app.repositories.search import SEARCH_KINDS, SearchRepository
+from app.templates import templates
+from app.utils.htmx import is_htmx_request
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_class=HTMLResponse)
+async def search(
+    request: Request,
+    db: Session = Depends(get_db),
+    q: str | None = None,
+    kind: str | None = None,
+):
+    """Search the tenant's findings, observations, evidence notes and controls.
+
+    HTMX requests (typing in the search box, changing the kind) get only the
+    results list.
+    """
+    user = getattr(request.state, "user", None)
+    if not user:
+        return RedirectResponse(url="/auth/login", status_code=302)
+
+    q = (q or "").strip()
+    kind = kind if kind in SEARCH_KINDS else ""
+    limit = get_settings().search_result_limit
+    hits = SearchRepository(db).search(
+        user.tenant_id, q, user=user, kinds=[kind] if kind else None, limit=limit
+    )
+
+    context = {
+        "request": request,
+        "user": user,
+        "q": q,
+        "kind": kind,
+        "kinds": SEARCH_KINDS,
+        "hits": hits,
+        "limit": limit,
+    }
+    if is_htmx_request(request):
+        return templates.TemplateResponse("search/_results.html", context)
+    return templates.TemplateResponse("search/index.html", context)
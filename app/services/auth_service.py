@@ -1,19 +1,34 @@
+import logging
 import secrets
+import time
 import uuid
 
-import msal
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.database import SessionLocal
 from app.models.user import AuthProvider, User
-from app.utils.security import hash_password, session_manager, verify_password
+from app.models.tenant import Tenant
+from app.services.msal_client import forget_account, get_msal_app
+from app.services.principal_cache import (
+    Principal,
+    TenantSnapshot,
+    UserSnapshot,
+    principal_cache,
+)
+from app.services.session_revocation import revocation_list
+from app.utils.security import password_hasher, session_manager
 
 settings = get_settings()
+SECURITY_LOGGER = logging.getLogger("auditpro.security")
 
 
-def authenticate_user(email: str, password: str, db: Session) -> User:
-    """Authenticate user by email and password."""
+async def authenticate_user(email: str, password: str, db: Session) -> User:
+    """Authenticate user by email and password.
+
+    The bcrypt check runs on the bounded hashing pool and raises
+    ``PasswordHashPoolBusy`` when that pool is saturated.
+    """
     user = db.query(User).filter(User.email == email).first()
 
     if not user or not user.is_active:
@@ -22,23 +37,34 @@ def authenticate_user(email: str, password: str, db: Session) -> User:
     if user.password_hash is None:  # Azure AD user, no local password
         return None
 
-    if not verify_password(password, user.password_hash):
+    if not await password_hasher.verify(password, user.password_hash):
         return None
 
     return user
 
 
 def create_session_token(user: User) -> str:
-    """Create a session token for a user."""
+    """Create a session token for a user.
+
+    ``sid`` identifies this session for logout revocation and ``iat`` lets a
+    user-level revocation cut off every token issued before it.
+    """
     data = {
         "user_id": str(user.id),
         "tenant_id": str(user.tenant_id),
+        "sid": secrets.token_urlsafe(16),
+        "iat": int(time.time()),
     }
     return session_manager.create_token(data)
 
 
-async def get_user_from_token(token: str) -> User:
-    """Get user from a session token."""
+async def get_principal_from_token(token: str) -> Principal | None:
+    """Resolve the active user and their tenant behind a session token.
+
+    Revoked tokens are rejected from the in-memory revocation list. Principals
+    are served from the per-worker cache when possible; on a miss the user and
+    tenant are loaded together in a single joined query.
+    """
     data = session_manager.decode_token(token)
 
     if not data:
@@ -49,22 +75,40 @@ async def get_user_from_token(token: str) -> User:
     except (ValueError, TypeError):
         return None
 
+    if revocation_list.is_revoked(data.get("sid"), str(user_id), data.get("iat")):
+        return None
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    generation = principal_cache.generation(user_id)
     db = SessionLocal()
     try:
-        user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
-        return user
+        row = (
+            db.query(User, Tenant)
+            .outerjoin(Tenant, Tenant.id == User.tenant_id)
+            .filter(User.id == user_id, User.is_active == True)
+            .first()
+        )
+        if not row:
+            return None
+        user, tenant = row
+        principal = Principal(
+            user=UserSnapshot.from_user(user),
+            tenant=TenantSnapshot.from_tenant(tenant) if tenant else None,
+        )
     finally:
         db.close()
 
+    principal_cache.put(principal, generation)
+    return principal
 
-def _get_msal_app() -> msal.ConfidentialClientApplication:
-    """Create an MSAL ConfidentialClientApplication."""
-    authority = f"https://login.microsoftonline.com/{settings.azure_ad_tenant_id}"
-    return msal.ConfidentialClientApplication(
-        client_id=settings.azure_ad_client_id,
-        client_credential=settings.azure_ad_client_secret,
-        authority=authority,
-    )
+
+async def get_user_from_token(token: str) -> UserSnapshot | None:
+    """Get a read-only snapshot of the active user behind a session token."""
+    principal = await get_principal_from_token(token)
+    return principal.user if principal else None
 
 
 def _graph_scopes() -> list[str]:
@@ -74,7 +118,7 @@ def _graph_scopes() -> list[str]:
 
 def initiate_azure_flow() -> dict:
     """Start the Azure AD auth code flow with PKCE. Returns the flow dict (contains auth_uri)."""
-    app = _get_msal_app()
+    app = get_msal_app()
     return app.initiate_auth_code_flow(
         scopes=_graph_scopes(),
         redirect_uri=settings.azure_ad_redirect_uri,
@@ -82,19 +126,30 @@ def initiate_azure_flow() -> dict:
 
 
 def exchange_azure_code(flow: dict, auth_response: dict) -> dict | None:
-    """Complete the auth code flow. Returns id_token_claims or None on failure."""
-    import logging
-    logger = logging.getLogger("auditpro.security")
-    app = _get_msal_app()
+    """Complete the auth code flow. Returns id_token_claims or None on failure.
+
+    Makes a blocking call to the token endpoint; run it off the event loop.
+    """
+    app = get_msal_app()
+    started_at = time.perf_counter()
     result = app.acquire_token_by_auth_code_flow(
         auth_code_flow=flow,
         auth_response=auth_response,
     )
+    duration_ms = (time.perf_counter() - started_at) * 1000
     if "error" in result:
-        logger.warning("msal_token_exchange_failed error=%s description=%s", result.get("error"), result.get("error_description"))
-    if "error" in result:
+        SECURITY_LOGGER.warning(
+            "msal_token_exchange_failed error=%s description=%s duration_ms=%.2f",
+            result.get("error"),
+            result.get("error_description"),
+            duration_ms,
+        )
         return None
-    return result.get("id_token_claims")
+    SECURITY_LOGGER.info("msal_token_exchange duration_ms=%.2f", duration_ms)
+    claims = result.get("id_token_claims")
+    if claims:
+        forget_account(app, claims)
+    return claims
 
 
 def get_or_create_azure_user(claims: dict, db: Session) -> User:
@@ -124,6 +179,7 @@ def get_or_create_azure_user(claims: dict, db: Session) -> User:
                 user.auth_provider = AuthProvider.AZURE_AD
                 db.commit()
                 db.refresh(user)
+                principal_cache.invalidate(user.id)
             return user
 
     # 3. Create new inactive user
@@ -0,0 +1,119 @@
+"""Per-worker cache of autocomplete results.
+
+The share modal's auditor picker and the project form's client picker send a
+search on every (debounced) keystroke, so one name typed a letter at a time
+is a run of queries for ever longer prefixes of it. Results are cached per
+tenant and normalized query for a short TTL. A query with no entry of its
+own is answered from a shorter prefix's entry when that one is complete
+(held every match, not just the first ``limit``): every row matching
+``"smit"`` also matches ``"smi"``, so filtering that entry gives exactly the
+rows the database would return.
+
+The repositories drop a tenant's entries when they write one of its users or
+clients, so a change shows up at once on the worker that made it and within
+the TTL on the others.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from app.config import get_settings
+
+
+def normalize_query(query: str | None) -> str:
+    """The cache key form of a query: lower case, single spaces, no padding."""
+    return " ".join((query or "").lower().split())
+
+
+def contains_pattern(query: str) -> str:
+    """``ILIKE`` pattern for rows containing ``query`` literally (use with ``escape="\\\\"``).
+
+    ``%`` and ``_`` in the query are escaped so the database matches what the
+    cache's substring filter matches.
+    """
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class AutocompleteCache:
+    """Bounded LRU cache of autocomplete results with a per-entry TTL.
+
+    Keys are ``(kind, tenant_id, normalized query)``; ``kind`` names the
+    lookup (``"users"``, ``"clients"``) so each keeps its own entries.
+    """
+
+    def __init__(self, max_size: int | None = None, ttl_seconds: float | None = None):
+        settings = get_settings()
+        self.max_size = (
+            max_size if max_size is not None else settings.autocomplete_cache_max_size
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.autocomplete_cache_ttl_seconds
+        )
+        self._entries: OrderedDict[tuple, tuple[float, tuple, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        kind: str,
+        tenant_id: uuid.UUID,
+        query: str,
+        matches: Callable[[Any, str], bool],
+    ) -> list | None:
+        """Cached rows for a normalized query, or None on a miss.
+
+        Falls back to the longest cached prefix of ``query`` whose entry is
+        complete, keeping its rows for which ``matches(row, query)`` holds.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for end in range(len(query), 0, -1):
+                key = (kind, tenant_id, query[:end])
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires_at, rows, complete = entry
+                if expires_at <= now:
+                    del self._entries[key]
+                    continue
+                if end == len(query):
+                    self._entries.move_to_end(key)
+                    return list(rows)
+                if complete:
+                    self._entries.move_to_end(key)
+                    return [row for row in rows if matches(row, query)]
+        return None
+
+    def put(
+        self, kind: str, tenant_id: uuid.UUID, query: str, rows: list, complete: bool
+    ) -> None:
+        """Store a query's rows; ``complete`` if they are every match, not a first page."""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (kind, tenant_id, query)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, tuple(rows), complete)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_tenant(self, kind: str, tenant_id: uuid.UUID) -> None:
+        """Drop every cached query of this kind for the tenant."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == kind and k[1] == tenant_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+autocomplete_cache = AutocompleteCache()
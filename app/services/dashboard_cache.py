@@ -0,0 +1,130 @@
+"""Per-worker cache of dashboard summaries.
+
+Every visit to ``/dashboard`` (it is also where sign-in lands) needs the
+user's project counts and the progress of each of their active projects.
+``ProjectRepository.dashboard_summary`` computes them in one statement; the
+result is cached per tenant and user for a short TTL.
+
+Response saves and project writes drop the tenant's summaries, since pending
+responses are counted tenant-wide. Each tenant has a generation number that
+those writes bump: a summary computed while a write was in flight is not
+stored, so a request that read the old data cannot put it back after the
+invalidation. Writes made inside a ``unit_of_work`` only flush, so they
+invalidate once the transaction commits (``invalidate_tenant_after_commit``):
+bumping the generation earlier would let a summary read before the commit be
+stored under the new one. Other workers see the change within the TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.config import get_settings
+from app.database import in_unit_of_work
+
+if TYPE_CHECKING:
+    from app.repositories.read_models import DashboardSummary
+
+# Session.info key: tenants whose summaries are dropped when the transaction commits
+INVALIDATED_TENANTS_KEY = "dashboard_invalidated_tenants"
+
+
+class DashboardCache:
+    """Bounded LRU cache of summaries keyed by ``(tenant_id, user_id)`` with a per-entry TTL."""
+
+    def __init__(self, max_size: int | None = None, ttl_seconds: float | None = None):
+        settings = get_settings()
+        self.max_size = max_size if max_size is not None else settings.dashboard_cache_max_size
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.dashboard_cache_ttl_seconds
+        )
+        self._entries: OrderedDict[tuple[uuid.UUID, uuid.UUID], tuple[float, DashboardSummary]] = (
+            OrderedDict()
+        )
+        self._generations: dict[uuid.UUID, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, tenant_id: uuid.UUID) -> int:
+        """The tenant's generation, to pass to ``put`` for a summary computed after this call."""
+        with self._lock:
+            return self._generations.get(tenant_id, 0)
+
+    def get(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> DashboardSummary | None:
+        """Return a fresh summary for the user, or None on miss/expiry."""
+        key = (tenant_id, user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, summary = entry
+            if expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return summary
+
+    def put(
+        self, tenant_id: uuid.UUID, user_id: uuid.UUID, summary: DashboardSummary, generation: int
+    ) -> None:
+        """Store a summary unless the tenant was invalidated since ``generation`` was read."""
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        key = (tenant_id, user_id)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if self._generations.get(tenant_id, 0) != generation:
+                return
+            self._entries[key] = (expires_at, summary)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_tenant(self, tenant_id: uuid.UUID) -> None:
+        """Drop every cached summary for the tenant and bump its generation."""
+        with self._lock:
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            for key in [key for key in self._entries if key[0] == tenant_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached summaries."""
+        with self._lock:
+            self._entries.clear()
+
+
+dashboard_cache = DashboardCache()
+
+
+def invalidate_tenant_after_commit(db: Session, tenant_id: uuid.UUID) -> None:
+    """Drop the tenant's summaries once ``db``'s writes are committed.
+
+    Outside a unit of work the repository has already committed, so this
+    invalidates right away.
+    """
+    if not in_unit_of_work(db):
+        dashboard_cache.invalidate_tenant(tenant_id)
+        return
+    db.info.setdefault(INVALIDATED_TENANTS_KEY, set()).add(tenant_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tenants(session: Session) -> None:
+    if session.in_nested_transaction():
+        return
+    for tenant_id in session.info.pop(INVALIDATED_TENANTS_KEY, ()):
+        dashboard_cache.invalidate_tenant(tenant_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _forget_rolled_back_tenants(session: Session, previous_transaction: SessionTransaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(INVALIDATED_TENANTS_KEY, None)
+
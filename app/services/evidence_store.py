@@ -0,0 +1,194 @@
+"""Content-addressed evidence store.
+
+Evidence files are kept once per tenant and distinct content under
+``settings.evidence_blob_dir``, at ``<dir>/<key[:2]>/<key><ext>``, with an
+``evidence_blobs`` row per file; ``blob_key`` derives the key from the tenant
+and the file's SHA-256, so one tenant's upload never reuses (or reveals)
+another's. Control instance files, health check observation images and
+standard observation images all point at blobs, so the same screenshot
+attached to twenty sessions is one file. The directory is not under
+``static/``: files are served by app.routes.evidence to the blob's tenant only.
+
+Uploads are staged in ``staging_dir`` (inside the store, so the final rename
+stays on one file system) and hashed as they stream in (see
+app.services.evidence_upload). ``store`` then either renames the staged file
+into place or, when the blob is already on disk, drops it. Reference counts
+are read from the evidence tables; ``collect`` removes a blob once nothing
+points at it, and its file only after the row's removal has committed. Both
+take a per-blob advisory lock, so a blob cannot be removed between an upload
+finding it and that upload's evidence row being committed. When that
+transaction rolls back instead, a file ``store`` placed for it is removed
+again (``_remove_placed_files``). Any file still left without a row is
+removed by scripts/reconcile_evidence_blobs.py.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from pathlib import Path
+from typing import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.config import get_settings
+from app.database import unit_of_work
+from app.models.evidence import RELEASED_BLOBS_KEY
+from app.repositories.evidence_blob import EvidenceBlobRepository
+from app.services.evidence_upload import StagedUpload
+
+APP_LOGGER = logging.getLogger("auditpro.app")
+
+# Where app.routes.evidence serves blobs; evidence rows record file_path under it
+URL_PREFIX = "/evidence/"
+
+# Session.info key: {sha256: extension} of files ``store`` placed in the open transaction
+PLACED_FILES_KEY = "placed_evidence_files"
+
+
+def blob_key(tenant_id: uuid.UUID, content_sha256: str) -> str:
+    """The key (``sha256``) of a tenant's blob with the given content hash."""
+    return hashlib.sha256(tenant_id.bytes + bytes.fromhex(content_sha256)).hexdigest()
+
+
+class EvidenceStore:
+    """Store evidence files by content and remove them when unreferenced."""
+
+    def __init__(self, root: str | Path | None = None):
+        self._root = Path(root) if root is not None else None
+
+    @property
+    def root(self) -> Path:
+        if self._root is None:
+            self._root = Path(get_settings().evidence_blob_dir)
+        return self._root
+
+    @property
+    def staging_dir(self) -> Path:
+        """Where uploads are streamed to before ``store``."""
+        return self.root / ".incoming"
+
+    def path_for(self, sha256: str, extension: str) -> Path:
+        return self.root / sha256[:2] / f"{sha256}{extension}"
+
+    def url_for(self, sha256: str, extension: str) -> str:
+        """The ``file_path`` recorded on evidence rows (the blob's URL)."""
+        return f"{URL_PREFIX}{sha256}{extension}"
+
+    def local_path(self, file_path: str) -> Path:
+        """The file on disk an evidence row's ``file_path`` refers to."""
+        if file_path.startswith(URL_PREFIX):
+            sha256, dot, extension = file_path.removeprefix(URL_PREFIX).partition(".")
+            return self.path_for(sha256, dot + extension)
+        # Stored before the blob store: a path under static/
+        return Path(file_path.lstrip("/"))
+
+    async def store(
+        self, db: Session, upload: StagedUpload, tenant_id: uuid.UUID
+    ) -> tuple[str, str]:
+        """Keep a staged upload as the tenant's blob; return its key and ``file_path``.
+
+        Call inside the ``unit_of_work`` that adds the evidence row pointing at
+        it (``blob_sha256`` set to the returned key): the blob lock is held
+        until that transaction commits.
+        """
+        sha256 = blob_key(tenant_id, upload.sha256)
+        blobs = EvidenceBlobRepository(db)
+        blobs.lock(sha256)
+        # The blob keeps its first extension, whatever this upload was named
+        extension = blobs.add(tenant_id, sha256, upload.extension, upload.size)
+        path = self.path_for(sha256, extension)
+        if await asyncio.to_thread(path.exists):
+            await upload.discard()
+            APP_LOGGER.info("evidence_deduplicated sha256=%s size=%d", sha256, upload.size)
+        else:
+            await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
+            await upload.commit(path)
+            db.info.setdefault(PLACED_FILES_KEY, {})[sha256] = extension
+        return sha256, self.url_for(sha256, extension)
+
+    async def collect(self, db: Session, sha256s: Iterable[str] | None = None) -> int:
+        """Remove the blobs this session released that nothing references now.
+
+        Call after the deletes have been committed. ``sha256s`` checks those
+        blobs instead. Returns the number of blobs removed; a blob still
+        referenced (or locked by an upload and then referenced) is kept.
+        """
+        released = db.info.pop(RELEASED_BLOBS_KEY, set())
+        if sha256s is not None:
+            released = set(sha256s)
+        removed = 0
+        for sha256 in sorted(released):
+            try:
+                with unit_of_work(db):
+                    blobs = EvidenceBlobRepository(db)
+                    blobs.lock(sha256)
+                    blob = blobs.remove_unreferenced(sha256)
+                    extension = blob.extension if blob is not None else None
+            except IntegrityError:
+                # An evidence row pointing at the blob was written without the
+                # blob lock and committed meanwhile; the row and its file are kept
+                APP_LOGGER.warning("evidence_blob_still_referenced sha256=%s", sha256)
+                continue
+            if extension is None:
+                continue
+            if await self.remove_orphaned_file(db, sha256, extension):
+                removed += 1
+                APP_LOGGER.info("evidence_blob_removed sha256=%s", sha256)
+        return removed
+
+    async def remove_orphaned_file(self, db: Session, sha256: str, extension: str) -> bool:
+        """Unlink a blob's file if no blob row exists for it; return whether it did.
+
+        Runs in its own transaction under the blob lock, so an upload that has
+        recorded the blob again since (and may be reusing the file) keeps it.
+        """
+        with unit_of_work(db):
+            blobs = EvidenceBlobRepository(db)
+            blobs.lock(sha256)
+            if blobs.exists(sha256):
+                return False
+            path = self.path_for(sha256, extension)
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+        return True
+
+
+evidence_store = EvidenceStore()
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_placed_files(session: Session) -> None:
+    if not session.in_nested_transaction():
+        session.info.pop(PLACED_FILES_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _remove_placed_files(session: Session, previous_transaction: SessionTransaction) -> None:
+    """Remove the files ``store`` placed for blobs whose rows were just rolled back.
+
+    Only for the outermost transaction (a savepoint's rollback keeps the blob
+    lock held). Each file is unlinked under the blob lock and only if no blob
+    row exists, since a concurrent upload may have recorded the blob and
+    reused the file by now.
+    """
+    if previous_transaction.parent is not None:
+        return
+    placed = session.info.pop(PLACED_FILES_KEY, None)
+    if not placed:
+        return
+    try:
+        with Session(session.get_bind()) as db:
+            for sha256, extension in placed.items():
+                with unit_of_work(db):
+                    blobs = EvidenceBlobRepository(db)
+                    blobs.lock(sha256)
+                    if not blobs.exists(sha256):
+                        evidence_store.path_for(sha256, extension).unlink(missing_ok=True)
+                        APP_LOGGER.info("evidence_file_rolled_back sha256=%s", sha256)
+    except Exception:
+        # Left for scripts/reconcile_evidence_blobs.py
+        APP_LOGGER.exception("evidence_file_cleanup_failed sha256s=%s", ",".join(placed))
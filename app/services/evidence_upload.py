@@ -0,0 +1,277 @@
+"""Streaming evidence uploads.
+
+The evidence upload routes read their form here rather than through
+``request.form()``, which spools each file whole before the handler sees it.
+The multipart body is parsed as it arrives: the file part goes to a
+temporary file beside its destination, counted and hashed (SHA-256) chunk by
+chunk, with the writes on a worker thread so the event loop keeps serving.
+A body whose Content-Length is already over the limit is refused before any
+of it is read, and one that grows past it mid-stream is cut off and its
+partial file removed. ``StagedUpload.commit`` renames the finished file into
+place, so nothing reading the uploads directory sees half a file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+from python_multipart.exceptions import FormParserError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.requests import Request
+
+from app.config import get_settings
+
+APP_LOGGER = logging.getLogger("auditpro.app")
+
+ALLOWED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"})
+
+# Text fields sent beside the file (evidence type, notes) are held in memory
+MAX_FIELD_BYTES = 64 * 1024
+MAX_FIELDS = 16
+
+
+class UploadError(Exception):
+    """An upload refused while it was read; ``status_code`` is the HTTP status to answer."""
+
+    status_code = 400
+
+
+class UploadTooLarge(UploadError):
+    """The file, or the request carrying it, is over the configured limit."""
+
+    status_code = 413
+
+
+@dataclass(slots=True)
+class StagedUpload:
+    """A received file, complete, in a temporary file beside its destination."""
+
+    filename: str
+    extension: str
+    size: int
+    sha256: str
+    temp_path: Path
+    committed: bool = False
+
+    async def commit(self, path: Path) -> Path:
+        """Atomically rename the file to ``path`` (in the staging directory's file system)."""
+        await asyncio.to_thread(os.replace, self.temp_path, path)
+        self.committed = True
+        APP_LOGGER.info(
+            "evidence_stored path=%s size=%d sha256=%s", path, self.size, self.sha256
+        )
+        return path
+
+    async def discard(self) -> None:
+        """Remove the temporary file unless it was committed."""
+        if not self.committed:
+            await asyncio.to_thread(self.temp_path.unlink, missing_ok=True)
+
+
+@dataclass(slots=True)
+class EvidenceForm:
+    """An evidence form's text fields and its file, if one was sent."""
+
+    fields: dict[str, str]
+    file: StagedUpload | None
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.fields.get(name, default)
+
+    async def discard(self) -> None:
+        """Remove the staged file if it was not committed."""
+        if self.file is not None:
+            await self.file.discard()
+
+
+@dataclass(slots=True)
+class _Part:
+    name: str = ""
+    filename: str | None = None
+    headers: dict[bytes, bytes] = field(default_factory=dict)
+    data: bytearray = field(default_factory=bytearray)
+
+
+class _EvidenceFormReader:
+    """python-multipart callbacks that stage one file part and keep the text fields."""
+
+    def __init__(self, staging_dir: Path, file_field: str, allowed_extensions, max_bytes: int):
+        self.staging_dir = staging_dir
+        self.file_field = file_field
+        self.allowed_extensions = allowed_extensions
+        self.max_bytes = max_bytes
+        self.fields: dict[str, str] = {}
+        self.upload: StagedUpload | None = None
+        self._part = _Part()
+        self._header_name = b""
+        self._header_value = b""
+        self._in_file = False
+        self._pending = bytearray()
+        self._file: BinaryIO | None = None
+        self._hash = hashlib.sha256()
+
+    # Parser callbacks (synchronous; file data is only queued here)
+
+    def on_part_begin(self) -> None:
+        self._part = _Part()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._part.headers[self._header_name.lower()] = self._header_value
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._part.headers.get(b"content-disposition", b""))
+        if b"name" not in options:
+            raise UploadError("Malformed upload.")
+        self._part.name = options[b"name"].decode("utf-8", "replace")
+        if b"filename" not in options:
+            if len(self.fields) >= MAX_FIELDS:
+                raise UploadError("Too many form fields.")
+            return
+        filename = Path(options[b"filename"].decode("utf-8", "replace")).name
+        self._part.filename = filename
+        if not filename:
+            return  # file input left empty; its (empty) data is skipped
+        if self._part.name != self.file_field or self.upload is not None:
+            raise UploadError("Unexpected file in upload.")
+        extension = Path(filename).suffix.lower()
+        if extension not in self.allowed_extensions:
+            raise UploadError("Unsupported file type.")
+        self._in_file = True
+        self.upload = StagedUpload(filename, extension, 0, "", Path())
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self.upload.size += end - start
+            if self.upload.size > self.max_bytes:
+                raise UploadTooLarge(_too_large_message(self.max_bytes))
+            self._pending += data[start:end]
+        elif self._part.filename is None and self._part.name:
+            if len(self._part.data) + end - start > MAX_FIELD_BYTES:
+                raise UploadError("Form field too large.")
+            self._part.data += data[start:end]
+
+    def on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+        elif self._part.filename is None and self._part.name:
+            self.fields[self._part.name] = self._part.data.decode("utf-8", "replace")
+
+    # File writes (worker thread)
+
+    def flush(self, final: bool = False) -> None:
+        """Write and hash the queued file data; on ``final`` close the file."""
+        if self.upload is None:
+            return
+        if self._file is None:
+            self.staging_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=self.staging_dir, prefix=".upload-", suffix=".part"
+            )
+            self._file = os.fdopen(fd, "wb")
+            self.upload.temp_path = Path(temp_path)
+        if self._pending:
+            self._hash.update(self._pending)
+            self._file.write(self._pending)
+            self._pending.clear()
+        if final:
+            self._file.close()
+            self.upload.sha256 = self._hash.hexdigest()
+
+    def abort(self) -> None:
+        """Close and remove a partly written file."""
+        if self._file is not None:
+            self._file.close()
+            if self.upload is not None:
+                self.upload.temp_path.unlink(missing_ok=True)
+        self.upload = None
+
+    @property
+    def pending_bytes(self) -> int:
+        return len(self._pending)
+
+
+def _too_large_message(max_bytes: int) -> str:
+    return f"File is larger than the {max_bytes // (1024 * 1024)} MB limit."
+
+
+async def read_evidence_form(
+    request: Request,
+    staging_dir: Path,
+    *,
+    file_field: str = "file",
+    allowed_extensions: frozenset[str] = ALLOWED_EXTENSIONS,
+    max_bytes: int | None = None,
+) -> EvidenceForm:
+    """Read an evidence form, staging its file in ``staging_dir``.
+
+    Commit the staged file to a path in the same directory (or file system),
+    or discard it. Raises ``UploadTooLarge`` past ``max_bytes`` (default
+    ``settings.evidence_upload_max_bytes``) and ``UploadError`` for a file of
+    a type not in ``allowed_extensions`` or a malformed body; nothing is
+    left on disk either way. Forms sent without a file (url-encoded) are read
+    with ``request.form()``.
+    """
+    settings = get_settings()
+    max_bytes = settings.evidence_upload_max_bytes if max_bytes is None else max_bytes
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data":
+        form = await request.form()
+        return EvidenceForm({k: v for k, v in form.items() if isinstance(v, str)}, None)
+    if b"boundary" not in params:
+        raise UploadError("Malformed upload.")
+
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and (
+        int(content_length) > max_bytes + MAX_FIELD_BYTES
+    ):
+        APP_LOGGER.warning(
+            "evidence_upload_rejected reason=content_length bytes=%s limit=%d",
+            content_length,
+            max_bytes,
+        )
+        raise UploadTooLarge(_too_large_message(max_bytes))
+
+    reader = _EvidenceFormReader(staging_dir, file_field, allowed_extensions, max_bytes)
+    parser = MultipartParser(
+        params[b"boundary"],
+        {
+            "on_part_begin": reader.on_part_begin,
+            "on_part_data": reader.on_part_data,
+            "on_part_end": reader.on_part_end,
+            "on_header_field": reader.on_header_field,
+            "on_header_value": reader.on_header_value,
+            "on_header_end": reader.on_header_end,
+            "on_headers_finished": reader.on_headers_finished,
+        },
+    )
+    flush_bytes = settings.evidence_upload_chunk_bytes
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if reader.pending_bytes >= flush_bytes:
+                await asyncio.to_thread(reader.flush)
+        parser.finalize()
+        await asyncio.to_thread(reader.flush, True)
+    except BaseException as exc:
+        await asyncio.to_thread(reader.abort)
+        if isinstance(exc, UploadError):
+            APP_LOGGER.warning("evidence_upload_rejected reason=%s", exc)
+            raise
+        if isinstance(exc, FormParserError):
+            raise UploadError("Malformed upload.") from exc
+        raise
+    return EvidenceForm(reader.fields, reader.upload)
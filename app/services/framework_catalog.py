@@ -0,0 +1,221 @@
+"""Per-worker cache of framework catalogs (sections and controls).
+
+Standard audit pages and their HTMX partials need one control, or the whole
+section/control tree, of the project's framework on every request. Loading
+that tree with its text and JSONB columns and scanning it for the control
+cost more than the rest of most of those requests. ``FrameworkCatalog`` is an
+immutable copy of the tree with a control-by-id index, built once per
+framework revision and shared by every request in the worker.
+
+Each lookup reads the framework's ``catalog_revision`` (one primary key
+query, which also enforces the tenant), and a cached catalog is used only if
+it was built from that revision. The revision is bumped in the same flush as
+any ORM change to the framework, its sections or controls, so an admin edit
+saved on one worker is seen by the others on their next lookup.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.framework import Framework, FrameworkControl, FrameworkSection
+from app.repositories.framework import FrameworkRepository
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CatalogControl:
+    """Immutable copy of a framework control.
+
+    ``workflow_definition`` and ``assessment_checklist`` are the stored JSON
+    documents, shared by every request; treat them as read-only.
+    """
+
+    id: uuid.UUID
+    framework_section_id: uuid.UUID
+    control_id: str
+    name: str
+    description: str | None
+    implementation_guidance: str | None
+    requirements_text: str | None
+    testing_procedures_text: str | None
+    check_points_text: str | None
+    workflow_definition: dict | None
+    assessment_checklist: dict | None
+
+    @classmethod
+    def from_control(cls, control: FrameworkControl) -> "CatalogControl":
+        """Copy column values off an ORM control so it can outlive its session."""
+        return cls(
+            id=control.id,
+            framework_section_id=control.framework_section_id,
+            control_id=control.control_id,
+            name=control.name,
+            description=control.description,
+            implementation_guidance=control.implementation_guidance,
+            requirements_text=control.requirements_text,
+            testing_procedures_text=control.testing_procedures_text,
+            check_points_text=control.check_points_text,
+            workflow_definition=control.workflow_definition,
+            assessment_checklist=control.assessment_checklist,
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CatalogSection:
+    """Immutable copy of a framework section and its controls."""
+
+    id: uuid.UUID
+    framework_id: uuid.UUID
+    parent_section_id: uuid.UUID | None
+    name: str
+    description: str | None
+    order: int
+    controls: tuple[CatalogControl, ...]
+
+    @classmethod
+    def from_section(cls, section: FrameworkSection) -> "CatalogSection":
+        """Copy a section and its loaded controls."""
+        return cls(
+            id=section.id,
+            framework_id=section.framework_id,
+            parent_section_id=section.parent_section_id,
+            name=section.name,
+            description=section.description,
+            order=section.order or 0,
+            controls=tuple(CatalogControl.from_control(c) for c in section.controls),
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FrameworkCatalog:
+    """Immutable framework tree, shaped like the ORM one the templates read.
+
+    Sections are in ``order``; controls keep their load order.
+    """
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    name: str
+    description: str | None
+    version: str | None
+    revision: int
+    sections: tuple[CatalogSection, ...]
+    _controls: dict[uuid.UUID, CatalogControl] = field(repr=False)
+    _sections: dict[uuid.UUID, CatalogSection] = field(repr=False)
+
+    @classmethod
+    def from_framework(cls, framework: Framework, revision: int) -> "FrameworkCatalog":
+        """Copy a framework loaded with ``get_by_id_with_sections``."""
+        sections = tuple(
+            sorted(
+                (CatalogSection.from_section(s) for s in framework.sections),
+                key=lambda s: s.order,
+            )
+        )
+        return cls(
+            id=framework.id,
+            tenant_id=framework.tenant_id,
+            name=framework.name,
+            description=framework.description,
+            version=framework.version,
+            revision=revision,
+            sections=sections,
+            _controls={c.id: c for s in sections for c in s.controls},
+            _sections={s.id: s for s in sections},
+        )
+
+    @property
+    def control_count(self) -> int:
+        return len(self._controls)
+
+    @property
+    def control_ids(self):
+        """Ids of every control in the framework."""
+        return self._controls.keys()
+
+    def get_control(self, control_id: uuid.UUID | str) -> CatalogControl | None:
+        """The control with this id (a UUID or its string form), or None."""
+        if isinstance(control_id, str):
+            try:
+                control_id = uuid.UUID(control_id)
+            except ValueError:
+                return None
+        return self._controls.get(control_id)
+
+    def section_of(self, control: CatalogControl) -> CatalogSection:
+        """The section a control belongs to."""
+        return self._sections[control.framework_section_id]
+
+
+class FrameworkCatalogCache:
+    """Bounded LRU cache of framework catalogs, checked against the stored revision."""
+
+    def __init__(self, max_size: int | None = None):
+        settings = get_settings()
+        self.max_size = (
+            max_size if max_size is not None else settings.framework_catalog_cache_max_size
+        )
+        self._entries: OrderedDict[uuid.UUID, FrameworkCatalog] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, db: Session, tenant_id: uuid.UUID, framework_id: uuid.UUID | str | None
+    ) -> FrameworkCatalog | None:
+        """The tenant's framework catalog, rebuilt if missing or stale; None if not found."""
+        if framework_id is None:
+            return None
+        if isinstance(framework_id, str):
+            try:
+                framework_id = uuid.UUID(framework_id)
+            except ValueError:
+                return None
+        framework_repo = FrameworkRepository(db)
+        revision = framework_repo.get_catalog_revision(tenant_id, framework_id)
+        if revision is None:
+            return None
+        with self._lock:
+            catalog = self._entries.get(framework_id)
+            if catalog is not None and catalog.revision == revision:
+                self._entries.move_to_end(framework_id)
+                return catalog
+
+        framework = framework_repo.get_by_id_with_sections(tenant_id, framework_id)
+        if framework is None:
+            return None
+        # Tagged with the revision read before the load: an edit committed in
+        # between makes the next lookup rebuild, never serve stale data
+        catalog = FrameworkCatalog.from_framework(framework, revision)
+        self.put(catalog)
+        return catalog
+
+    def put(self, catalog: FrameworkCatalog) -> None:
+        """Store a catalog, evicting the least recently used one when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            current = self._entries.get(catalog.id)
+            if current is not None and current.revision > catalog.revision:
+                return
+            self._entries[catalog.id] = catalog
+            self._entries.move_to_end(catalog.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, framework_id: uuid.UUID) -> None:
+        """Drop any cached catalog for the framework."""
+        with self._lock:
+            self._entries.pop(framework_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached catalogs."""
+        with self._lock:
+            self._entries.clear()
+
+
+framework_catalog_cache = FrameworkCatalogCache()
@@ -0,0 +1,134 @@
+"""Control status counts for health check projects, review scopes and sessions.
+
+Every page that draws health check progress needs the same numbers: how
+many control instances are in each status per session, per review scope and
+for the whole project. They are stored, one row per session and per review
+scope, and kept current by ``HealthCheckRepository`` in the same transaction
+as every seed, status change and delete, so ``load_stats`` reads one row per
+review scope (project pages) or per session (review scope pages) instead of
+counting instances. Counts are plain ``{status value: count}`` dicts with
+every status present, the shape the templates already read.
+
+``reconcile_status_counts`` recounts a project from its assessments and
+repairs stored counts that have drifted; scripts/reconcile_status_counts.py
+runs it for every project.
+"""
+
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.health_check import ControlInstanceStatus
+from app.repositories.health_check import HealthCheckRepository
+
+APP_LOGGER = logging.getLogger("auditpro.app")
+
+
+def empty_counts() -> dict[str, int]:
+    """A zero count for every control status."""
+    return {status.value: 0 for status in ControlInstanceStatus}
+
+
+def compute_review_scope_rollup(stats: dict) -> str:
+    """Derive a single PASS/FAIL/DRAFT/NOT_STARTED verdict from aggregated stats.
+
+    Rules (in priority order):
+    - "fail"        — if any control instance is FAIL
+    - "pass"        — if nothing is not_started or draft (all resolved: pass+na)
+    - "draft"       — if some are pass/draft but not all resolved
+    - "not_started" — if no sessions exist or everything is not_started
+    """
+    if stats.get("fail", 0) > 0:
+        return "fail"
+    total = sum(stats.values())
+    if total == 0:
+        return "not_started"
+    unresolved = stats.get("not_started", 0) + stats.get("draft", 0)
+    if unresolved == 0:
+        return "pass"
+    if stats.get("pass", 0) > 0 or stats.get("draft", 0) > 0:
+        return "draft"
+    return "not_started"
+
+
+class HealthCheckStats:
+    """Status counts at project, review scope and session level.
+
+    ``review_scopes`` and ``sessions`` are keyed by the string form of the id,
+    as the templates look them up; ids with no stored counts are absent, so
+    use ``for_review_scope``/``for_session`` to get zero counts for them.
+    ``sessions`` is only filled when loading a single review scope.
+    """
+
+    __slots__ = ("project", "review_scopes", "sessions")
+
+    def __init__(self):
+        self.project: dict[str, int] = empty_counts()
+        self.review_scopes: dict[str, dict[str, int]] = {}
+        self.sessions: dict[str, dict[str, int]] = {}
+
+    def add(
+        self, review_scope_id: UUID, counts: dict[str, int], session_id: UUID | None = None
+    ) -> None:
+        targets = [
+            self.project,
+            self.review_scopes.setdefault(str(review_scope_id), empty_counts()),
+        ]
+        if session_id is not None:
+            targets.append(self.sessions.setdefault(str(session_id), empty_counts()))
+        for target in targets:
+            for status, count in counts.items():
+                target[status] += count
+
+    def for_review_scope(self, review_scope_id: UUID) -> dict[str, int]:
+        return self.review_scopes.get(str(review_scope_id)) or empty_counts()
+
+    def for_session(self, session_id: UUID) -> dict[str, int]:
+        return self.sessions.get(str(session_id)) or empty_counts()
+
+    def rollup(self, review_scope_id: UUID) -> str:
+        """The review scope's single verdict (see ``compute_review_scope_rollup``)."""
+        return compute_review_scope_rollup(self.for_review_scope(review_scope_id))
+
+
+def load_stats(
+    db: Session, project_id: UUID | None = None, review_scope_id: UUID | None = None
+) -> HealthCheckStats:
+    """Counts for every review scope of a project, or every session of one review scope."""
+    stats = HealthCheckStats()
+    hc_repo = HealthCheckRepository(db)
+    if review_scope_id is not None:
+        for row in hc_repo.get_session_status_counts(review_scope_id):
+            stats.add(row.review_scope_id, row.counts(), session_id=row.audit_session_id)
+    else:
+        for row in hc_repo.get_review_scope_status_counts(project_id):
+            stats.add(row.review_scope_id, row.counts())
+    return stats
+
+
+def reconcile_status_counts(
+    db: Session, project_id: UUID, dry_run: bool = False
+) -> tuple[list[UUID], list[UUID]]:
+    """Repair a project's stored status counts and return the ids that drifted.
+
+    Returns (session ids, review scope ids) whose stored counts did not match
+    their assessments. Drift is logged and the repair committed, or rolled
+    back when ``dry_run`` is set.
+    """
+    sessions, review_scopes = HealthCheckRepository(db).repair_status_counts(project_id)
+    if sessions or review_scopes:
+        APP_LOGGER.warning(
+            "status_counts_drift project_id=%s sessions=%d review_scopes=%d dry_run=%s",
+            project_id,
+            len(sessions),
+            len(review_scopes),
+            dry_run,
+        )
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    return sessions, review_scopes
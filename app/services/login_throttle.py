@@ -0,0 +1,95 @@
+"""Per-worker throttling of failed password logins.
+
+Failures are counted in sliding windows per client IP and per account. Once a
+key is over its limit, further attempts are refused before any bcrypt work is
+queued, so a credential-stuffing burst cannot saturate the hashing pool.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+
+from app.config import get_settings
+
+# Prune expired buckets once either map grows past this many keys.
+_SWEEP_THRESHOLD = 10_000
+
+
+class _SlidingWindow:
+    """Failure timestamps per key within a fixed look-back window."""
+
+    def __init__(self, max_failures: int, window_seconds: int):
+        self.max_failures = max_failures
+        self.window_seconds = window_seconds
+        self._hits: dict[str, deque[float]] = {}
+
+    def _trim(self, key: str, now: float) -> deque[float] | None:
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        cutoff = now - self.window_seconds
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+            return None
+        return hits
+
+    def retry_after(self, key: str, now: float) -> float:
+        """Seconds until ``key`` may try again, or 0 when it is under the limit."""
+        hits = self._trim(key, now)
+        if hits is None or len(hits) < self.max_failures:
+            return 0
+        return hits[-self.max_failures] + self.window_seconds - now
+
+    def hit(self, key: str, now: float) -> None:
+        self._trim(key, now)
+        self._hits.setdefault(key, deque()).append(now)
+        if len(self._hits) > _SWEEP_THRESHOLD:
+            for stale_key in list(self._hits):
+                self._trim(stale_key, now)
+
+    def clear(self, key: str) -> None:
+        self._hits.pop(key, None)
+
+
+class LoginThrottle:
+    """Refuse login attempts from IPs or for accounts with too many failures."""
+
+    def __init__(self):
+        settings = get_settings()
+        self._by_ip = _SlidingWindow(
+            settings.login_ip_max_failures, settings.login_ip_window_seconds
+        )
+        self._by_account = _SlidingWindow(
+            settings.login_account_max_failures, settings.login_account_window_seconds
+        )
+        self._lock = threading.Lock()
+
+    def retry_after(self, client_ip: str, email: str) -> int:
+        """Whole seconds the caller must wait, or 0 if the attempt may proceed."""
+        now = time.monotonic()
+        with self._lock:
+            wait = max(
+                self._by_ip.retry_after(client_ip, now),
+                self._by_account.retry_after(email, now),
+            )
+        return math.ceil(wait)
+
+    def record_failure(self, client_ip: str, email: str) -> None:
+        """Count a failed attempt against both the IP and the account."""
+        now = time.monotonic()
+        with self._lock:
+            self._by_ip.hit(client_ip, now)
+            self._by_account.hit(email, now)
+
+    def record_success(self, email: str) -> None:
+        """Forget earlier failures for an account after a successful login."""
+        with self._lock:
+            self._by_account.clear(email)
+
+
+login_throttle = LoginThrottle()
@@ -0,0 +1,113 @@
+"""Process-level MSAL client for Azure AD sign-in.
+
+One ``ConfidentialClientApplication`` is built per worker and reused by every
+login and callback, so authority validation and OIDC metadata discovery run
+once instead of on every request. MSAL's HTTP cache (instance discovery and
+authority metadata, never tokens) is written through to a small file, so a
+freshly started worker reuses what a previous one already discovered.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+import threading
+
+import msal
+
+from app.config import get_settings
+
+SECURITY_LOGGER = logging.getLogger("auditpro.security")
+
+
+class PersistentHttpCache(dict):
+    """Dict handed to MSAL as ``http_cache`` that saves itself on every write.
+
+    MSAL only writes to this mapping when a discovery response is cached or
+    expires, so write-through costs a handful of small file writes per worker
+    lifetime. An unreadable or missing file just starts an empty cache.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    self.update(pickle.load(f))
+            except FileNotFoundError:
+                pass
+            except Exception:
+                SECURITY_LOGGER.warning("msal_http_cache_unreadable path=%s", path)
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self._save()
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._save()
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            directory = os.path.dirname(self.path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".msal_http_cache")
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(dict(self), f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                SECURITY_LOGGER.warning("msal_http_cache_write_failed path=%s", self.path)
+
+
+def _authority() -> str:
+    settings = get_settings()
+    if settings.azure_ad_authority:
+        return settings.azure_ad_authority
+    return f"https://login.microsoftonline.com/{settings.azure_ad_tenant_id}"
+
+
+def build_msal_app(http_cache: dict | None = None) -> msal.ConfidentialClientApplication:
+    """Construct a ConfidentialClientApplication from the current settings."""
+    settings = get_settings()
+    return msal.ConfidentialClientApplication(
+        client_id=settings.azure_ad_client_id,
+        client_credential=settings.azure_ad_client_secret,
+        authority=_authority(),
+        token_cache=msal.SerializableTokenCache(),
+        http_cache=http_cache,
+        instance_discovery=settings.azure_ad_instance_discovery,
+        verify=settings.azure_ad_ca_bundle or True,
+    )
+
+
+_msal_app: msal.ConfidentialClientApplication | None = None
+_msal_app_lock = threading.Lock()
+
+
+def get_msal_app() -> msal.ConfidentialClientApplication:
+    """Return this worker's shared ConfidentialClientApplication."""
+    global _msal_app
+    if _msal_app is None:
+        with _msal_app_lock:
+            if _msal_app is None:
+                http_cache = PersistentHttpCache(get_settings().azure_ad_http_cache_path)
+                _msal_app = build_msal_app(http_cache)
+    return _msal_app
+
+
+def forget_account(app: msal.ConfidentialClientApplication, claims: dict) -> None:
+    """Drop a signed-in user's tokens from the shared token cache.
+
+    Sign-in only needs the ID token claims, so user tokens are not kept; this
+    keeps the process-wide cache from growing with every login.
+    """
+    username = claims.get("preferred_username")
+    for account in app.get_accounts(username=username):
+        app.remove_account(account)
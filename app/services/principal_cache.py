@@ -0,0 +1,151 @@
+"""Per-worker cache of authenticated user and tenant snapshots.
+
+The request context middleware resolves the session cookie on every request,
+including HTMX partials and autosave pings. Caching a detached, read-only
+snapshot of the user and their tenant keyed by ``user_id`` avoids a database
+lookup on each of them.
+
+``invalidate`` stamps the user with the next value of a cache-wide counter:
+a principal loaded while an invalidation landed is not stored, so a request
+that read the old row cannot put it back. Only the latest ``max_size``
+stamps are kept; loads that started before a pruned stamp are not stored
+either, so the map stays bounded at the cost of an occasional extra miss.
+Changes made on another worker arrive as ``principal`` rows on the session
+revocation feed (app.services.session_revocation), within its refresh
+interval.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.config import get_settings
+from app.models.tenant import Tenant
+from app.models.user import AuthProvider, User, UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Immutable copy of the user columns needed to serve a request."""
+
+    id: uuid.UUID
+    tenant_id: uuid.UUID
+    email: str
+    full_name: str
+    role: UserRole
+    is_active: bool
+    auth_provider: AuthProvider
+    azure_oid: str | None
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        """Copy column values off an ORM user so it can outlive its session."""
+        return cls(
+            id=user.id,
+            tenant_id=user.tenant_id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            auth_provider=user.auth_provider,
+            azure_oid=user.azure_oid,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TenantSnapshot:
+    """Immutable copy of the tenant columns needed to serve a request."""
+
+    id: uuid.UUID
+    name: str
+    slug: str
+    logo_url: str | None
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> "TenantSnapshot":
+        """Copy column values off an ORM tenant so it can outlive its session."""
+        return cls(id=tenant.id, name=tenant.name, slug=tenant.slug, logo_url=tenant.logo_url)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """The authenticated user together with the tenant they belong to."""
+
+    user: UserSnapshot
+    tenant: TenantSnapshot | None
+
+
+class PrincipalCache:
+    """Bounded LRU cache of principals with a per-entry TTL."""
+
+    def __init__(self, max_size: int | None = None, ttl_seconds: float | None = None):
+        settings = get_settings()
+        self.max_size = max_size if max_size is not None else settings.principal_cache_max_size
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.principal_cache_ttl_seconds
+        )
+        self._entries: OrderedDict[uuid.UUID, tuple[float, Principal]] = OrderedDict()
+        # user_id -> counter value at their last invalidation, oldest first
+        self._invalidations: OrderedDict[uuid.UUID, int] = OrderedDict()
+        self._counter = 0
+        # Newest stamp pruned from _invalidations
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def generation(self, user_id: uuid.UUID) -> int:
+        """The generation to pass to ``put`` for the user's principal loaded after this call."""
+        with self._lock:
+            return self._counter
+
+    def get(self, user_id: uuid.UUID) -> Principal | None:
+        """Return a fresh principal for the user, or None on miss/expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= now:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return principal
+
+    def put(self, principal: Principal, generation: int) -> None:
+        """Store a principal unless the user was invalidated since ``generation`` was read.
+
+        Evicts the least recently used entry when full.
+        """
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        user_id = principal.user.id
+        with self._lock:
+            if self._invalidations.get(user_id, self._floor) > generation:
+                return
+            self._entries[user_id] = (expires_at, principal)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop any cached principal for the user and stamp them with a new generation."""
+        with self._lock:
+            self._counter += 1
+            self._invalidations[user_id] = self._counter
+            self._invalidations.move_to_end(user_id)
+            while len(self._invalidations) > max(self.max_size, 0):
+                _, self._floor = self._invalidations.popitem(last=False)
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,185 @@
+"""Per-worker mirror of the session revocation table.
+
+Session ids of revoked tokens are held in a Bloom filter backed by an exact
+set: almost every request misses the filter and pays one hash, and the rare
+filter hit is confirmed against the set so false positives never log anyone
+out. User-level revocations (deactivation) are a small ``user_id -> revoked
+at`` map. ``principal`` rows evict the user from this worker's principal
+cache, so a role change made on another worker applies here too; each is
+applied once, not again on every overlapping or full reload. A
+background task pulls new rows every few seconds, so a logout or
+deactivation on one worker reaches all workers without a per-request query.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.session_revocation import SessionRevocation
+from app.repositories.session_revocation import SessionRevocationRepository
+from app.services.principal_cache import principal_cache
+
+SECURITY_LOGGER = logging.getLogger("auditpro.security")
+
+# Re-read this far behind the newest row seen, so rows committed slightly out
+# of order are not skipped. Re-adding a known row is harmless.
+_REFRESH_OVERLAP = timedelta(seconds=30)
+# Rebuild from scratch this often to drop expired entries from the filter.
+_FULL_RELOAD_SECONDS = 3600
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevocationList:
+    """In-memory view of revoked sessions and users for this worker."""
+
+    def __init__(self):
+        settings = get_settings()
+        self.refresh_seconds = settings.session_revocation_refresh_seconds
+        self._bloom_capacity = settings.session_revocation_bloom_capacity
+        self._bloom_error_rate = settings.session_revocation_bloom_error_rate
+        self._lock = threading.Lock()
+        self._high_water: datetime | None = None
+        self._last_full_load = 0.0
+        self._bloom, self._sessions, self._users = self._empty()
+        # Principal rows already applied are either newer than the floor and
+        # listed here by id, or at/below the floor (high water less overlap)
+        self._principals_applied: dict[uuid.UUID, datetime] = {}
+        self._principal_floor: datetime | None = None
+
+    def _empty(self):
+        return _BloomFilter(self._bloom_capacity, self._bloom_error_rate), set(), {}
+
+    def is_revoked(self, session_id: str | None, user_id: str, issued_at: float | None) -> bool:
+        """Return True if the token was logged out or its user was cut off."""
+        if session_id and session_id in self._bloom and session_id in self._sessions:
+            return True
+        revoked_at = self._users.get(user_id)
+        if revoked_at is None:
+            return False
+        return issued_at is None or issued_at <= revoked_at
+
+    def add(self, revocation: SessionRevocation) -> None:
+        """Apply a revocation row to the in-memory view."""
+        with self._lock:
+            self._apply(self._bloom, self._sessions, self._users, revocation)
+            if self._high_water is None or revocation.created_at > self._high_water:
+                self._high_water = revocation.created_at
+            self._advance_principal_floor()
+
+    def _apply(self, bloom, sessions, users, revocation: SessionRevocation) -> None:
+        if revocation.kind == "session":
+            bloom.add(revocation.subject)
+            sessions.add(revocation.subject)
+        elif revocation.kind == "user":
+            revoked_at = revocation.created_at.timestamp()
+            users[revocation.subject] = max(users.get(revocation.subject, 0.0), revoked_at)
+        elif revocation.kind == "principal":
+            if revocation.id in self._principals_applied or (
+                self._principal_floor is not None
+                and revocation.created_at <= self._principal_floor
+            ):
+                return
+            self._principals_applied[revocation.id] = revocation.created_at
+            principal_cache.invalidate(uuid.UUID(revocation.subject))
+
+    def _advance_principal_floor(self) -> None:
+        # Rows at or below the floor were returned by an earlier load (the
+        # refresh overlap covers late commits), so their ids can be forgotten
+        if self._high_water is None:
+            return
+        self._principal_floor = self._high_water - _REFRESH_OVERLAP
+        self._principals_applied = {
+            row_id: created_at
+            for row_id, created_at in self._principals_applied.items()
+            if created_at > self._principal_floor
+        }
+
+    def _load(self, full: bool) -> int:
+        db = SessionLocal()
+        try:
+            repo = SessionRevocationRepository(db)
+            if full:
+                repo.purge_expired()
+                rows = repo.list_since(None)
+            else:
+                since = self._high_water - _REFRESH_OVERLAP if self._high_water else None
+                rows = repo.list_since(since)
+        finally:
+            db.close()
+
+        with self._lock:
+            if full:
+                bloom, sessions, users = self._empty()
+                for row in rows:
+                    self._apply(bloom, sessions, users, row)
+                self._bloom, self._sessions, self._users = bloom, sessions, users
+                self._last_full_load = time.monotonic()
+            else:
+                for row in rows:
+                    self._apply(self._bloom, self._sessions, self._users, row)
+            if rows:
+                newest = rows[-1].created_at
+                if self._high_water is None or newest > self._high_water:
+                    self._high_water = newest
+            self._advance_principal_floor()
+        return len(rows)
+
+    async def refresh(self) -> int:
+        """Pull revocations created since the last refresh (or all, hourly)."""
+        full = time.monotonic() - self._last_full_load >= _FULL_RELOAD_SECONDS
+        return await asyncio.to_thread(self._load, full)
+
+    async def run(self) -> None:
+        """Refresh forever; started from the application lifespan."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                SECURITY_LOGGER.exception("session_revocation_refresh_failed")
+            await asyncio.sleep(self.refresh_seconds)
+
+
+revocation_list = RevocationList()
+
+
+def revoke_session(session_id: str, user_id) -> None:
+    """Persist a logout revocation and apply it to this worker immediately."""
+    db = SessionLocal()
+    try:
+        revocation = SessionRevocationRepository(db).revoke_session(session_id, user_id)
+    finally:
+        db.close()
+    revocation_list.add(revocation)
@@ -1,7 +1,23 @@
+import time
+
 from fastapi.templating import Jinja2Templates
+from app.metrics import TEMPLATE_RENDER_DURATION
 from app.version import __version__
 from app.utils.rich_text import render_rich_text
 
-templates = Jinja2Templates(directory="templates")
+
+class TimedJinja2Templates(Jinja2Templates):
+    """Jinja2Templates that records how long each TemplateResponse takes to render."""
+
+    def TemplateResponse(self, *args, **kwargs):
+        started_at = time.perf_counter()
+        response = super().TemplateResponse(*args, **kwargs)
+        TEMPLATE_RENDER_DURATION.labels(response.template.name).observe(
+            time.perf_counter() - started_at
+        )
+        return response
+
+
+templates = TimedJinja2Templates(directory="templates")
 templates.env.globals["app_version"] = __version__
 templates.env.filters["rich_text"] = render_rich_text
@@ -1,3 +1,7 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
 from app.config import get_settings
@@ -14,6 +18,48 @@ def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
 
+class PasswordHashPoolBusy(Exception):
+    """Raised when too many bcrypt jobs are already queued."""
+
+
+class PasswordHasher:
+    """Run bcrypt on a small dedicated thread pool instead of the event loop.
+
+    bcrypt releases the GIL while hashing, so a couple of threads keep the
+    worker responsive. Jobs beyond ``max_pending`` are rejected rather than
+    queued, so a login burst cannot build an unbounded backlog.
+    """
+
+    def __init__(self):
+        settings = get_settings()
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="bcrypt",
+        )
+        self._slots = threading.BoundedSemaphore(settings.password_hash_max_pending)
+
+    async def _run(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashPoolBusy()
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the job itself finishes: a cancelled request
+        # stops awaiting, but a bcrypt job already running keeps its thread
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Verify a password without blocking the event loop."""
+        return await self._run(verify_password, password, password_hash)
+
+
 class SessionTokenManager:
     """Manage session tokens using itsdangerous."""
 
@@ -35,3 +81,4 @@ class SessionTokenManager:
 
 
 session_manager = SessionTokenManager()
+password_hasher = PasswordHasher()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure session-detail latency under concurrent auditors, sync vs async DB.
+
+Usage: python scripts/bench_async_db.py [--auditors N] [--iterations K] [--think-ms MS]
+                                        [--seed S] [--session-id UUID]
+
+Each simulated auditor repeatedly runs the queries behind the health-check
+session detail page, pausing a random think time (mean --think-ms) between a
+response and its next request. The "sync" path calls the blocking
+repositories straight from coroutines, as handlers on get_db do; the "async"
+path uses AsyncSessionLocal and the Async* repositories. Both paths see the
+same think times. A page is timed from when its auditor issues it, not from
+when the event loop gets round to running it, so time spent queued behind a
+page blocking the loop counts as latency on both paths. Each path is warmed
+up with one untimed page per auditor first. --think-ms 0 keeps every auditor
+busy, for the saturated case. Needs DATABASE_URL pointing at a database with
+at least one audit session.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine  # noqa: E402
+from app.models import AuditSession, Project  # noqa: E402
+from app.repositories import (  # noqa: E402
+    AsyncHealthCheckRepository,
+    AsyncProjectRepository,
+    HealthCheckRepository,
+    ProjectRepository,
+)
+
+
+async def sync_page(tenant_id, project_id, session_id) -> None:
+    db = SessionLocal()
+    try:
+        ProjectRepository(db).get_by_id_with_details(tenant_id, project_id)
+        hc_repo = HealthCheckRepository(db)
+        hc_repo.get_session_by_id(session_id)
+        hc_repo.get_control_instances_for_session(session_id)
+        hc_repo.get_session_stats(session_id)
+    finally:
+        db.close()
+
+
+async def async_page(tenant_id, project_id, session_id) -> None:
+    async with AsyncSessionLocal() as db:
+        await AsyncProjectRepository(db).get_by_id_with_details(tenant_id, project_id)
+        hc_repo = AsyncHealthCheckRepository(db)
+        await hc_repo.get_session_by_id(session_id)
+        await hc_repo.get_control_instances_for_session(session_id)
+        await hc_repo.get_session_stats(session_id)
+
+
+async def auditor(
+    page, iterations: int, think: float, rng: random.Random, latencies: list[float], *ids
+) -> None:
+    loop = asyncio.get_running_loop()
+    issued_at = loop.time() + rng.uniform(0, think)
+    for _ in range(iterations):
+        # Wakes late while another page blocks the loop; that wait is latency
+        await asyncio.sleep(max(0.0, issued_at - loop.time()))
+        await page(*ids)
+        done_at = loop.time()
+        latencies.append((done_at - issued_at) * 1000)
+        issued_at = done_at + rng.uniform(0, 2 * think)
+
+
+async def run(
+    page, auditors: int, iterations: int, think_ms: float, seed: int, ids
+) -> tuple[list[float], float]:
+    # Untimed: open the pool's connections and fill statement caches, as a
+    # worker that has been serving for a while has them
+    await asyncio.gather(*(page(*ids) for _ in range(auditors)))
+    latencies: list[float] = []
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(
+            auditor(page, iterations, think_ms / 1000, random.Random(seed + n), latencies, *ids)
+            for n in range(auditors)
+        )
+    )
+    elapsed = time.perf_counter() - started_at
+    await async_engine.dispose()
+    return sorted(latencies), elapsed
+
+
+def percentile(values: list[float], pct: float) -> float:
+    index = min(len(values) - 1, round(pct / 100 * (len(values) - 1)))
+    return values[index]
+
+
+def resolve_ids(session_id: str | None):
+    db = SessionLocal()
+    try:
+        query = db.query(AuditSession.id, Project.id, Project.tenant_id).join(
+            Project, Project.id == AuditSession.project_id
+        )
+        if session_id:
+            query = query.filter(AuditSession.id == session_id)
+        row = query.first()
+        if not row:
+            raise SystemExit("No audit session found; seed a health-check project first.")
+        return row[2], row[1], row[0]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--auditors", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--think-ms", type=float, default=1000, help="Mean pause between pages")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--session-id")
+    args = parser.parse_args()
+
+    ids = resolve_ids(args.session_id)
+    print(f"{'path':<6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, page in (("sync", sync_page), ("async", async_page)):
+        latencies, elapsed = asyncio.run(
+            run(page, args.auditors, args.iterations, args.think_ms, args.seed, ids)
+        )
+        print(
+            f"{name:<6} {len(latencies) / elapsed:>8.0f} "
+            f"{statistics.median(latencies):>8.1f} {percentile(latencies, 95):>8.1f} "
+            f"{percentile(latencies, 99):>8.1f} {latencies[-1]:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
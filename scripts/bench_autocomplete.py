@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Time the auditor and client autocomplete lookups as a name is typed.
+
+Usage: python scripts/bench_autocomplete.py [--tenants N] [--users N] [--clients N]
+       [--runs N] [--keep]
+
+Creates a scratch ``autocomplete_bench`` schema in the DATABASE_URL database
+with --tenants tenants of --users users and --clients clients each, named from
+small pools of first names, surnames and company words so that short prefixes
+match many rows and longer ones few. Each of a handful of names is then typed
+a letter at a time, one lookup per keystroke in a fresh session as the HTMX
+endpoints issue them, --runs times each way:
+
+  scan     ``UserRepository.search`` / ``ClientRepository.search`` with the
+           trigram indexes dropped and the result cache cleared before every
+           lookup: ILIKE '%term%' filters every row of the tenant
+  trigram  the same with the trigram indexes in place, cache still cleared
+  cached   the same with the cache kept across keystrokes and runs, as when
+           several people in a tenant look up the same names or one types,
+           deletes and retypes (cleared once first, so the first typing of
+           each name still goes to Postgres)
+
+Prints the mean and p95 per keystroke and the plan's scan on users/clients for
+the full name. The schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import BaseModel, Client, Tenant, User, UserRole  # noqa: E402
+from app.repositories import ClientRepository, UserRepository  # noqa: E402
+from app.services.autocomplete_cache import autocomplete_cache  # noqa: E402
+
+SCHEMA = "autocomplete_bench"
+FIRST_NAMES = (
+    "Amal", "Anjali", "Chathura", "Daniel", "Dilani", "Fatima", "Grace", "Hiroshi", "Isuru",
+    "James", "Kavindi", "Laura", "Mahesh", "Maria", "Nadeesha", "Oliver", "Priya", "Ruwan",
+    "Sarah", "Tharindu", "Thomas", "Umesh", "Wei", "Yasmin",
+)
+SURNAMES = (
+    "Abeysekara", "Bandara", "Chen", "Dissanayake", "Fernando", "Gunawardena", "Jayasinghe",
+    "Kumara", "Miller", "Nakamura", "Perera", "Rajapaksa", "Silva", "Smith", "Wickramasinghe",
+    "Williams", "Wijesinghe", "Zhang",
+)
+COMPANY_WORDS = (
+    "Atlas", "Ceylon", "Coastal", "Delta", "Harbour", "Horizon", "Lanka", "Meridian", "Northern",
+    "Pacific", "Summit", "Unity",
+)
+COMPANY_KINDS = ("Bank", "Finance", "Holdings", "Insurance", "Logistics", "Retail", "Telecom")
+INDUSTRIES = ("Banking", "Insurance", "Retail", "Telecommunications", "Logistics")
+TYPED = {"users": ("Wickramasinghe", "priya.s"), "clients": ("Meridian Insurance", "harbour")}
+TRIGRAM_INDEXES = {
+    "users": ("full_name", "email"),
+    "clients": ("name", "industry", "contact_name", "contact_email"),
+}
+
+
+def build_directory(db: Session, tenants: int, users: int, clients: int) -> list[uuid.UUID]:
+    """Tenants with named users and clients. Returns the tenant ids."""
+    rng = random.Random(11)
+    tenant_ids = []
+    for t in range(tenants):
+        tenant_id = uuid.uuid4()
+        tenant_ids.append(tenant_id)
+        db.execute(
+            insert(Tenant).values(
+                id=tenant_id, name=f"Tenant {t}", slug=f"bench-{tenant_id.hex[:8]}"
+            )
+        )
+        people = []
+        for i in range(users):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(SURNAMES)
+            people.append({
+                "id": uuid.uuid4(), "tenant_id": tenant_id, "full_name": f"{first} {last}",
+                "email": f"{first.lower()}.{last[0].lower()}{i}.{tenant_id.hex[:6]}@example.com",
+                "role": UserRole.ADMIN if i % 50 == 0 else UserRole.AUDITOR,
+                "is_active": i % 40 != 1,
+            })
+        db.execute(insert(User), people)
+        db.execute(insert(Client), [
+            {
+                "id": uuid.uuid4(), "tenant_id": tenant_id,
+                "name": f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_KINDS)} {i}",
+                "industry": rng.choice(INDUSTRIES),
+                "contact_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}",
+                "contact_email": f"contact{i}@client{i}.example.com",
+            }
+            for i in range(clients)
+        ])
+    db.commit()
+    return tenant_ids
+
+
+def set_trigram_indexes(engine, present: bool) -> None:
+    """Create or drop the trigram indexes, then re-analyze."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table, columns in TRIGRAM_INDEXES.items():
+            for column in columns:
+                if present:
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                        f"ON {table} USING gin ({column} gin_trgm_ops)"
+                    ))
+                else:
+                    conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_{column}_trgm"))
+        conn.execute(text("VACUUM ANALYZE"))
+
+
+def lookup(kind: str):
+    if kind == "users":
+        return lambda db, t, q: UserRepository(db).search(t, q)
+    return lambda db, t, q: ClientRepository(db).search(t, q)
+
+
+def measure(engine, kind: str, tenant_id, runs: int, cached: bool) -> list[float]:
+    """Seconds per keystroke, typing each of the kind's names ``runs`` times."""
+    search = lookup(kind)
+    seconds = []
+    autocomplete_cache.clear()
+    for _ in range(runs):
+        for name in TYPED[kind]:
+            for end in range(1, len(name) + 1):
+                if not cached:
+                    autocomplete_cache.clear()
+                with Session(engine) as db:
+                    started_at = time.perf_counter()
+                    search(db, tenant_id, name[:end])
+                    seconds.append(time.perf_counter() - started_at)
+    return seconds
+
+
+def planned_scans(engine, kind: str, tenant_id, query: str) -> str:
+    """The scans Postgres plans for one uncached lookup."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    autocomplete_cache.clear()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as db:
+            lookup(kind)(db, tenant_id, query)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    with engine.connect() as conn:
+        statement, parameters = statements[-1]
+        plan = conn.exec_driver_sql("EXPLAIN " + statement, parameters).scalars().all()
+    return "; ".join(line.strip() for line in plan if "Scan" in line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tenants", type=int, default=4, help="Tenants in the dataset")
+    parser.add_argument("--users", type=int, default=10000, help="Users per tenant")
+    parser.add_argument("--clients", type=int, default=10000, help="Clients per tenant")
+    parser.add_argument("--runs", type=int, default=5, help="Times each name is typed per way")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        print(f"Loading {args.tenants} tenants of {args.users} users and {args.clients} clients...")
+        with Session(engine) as db:
+            tenant_ids = build_directory(db, args.tenants, args.users, args.clients)
+        tenant_id = tenant_ids[len(tenant_ids) // 2]
+
+        print(f"\n{args.runs} typings of each name, one lookup per keystroke\n")
+        for label, indexed, cached in (
+            ("scan", False, False),
+            ("trigram", True, False),
+            ("cached", True, True),
+        ):
+            set_trigram_indexes(engine, indexed)
+            for kind in TYPED:
+                ms = [s * 1000 for s in measure(engine, kind, tenant_id, args.runs, cached)]
+                print(
+                    f"  {kind:<8} {label:<8} mean={statistics.fmean(ms):7.2f}ms"
+                    f"  p95={statistics.quantiles(ms, n=20)[-1]:7.2f}ms  max={max(ms):7.2f}ms"
+                )
+                if not cached:
+                    print(f"           {planned_scans(engine, kind, tenant_id, TYPED[kind][0])}")
+    finally:
+        engine.dispose()
+        autocomplete_cache.clear()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
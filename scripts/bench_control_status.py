@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Measure control status saves and per-session status counts.
+
+Usage: python scripts/bench_control_status.py [--scale S] [--saves N] [--sessions N] [--keep]
+
+Creates a scratch ``control_status_bench`` schema in the DATABASE_URL database
+and loads the synthetic dataset (scripts/synthetic_dataset.py). Then:
+
+  status saves     --saves calls to ``update_control_instance`` on random
+                   instances, each in its own session and transaction as the
+                   control status route runs it; WAL written per save (from a
+                   CHECKPOINT, so superuser or pg_checkpoint is required) shows
+                   how much of the table and its indexes each save rewrites
+  session stats    ``get_session_stats`` for --sessions random sessions,
+                   after the saves have left their dead row versions behind
+  project stats    ``load_stats`` for every health check project, as the
+                   project overview draws its review scope rollups
+  scope stats      ``load_stats`` for every review scope, as the review scope
+                   page draws its sessions' progress
+
+Table sizes are reported after loading and again after the saves, with
+autovacuum off for the scratch tables so the growth is visible. Only
+repository methods are called, so the script measures whichever table layout
+the models define. The schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import BaseModel, ControlInstanceStatus  # noqa: E402
+from app.repositories import HealthCheckRepository  # noqa: E402
+from app.services.health_check_stats import load_stats  # noqa: E402
+from synthetic_dataset import build_dataset  # noqa: E402
+
+SCHEMA = "control_status_bench"
+TABLES = ("session_control_instances", "session_control_assessments")
+
+SIZES_SQL = """
+SELECT relname, n_live_tup, n_dead_tup, pg_relation_size(relid), pg_indexes_size(relid)
+FROM pg_stat_user_tables
+WHERE schemaname = :schema AND relname = ANY(:tables)
+ORDER BY relname
+"""
+
+
+def _report_sizes(engine, label: str) -> None:
+    with engine.connect() as conn:
+        rows = conn.execute(text(SIZES_SQL), {"schema": SCHEMA, "tables": list(TABLES)}).all()
+    print(f"\n{label}\n")
+    for name, live, dead, heap, indexes in rows:
+        print(
+            f"  {name:<28} live={live:>7} dead={dead:>6}"
+            f"  heap={heap / 1024 / 1024:6.1f}MB  indexes={indexes / 1024 / 1024:6.1f}MB"
+        )
+
+
+def _timings(label: str, seconds: list[float]) -> None:
+    ms = [s * 1000 for s in seconds]
+    print(
+        f"  {label:<14} {len(ms) / sum(seconds):8.0f}/s  mean={statistics.fmean(ms):6.2f}ms"
+        f"  p50={statistics.median(ms):6.2f}ms  p95={statistics.quantiles(ms, n=20)[-1]:6.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset size multiplier")
+    parser.add_argument("--saves", type=int, default=2000, help="Status saves to time")
+    parser.add_argument("--sessions", type=int, default=500, help="Sessions to count statuses for")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+    rng = random.Random(11)
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        with engine.begin() as conn:
+            for table in TABLES:
+                if table in BaseModel.metadata.tables:
+                    conn.execute(text(f"ALTER TABLE {table} SET (autovacuum_enabled = false)"))
+        print(f"Loading synthetic dataset (scale {args.scale}) into schema {SCHEMA}...")
+        with Session(engine) as db:
+            data = build_dataset(db, scale=args.scale)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+        _report_sizes(engine, "After load")
+
+        with Session(engine) as db:
+            user_id = next(iter(data.auditor_ids.values()))[0]
+        statuses = list(ControlInstanceStatus)
+        print(f"\n{args.saves} status saves, {args.sessions} session stats\n")
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            # Start from a checkpoint so both layouts pay the same full-page writes
+            conn.execute(text("CHECKPOINT"))
+            wal_before = conn.execute(text("SELECT pg_current_wal_lsn()")).scalar_one()
+        seconds = []
+        for _ in range(args.saves):
+            instance_id = rng.choice(data.instance_ids)
+            with Session(engine) as db:
+                started_at = time.perf_counter()
+                HealthCheckRepository(db).update_control_instance(
+                    instance_id,
+                    rng.choice(statuses),
+                    "Reviewed against the sampled evidence.",
+                    user_id,
+                )
+                seconds.append(time.perf_counter() - started_at)
+        _timings("status saves", seconds)
+        with engine.connect() as conn:
+            wal_bytes = conn.execute(
+                text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), :before)"),
+                {"before": wal_before},
+            ).scalar_one()
+        print(f"  {'':<14} {wal_bytes / args.saves:8.0f} WAL bytes per save")
+
+        seconds = []
+        with Session(engine) as db:
+            hc_repo = HealthCheckRepository(db)
+            sessions = min(args.sessions, len(data.session_ids))
+            for session_id in rng.sample(data.session_ids, sessions):
+                started_at = time.perf_counter()
+                hc_repo.get_session_stats(session_id)
+                seconds.append(time.perf_counter() - started_at)
+        _timings("session stats", seconds)
+
+        project_ids = [p for ids in data.health_check_project_ids.values() for p in ids]
+        for label, kwargs in (
+            ("project stats", [{"project_id": p} for p in project_ids]),
+            ("scope stats", [{"review_scope_id": r} for r in data.review_scope_ids]),
+        ):
+            seconds = []
+            with Session(engine) as db:
+                for scope in kwargs:
+                    started_at = time.perf_counter()
+                    load_stats(db, **scope)
+                    seconds.append(time.perf_counter() - started_at)
+            _timings(label, seconds)
+
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+        _report_sizes(engine, f"After {args.saves} saves (autovacuum off)")
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Time the dashboard's counts and active project progress, per project versus one query.
+
+Usage: python scripts/bench_dashboard.py [--scale S ...] [--tenants N] [--runs N] [--keep]
+
+For each --scale, creates a scratch ``dashboard_bench`` schema in the
+DATABASE_URL database, loads the synthetic dataset (scripts/synthetic_dataset.py:
+100 projects per tenant per unit of scale, about a quarter of them in progress,
+on a 200-control framework) and runs VACUUM ANALYZE. The dashboard of one
+tenant's admin (every project) and of one auditor (their own and shared
+projects) is then computed --runs times each way, each run in a fresh session:
+
+  loop       what the handler did before: ``filter_projects`` for all, active
+             and completed projects, tenant-wide client and framework lists,
+             then per active project its framework tree and every response
+  aggregate  ``ProjectRepository.dashboard_summary``: one statement
+  cached     the same behind ``dashboard_cache`` (a hit after the first run)
+
+The loop's results are checked against the aggregate's before timing. Prints
+the mean and p95 per way and the number of statements issued. The schema is
+dropped afterwards unless --keep is given.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import BaseModel, ProjectStatus, User, UserRole  # noqa: E402
+from app.repositories import (  # noqa: E402
+    ClientRepository,
+    FrameworkRepository,
+    ProjectRepository,
+    ProjectResponseRepository,
+)
+from app.services.dashboard_cache import dashboard_cache  # noqa: E402
+from synthetic_dataset import build_dataset  # noqa: E402
+
+SCHEMA = "dashboard_bench"
+
+
+def loop_dashboard(db: Session, user) -> tuple[dict, list[tuple]]:
+    """The dashboard as the handler built it before: (stats, [(id, responded, total)])."""
+    project_repo = ProjectRepository(db)
+    framework_repo = FrameworkRepository(db)
+    response_repo = ProjectResponseRepository(db)
+    all_projects = project_repo.filter_projects(user.tenant_id, user=user)
+    active_projects = project_repo.filter_projects(
+        user.tenant_id, status=ProjectStatus.IN_PROGRESS, user=user
+    )
+    completed_projects = project_repo.filter_projects(
+        user.tenant_id, status=ProjectStatus.COMPLETED, user=user
+    )
+    stats = {
+        "total_projects": len(all_projects),
+        "active_projects": len(active_projects),
+        "completed_assessments": len(completed_projects),
+        "pending_responses": response_repo.count_pending_for_tenant(user.tenant_id),
+        "total_clients": len(ClientRepository(db).get_all(user.tenant_id)),
+        "total_frameworks": len(framework_repo.get_all(user.tenant_id)),
+    }
+    progress = []
+    for project in active_projects:
+        framework = framework_repo.get_by_id_with_sections(
+            user.tenant_id, project.framework_id
+        ) if project.framework_id else None
+        total_controls = responded_count = 0
+        if framework:
+            responded = {r.framework_control_id for r in response_repo.get_for_project(project.id)}
+            for section in framework.sections:
+                total_controls += len(section.controls)
+                responded_count += sum(control.id in responded for control in section.controls)
+        progress.append((project.id, responded_count, total_controls))
+    return stats, progress
+
+
+def aggregate_dashboard(db: Session, user):
+    return ProjectRepository(db).dashboard_summary(user.tenant_id, user=user)
+
+
+def cached_dashboard(db: Session, user):
+    summary = dashboard_cache.get(user.tenant_id, user.id)
+    if summary is None:
+        generation = dashboard_cache.generation(user.tenant_id)
+        summary = aggregate_dashboard(db, user)
+        dashboard_cache.put(user.tenant_id, user.id, summary, generation)
+    return summary
+
+
+def check_same(engine, user) -> None:
+    """Fail if the aggregate disagrees with the per-project loop."""
+    with Session(engine) as db:
+        stats, progress = loop_dashboard(db, user)
+        summary = aggregate_dashboard(db, user)
+    assert stats == {key: getattr(summary, key) for key in stats}, (stats, summary)
+    expected = sorted(progress)
+    actual = sorted((p.id, p.responded_count, p.total_controls) for p in summary.projects)
+    assert expected == actual, "active project progress differs"
+
+
+def measure(engine, build, user, runs: int) -> tuple[list[float], int]:
+    """(seconds per run, statements in the last run) for one way of building the dashboard."""
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    seconds = []
+    for _ in range(runs):
+        statements = 0
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            with Session(engine) as db:
+                started_at = time.perf_counter()
+                build(db, user)
+                seconds.append(time.perf_counter() - started_at)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    return seconds, statements
+
+
+def run(database_url: str, scale: float, tenants: int, runs: int, keep: bool) -> None:
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        print(f"\nLoading synthetic dataset (scale {scale}, {tenants} tenants)...")
+        with Session(engine) as db:
+            data = build_dataset(db, scale=scale, tenants=tenants)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+
+        tenant_id = data.tenant_ids[len(data.tenant_ids) // 2]
+        with Session(engine, expire_on_commit=False) as db:
+            admin = db.scalars(
+                select(User).where(User.tenant_id == tenant_id, User.role == UserRole.ADMIN)
+            ).first()
+            auditor = db.get(User, data.auditor_ids[tenant_id][0])
+            db.expunge_all()
+
+        for label, user in (("admin", admin), ("auditor", auditor)):
+            check_same(engine, user)
+            dashboard_cache.clear()
+            with Session(engine) as db:
+                active = aggregate_dashboard(db, user).active_projects
+            print(f"  {label} ({active} active projects)")
+            for way, build in (
+                ("loop", lambda db, u: loop_dashboard(db, u)),
+                ("aggregate", aggregate_dashboard),
+                ("cached", cached_dashboard),
+            ):
+                seconds, statements = measure(engine, build, user, runs)
+                ms = [s * 1000 for s in seconds]
+                print(
+                    f"    {way:<10} mean={statistics.fmean(ms):8.2f}ms"
+                    f"  p95={statistics.quantiles(ms, n=20)[-1]:8.2f}ms  statements={statements}"
+                )
+    finally:
+        engine.dispose()
+        dashboard_cache.clear()
+        if not keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", type=float, nargs="+", default=[1.0, 4.0], help="Dataset size multipliers"
+    )
+    parser.add_argument("--tenants", type=int, default=5, help="Tenants in the dataset")
+    parser.add_argument("--runs", type=int, default=20, help="Timed dashboards per user and way")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the last scratch schema afterwards"
+    )
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    for scale in args.scale:
+        run(database_url, scale, args.tenants, args.runs, args.keep)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Compare ORM entities, list rows and list pages for the project, client, user and control lists.
+
+Usage: python scripts/bench_list_pages.py [--projects N] [--controls N] [--clients N] [--users N]
+       [--page-size N] [--runs N] [--keep]
+
+Creates a scratch ``list_pages_bench`` schema in the DATABASE_URL database
+with one tenant holding --projects projects, --clients clients, --users users
+and one framework of --controls controls (with description, guidance,
+requirement, testing and check point text and a checklist). Each list is then
+loaded --runs times each way, each run in a fresh session as a request does:
+
+  orm    the entity queries the list routes used before (``filter_projects``,
+         ``filter_clients``, ``UserRepository.get_all``, and the admin controls
+         list's ``get_all_with_sections`` walk over sections and controls)
+  rows   the column-projected ``list_*_rows`` queries, unpaged
+  page   the same queries for one page (--page-size rows), as the routes
+         load the first page and every further one on scroll
+
+Latency is the mean and p95 per load; memory is the peak Python allocation of
+one extra load under tracemalloc, which is roughly what the list holds while
+its template renders. The schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import (  # noqa: E402
+    BaseModel,
+    Client,
+    Framework,
+    FrameworkControl,
+    FrameworkSection,
+    Project,
+    ProjectStatus,
+    Tenant,
+    User,
+    UserRole,
+)
+from app.repositories import (  # noqa: E402
+    ClientRepository,
+    FrameworkRepository,
+    ProjectRepository,
+    UserRepository,
+)
+
+SCHEMA = "list_pages_bench"
+CONTROL_TEXT = "The entity maintains and reviews the control as documented. " * 8
+CONTROLS_PER_SECTION = 100
+
+
+def build_tenant(db: Session, projects: int, controls: int, clients: int, users: int) -> uuid.UUID:
+    """One tenant with the given number of rows in each list."""
+    tenant_id = uuid.uuid4()
+    db.execute(
+        insert(Tenant).values(
+            id=tenant_id, name="Bench tenant", slug=f"bench-{tenant_id.hex[:8]}"
+        )
+    )
+    client_ids = [uuid.uuid4() for _ in range(clients)]
+    db.execute(insert(Client), [
+        {
+            "id": client_id, "tenant_id": tenant_id, "name": f"Client {i}", "industry": "Banking",
+            "contact_name": f"Contact {i}", "contact_email": f"contact{i}@example.com",
+            "notes": CONTROL_TEXT,
+        }
+        for i, client_id in enumerate(client_ids)
+    ])
+    db.execute(insert(User), [
+        {
+            "id": uuid.uuid4(), "tenant_id": tenant_id,
+            "email": f"user{i}.{tenant_id.hex[:8]}@example.com",
+            "full_name": f"User {i:05d}", "role": UserRole.AUDITOR, "is_active": True,
+        }
+        for i in range(users)
+    ])
+
+    framework_id = uuid.uuid4()
+    db.execute(
+        insert(Framework).values(id=framework_id, tenant_id=tenant_id, name="Bench framework")
+    )
+    section_ids = [uuid.uuid4() for _ in range(-(-controls // CONTROLS_PER_SECTION))]
+    db.execute(insert(FrameworkSection), [
+        {"id": section_id, "framework_id": framework_id, "name": f"Section {s}", "order": s}
+        for s, section_id in enumerate(section_ids)
+    ])
+    db.execute(insert(FrameworkControl), [
+        {
+            "id": uuid.uuid4(),
+            "framework_section_id": section_ids[i // CONTROLS_PER_SECTION],
+            "control_id": f"{i // CONTROLS_PER_SECTION + 1}.{i % CONTROLS_PER_SECTION + 1}",
+            "name": f"Control {i}",
+            "description": CONTROL_TEXT,
+            "implementation_guidance": CONTROL_TEXT,
+            "requirements_text": CONTROL_TEXT,
+            "testing_procedures_text": CONTROL_TEXT,
+            "check_points_text": CONTROL_TEXT if i % 2 else None,
+            "assessment_checklist": {
+                "items": [{"text": f"Check {n}", "done": False} for n in range(5)]
+            },
+        }
+        for i in range(controls)
+    ])
+
+    statuses = list(ProjectStatus)
+    db.execute(insert(Project), [
+        {
+            "id": uuid.uuid4(), "tenant_id": tenant_id, "client_id": client_ids[i % clients],
+            "framework_id": framework_id, "name": f"Project {i}", "description": CONTROL_TEXT,
+            "status": statuses[i % len(statuses)],
+        }
+        for i in range(projects)
+    ])
+    db.commit()
+    return tenant_id
+
+
+def orm_controls(db: Session, tenant_id) -> list:
+    """The admin controls list as it was built from ORM entities."""
+    controls = []
+    for framework in FrameworkRepository(db).get_all_with_sections(tenant_id):
+        for section in framework.sections:
+            for control in section.controls:
+                controls.append({"control": control, "section": section, "framework": framework})
+    return controls
+
+
+# name -> (orm load, list rows load taking a page size, None for every row)
+LISTS = {
+    "projects": (
+        lambda db, t: ProjectRepository(db).filter_projects(t),
+        lambda db, t, limit: ProjectRepository(db).list_project_rows(t, limit=limit).items,
+    ),
+    "clients": (
+        lambda db, t: ClientRepository(db).filter_clients(t),
+        lambda db, t, limit: ClientRepository(db).list_client_rows(t, limit=limit).items,
+    ),
+    "users": (
+        lambda db, t: UserRepository(db).get_all(t),
+        lambda db, t, limit: UserRepository(db).list_user_rows(t, limit=limit).items,
+    ),
+    "controls": (
+        orm_controls,
+        lambda db, t, limit: FrameworkRepository(db).list_control_rows(t, limit=limit).items,
+    ),
+}
+
+
+def measure(engine, load, tenant_id, runs: int) -> tuple[list[float], int, int]:
+    """(seconds per run, rows, peak traced bytes) for one way of loading a list."""
+    seconds = []
+    for _ in range(runs):
+        with Session(engine) as db:
+            started_at = time.perf_counter()
+            result = load(db, tenant_id)
+            seconds.append(time.perf_counter() - started_at)
+    with Session(engine) as db:
+        tracemalloc.start()
+        result = load(db, tenant_id)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, len(result), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=5000, help="Projects in the tenant")
+    parser.add_argument(
+        "--controls", type=int, default=2000, help="Controls in the tenant's framework"
+    )
+    parser.add_argument("--clients", type=int, default=500, help="Clients in the tenant")
+    parser.add_argument("--users", type=int, default=500, help="Users in the tenant")
+    parser.add_argument("--page-size", type=int, default=50, help="Rows per page for the page path")
+    parser.add_argument("--runs", type=int, default=20, help="Timed loads per list and path")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        with Session(engine) as db:
+            tenant_id = build_tenant(db, args.projects, args.controls, args.clients, args.users)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+
+        print(f"\n{args.runs} loads per list\n")
+        for name, (orm_load, rows_load) in LISTS.items():
+            for label, load in (
+                ("orm", orm_load),
+                ("rows", lambda db, t, load=rows_load: load(db, t, None)),
+                ("page", lambda db, t, load=rows_load: load(db, t, args.page_size)),
+            ):
+                seconds, count, peak = measure(engine, load, tenant_id, args.runs)
+                ms = [s * 1000 for s in seconds]
+                print(
+                    f"  {name:<9} {label:<5} {count:>6} rows  mean={statistics.fmean(ms):7.2f}ms"
+                    f"  p95={statistics.quantiles(ms, n=20)[-1]:7.2f}ms"
+                    f"  peak={peak / 1024 / 1024:6.1f}MB"
+                )
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
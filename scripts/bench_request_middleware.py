@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Compare req/s of the request context middleware against the legacy stack.
+
+Usage: python scripts/bench_request_middleware.py [--requests N] [--concurrency C] [--email USER]
+
+Both stacks wrap the same tiny app (an HTML route and a /static mount) and are
+driven in-process over ASGI, so the numbers isolate middleware overhead. Pass
+--email to send a session cookie for that user; this needs DATABASE_URL to
+point at a seeded database because the legacy stack queries it per request.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import HTMLResponse  # noqa: E402
+from fastapi.staticfiles import StaticFiles  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.logging_config import bind_log_context, reset_log_context  # noqa: E402
+from app.middleware.request_context import RequestContextMiddleware  # noqa: E402
+from app.models import Tenant, User  # noqa: E402
+from app.services.auth_service import (  # noqa: E402
+    create_session_token,
+    get_user_from_token,
+)
+from app.services.principal_cache import principal_cache  # noqa: E402
+
+ACCESS_LOGGER = logging.getLogger("auditpro.access")
+
+
+# --- Legacy stack: three BaseHTTPMiddleware layers, as registered before ---
+
+
+class LegacyTenantMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        tenant = None
+        user = getattr(request.state, "user", None)
+        if user:
+            db = SessionLocal()
+            try:
+                tenant = db.query(Tenant).filter(Tenant.id == user.tenant_id).first()
+            finally:
+                db.close()
+            if tenant:
+                bind_log_context(tenant_id=tenant.id)
+        request.state.tenant = tenant
+        return await call_next(request)
+
+
+class LegacyAuthMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        user = None
+        token = request.cookies.get(get_settings().session_cookie_name)
+        if token:
+            principal_cache.clear()  # the legacy stack always hit the users table
+            user = await get_user_from_token(token)
+            if user:
+                bind_log_context(user_id=user.id, tenant_id=user.tenant_id)
+        request.state.user = user
+        return await call_next(request)
+
+
+class LegacyRequestLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex[:12]
+        request.state.request_id = request_id
+        bind_log_context(
+            request_id=request_id,
+            client_ip=request.client.host if request.client else "-",
+            method=request.method,
+            path=request.url.path,
+        )
+        started_at = time.perf_counter()
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        ACCESS_LOGGER.info(
+            "request_completed status=%s duration_ms=%.2f bytes=%s",
+            response.status_code,
+            (time.perf_counter() - started_at) * 1000,
+            response.headers.get("content-length", "-"),
+        )
+        reset_log_context()
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+
+    @app.get("/ping", response_class=HTMLResponse)
+    async def ping():
+        return "<p>pong</p>"
+
+    if stack == "legacy":
+        app.add_middleware(LegacyTenantMiddleware)
+        app.add_middleware(LegacyAuthMiddleware)
+        app.add_middleware(LegacyRequestLoggingMiddleware)
+    else:
+        app.add_middleware(RequestContextMiddleware)
+    return app
+
+
+async def call(app, path: str, cookie: str | None) -> int:
+    headers = [(b"host", b"bench")]
+    if cookie:
+        headers.append((b"cookie", cookie.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    status = 0
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if body_sent:
+            await asyncio.Event().wait()  # a real client stays connected until the response ends
+        body_sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app, path: str, total: int, concurrency: int, cookie: str | None) -> float:
+    await call(app, path, cookie)  # warm up routing and static file lookup
+    started_at = time.perf_counter()
+    for offset in range(0, total, concurrency):
+        batch = min(concurrency, total - offset)
+        await asyncio.gather(*(call(app, path, cookie) for _ in range(batch)))
+    return total / (time.perf_counter() - started_at)
+
+
+def session_cookie_for(email: str) -> str:
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        if not user:
+            raise SystemExit(f"No user with email {email}")
+        return f"{get_settings().session_cookie_name}={create_session_token(user)}"
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--email", help="Authenticate requests as this user")
+    args = parser.parse_args()
+
+    logging.getLogger("auditpro").setLevel(logging.WARNING)
+    cookie = session_cookie_for(args.email) if args.email else None
+    static_asset = "/static/favicon.svg"
+
+    print(f"{'stack':<10} {'path':<22} {'req/s':>10}")
+    for stack in ("legacy", "context"):
+        app = build_app(stack)
+        for path in ("/ping", static_asset):
+            rps = asyncio.run(run(app, path, args.requests, args.concurrency, cookie))
+            print(f"{stack:<10} {path:<22} {rps:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
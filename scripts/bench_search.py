@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Time full-text search against an ILIKE scan of the same text.
+
+Usage: python scripts/bench_search.py [--scale S] [--tenants N] [--runs N] [--keep]
+
+Creates a scratch ``search_bench`` schema in the DATABASE_URL database, loads
+the synthetic dataset (scripts/synthetic_dataset.py, whose findings,
+observations and evidence notes draw on a small vocabulary of audit text) and
+runs VACUUM ANALYZE. Each query is then run --runs times, each run in a fresh
+session, two ways:
+
+  ilike  every searchable text column matched with ILIKE '%term%' for each
+         word, across the same sources and tenant; unranked, no snippets
+  fts    ``SearchRepository.search``: GIN-indexed ``search_vector`` matches,
+         ranked, best 50 with ``ts_headline`` snippets
+
+Prints the mean and p95 per query and the number of results. The schema is
+dropped afterwards unless --keep is given.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_, create_engine, or_, select, text, union_all  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import (  # noqa: E402
+    AuditSession,
+    BaseModel,
+    ControlInstanceEvidenceFile,
+    Framework,
+    FrameworkControl,
+    FrameworkSection,
+    Project,
+    ProjectEvidenceFile,
+    ProjectResponse,
+    SessionControlInstance,
+)
+from app.models.health_check import SessionControlObservation, SessionControlObservationEvidence  # noqa: E402
+from app.models.project import ProjectObservation  # noqa: E402
+from app.repositories.search import SearchRepository  # noqa: E402
+from synthetic_dataset import build_dataset  # noqa: E402
+
+SCHEMA = "search_bench"
+QUERIES = (
+    "TLS 1.0",
+    "default passwords",
+    "requirement 3.4",
+    "load balancer cipher",
+    "segmentation",
+)
+
+
+def _ilike_all(columns, words):
+    """Every word appears in one of the columns."""
+    return and_(*(or_(*(column.ilike(f"%{word}%") for column in columns)) for word in words))
+
+
+def ilike_search(db: Session, tenant_id, query: str) -> list:
+    """The search as a scan of the text columns, for comparison."""
+    words = query.split()
+    observation = SessionControlObservation
+    observation_note = SessionControlObservationEvidence
+    session_sources = (
+        (observation, observation.session_control_instance_id,
+         (observation.observation_text, observation.recommendation_text)),
+        (ControlInstanceEvidenceFile, ControlInstanceEvidenceFile.session_control_instance_id,
+         (ControlInstanceEvidenceFile.content,)),
+    )
+    branches = [
+        select(FrameworkControl.id)
+        .join(FrameworkSection, FrameworkSection.id == FrameworkControl.framework_section_id)
+        .join(Framework, Framework.id == FrameworkSection.framework_id)
+        .where(Framework.tenant_id == tenant_id, _ilike_all((
+            FrameworkControl.control_id, FrameworkControl.name, FrameworkControl.description,
+            FrameworkControl.requirements_text, FrameworkControl.implementation_guidance,
+            FrameworkControl.testing_procedures_text, FrameworkControl.check_points_text,
+        ), words)),
+        select(ProjectResponse.id)
+        .join(Project, Project.id == ProjectResponse.project_id)
+        .where(Project.tenant_id == tenant_id, _ilike_all((
+            ProjectResponse.finding, ProjectResponse.recommendation, ProjectResponse.response_text,
+        ), words)),
+        select(ProjectObservation.id)
+        .join(Project, Project.id == ProjectObservation.project_id)
+        .where(Project.tenant_id == tenant_id, _ilike_all((
+            ProjectObservation.observation_text, ProjectObservation.recommendation_text,
+        ), words)),
+        select(ProjectEvidenceFile.id)
+        .join(
+            ProjectObservation, ProjectObservation.id == ProjectEvidenceFile.project_observation_id
+        )
+        .join(Project, Project.id == ProjectObservation.project_id)
+        .where(Project.tenant_id == tenant_id, _ilike_all((ProjectEvidenceFile.content,), words)),
+        select(observation_note.id)
+        .join(observation, observation.id == observation_note.session_control_observation_id)
+        .join(SessionControlInstance,
+              SessionControlInstance.id == observation.session_control_instance_id)
+        .join(AuditSession, AuditSession.id == SessionControlInstance.audit_session_id)
+        .join(Project, Project.id == AuditSession.project_id)
+        .where(Project.tenant_id == tenant_id, _ilike_all((observation_note.content,), words)),
+    ]
+    for model, instance_id, columns in session_sources:
+        branches.append(
+            select(model.id)
+            .join(SessionControlInstance, SessionControlInstance.id == instance_id)
+            .join(AuditSession, AuditSession.id == SessionControlInstance.audit_session_id)
+            .join(Project, Project.id == AuditSession.project_id)
+            .where(Project.tenant_id == tenant_id, _ilike_all(columns, words))
+        )
+    return db.execute(union_all(*branches)).all()
+
+
+def measure(engine, search, tenant_id, query: str, runs: int) -> tuple[list[float], int]:
+    """(seconds per run, results) for one way of searching."""
+    seconds = []
+    for _ in range(runs):
+        with Session(engine) as db:
+            started_at = time.perf_counter()
+            results = search(db, tenant_id, query)
+            seconds.append(time.perf_counter() - started_at)
+    return seconds, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset size multiplier")
+    parser.add_argument("--tenants", type=int, default=20, help="Tenants in the dataset")
+    parser.add_argument("--runs", type=int, default=20, help="Timed searches per query and way")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        print(f"Loading synthetic dataset (scale {args.scale}, {args.tenants} tenants)...")
+        with Session(engine) as db:
+            data = build_dataset(db, scale=args.scale, tenants=args.tenants)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+            searchable = conn.execute(text(
+                "SELECT sum(n_live_tup) FROM pg_stat_user_tables WHERE relname IN ("
+                "'framework_controls', 'project_responses', 'project_observations', "
+                "'project_evidence_files', 'session_control_observations', "
+                "'control_instance_evidence_files', 'session_control_observation_evidence')"
+            )).scalar()
+        tenant_id = data.tenant_ids[len(data.tenant_ids) // 2]
+        ways = (
+            ("ilike", ilike_search),
+            ("fts", lambda db, t, q: SearchRepository(db).search(t, q)),
+        )
+
+        print(f"\n{searchable} searchable rows, {args.runs} searches per query\n")
+        for query in QUERIES:
+            for label, search in ways:
+                seconds, count = measure(engine, search, tenant_id, query, args.runs)
+                ms = [s * 1000 for s in seconds]
+                print(
+                    f"  {query!r:<24} {label:<6} {count:>6} results"
+                    f"  mean={statistics.fmean(ms):7.2f}ms"
+                    f"  p95={statistics.quantiles(ms, n=20)[-1]:7.2f}ms"
+                )
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
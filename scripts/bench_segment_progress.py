@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Time a parent project's segment progress, per segment versus one grouped query.
+
+Usage: python scripts/bench_segment_progress.py [--segments N ...] [--runs N] [--keep]
+
+Creates a scratch ``segment_bench`` schema in the DATABASE_URL database, loads
+the synthetic dataset (scripts/synthetic_dataset.py, 200-control frameworks)
+and adds, in one of its tenants, a parent project per --segments count with
+that many segments, each with responses in every status to a random half of
+the framework's controls. After VACUUM ANALYZE the segment progress of each
+parent is computed --runs times each way, each run in a fresh session:
+
+  loop     what ``detail_project`` did before: ``get_children``, then per
+           segment its framework tree and every response, matching each
+           control against the responses
+  grouped  ``ProjectRepository.segment_progress``: one statement
+
+The loop's counts are checked against the grouped query's before timing.
+Prints the mean and p95 per way and the number of statements issued. The
+schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import BaseModel, Project, ProjectResponse, ProjectStatus, ProjectType  # noqa: E402
+from app.models.project import ResponseStatus  # noqa: E402
+from app.repositories import FrameworkRepository, ProjectRepository, ProjectResponseRepository  # noqa: E402
+from synthetic_dataset import build_dataset  # noqa: E402
+
+SCHEMA = "segment_bench"
+
+
+def add_parent(
+    db: Session, tenant_id, client_id, framework_id, controls: list, segments: int, rng
+) -> uuid.UUID:
+    """A parent project with ``segments`` segments that have responses. Returns its id."""
+    parent_id = uuid.uuid4()
+    projects = [{
+        "id": parent_id, "tenant_id": tenant_id, "client_id": client_id,
+        "framework_id": framework_id,
+        "name": f"Parent of {segments}", "status": ProjectStatus.IN_PROGRESS,
+        "project_type": ProjectType.STANDARD_AUDIT,
+    }]
+    responses = []
+    for s in range(segments):
+        segment_id = uuid.uuid4()
+        projects.append({
+            "id": segment_id, "tenant_id": tenant_id, "client_id": client_id,
+            "framework_id": framework_id,
+            "parent_project_id": parent_id, "name": f"Segment {s}",
+            "status": rng.choice(list(ProjectStatus)), "project_type": ProjectType.STANDARD_AUDIT,
+        })
+        responses.extend(
+            {"project_id": segment_id, "framework_control_id": control_id,
+             "status": rng.choice(list(ResponseStatus))}
+            for control_id in rng.sample(controls, len(controls) // 2)
+        )
+    db.execute(insert(Project), projects)
+    db.execute(insert(ProjectResponse), responses)
+    db.commit()
+    return parent_id
+
+
+def loop_progress(db: Session, tenant_id, parent_id) -> list[tuple]:
+    """Segment progress as the handler computed it before: [(id, responded, total)]."""
+    framework_repo = FrameworkRepository(db)
+    response_repo = ProjectResponseRepository(db)
+    progress = []
+    for segment in ProjectRepository(db).get_children(tenant_id, parent_id):
+        framework = framework_repo.get_by_id_with_sections(tenant_id, segment.framework_id)
+        all_responses = response_repo.get_for_project(segment.id)
+        total_controls = responded_count = 0
+        if framework:
+            for section in framework.sections:
+                total_controls += len(section.controls)
+                for control in section.controls:
+                    if any(r.framework_control_id == control.id for r in all_responses):
+                        responded_count += 1
+        progress.append((segment.id, responded_count, total_controls))
+    return progress
+
+
+def grouped_progress(db: Session, tenant_id, parent_id):
+    return ProjectRepository(db).segment_progress(tenant_id, parent_id)
+
+
+def check_same(engine, tenant_id, parent_id) -> None:
+    """Fail if the grouped query disagrees with the per-segment loop."""
+    with Session(engine) as db:
+        expected = sorted(loop_progress(db, tenant_id, parent_id))
+        rows = grouped_progress(db, tenant_id, parent_id)
+    assert expected == sorted((r.id, r.responded_count, r.total_controls) for r in rows), (
+        "segment progress differs"
+    )
+    for row in rows:
+        assert row.responded_count == (
+            row.not_started_count + row.draft_count + row.complied_count + row.not_complied_count
+        ), "status breakdown does not add up"
+
+
+def measure(engine, build, tenant_id, parent_id, runs: int) -> tuple[list[float], int]:
+    """(seconds per run, statements in the last run) for one way of computing progress."""
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    seconds = []
+    for _ in range(runs):
+        statements = 0
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            with Session(engine) as db:
+                started_at = time.perf_counter()
+                build(db, tenant_id, parent_id)
+                seconds.append(time.perf_counter() - started_at)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    return seconds, statements
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--segments", type=int, nargs="+", default=[3, 30, 100], help="Segments per parent"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=20, help="Timed computations per parent and way"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        print("Loading synthetic dataset...")
+        rng = random.Random(3)
+        with Session(engine) as db:
+            data = build_dataset(db, tenants=5)
+            tenant_id = data.tenant_ids[len(data.tenant_ids) // 2]
+            framework_id = data.framework_ids[tenant_id]
+            client_id = db.get(Project, data.project_ids[tenant_id][0]).client_id
+            parents = [
+                (segments, add_parent(
+                    db, tenant_id, client_id, framework_id, data.control_ids[framework_id],
+                    segments, rng,
+                ))
+                for segments in args.segments
+            ]
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+
+        for segments, parent_id in parents:
+            check_same(engine, tenant_id, parent_id)
+            print(f"\n  {segments} segments")
+            for way, build in (("loop", loop_progress), ("grouped", grouped_progress)):
+                seconds, statements = measure(engine, build, tenant_id, parent_id, args.runs)
+                ms = [s * 1000 for s in seconds]
+                print(
+                    f"    {way:<8} mean={statistics.fmean(ms):8.2f}ms"
+                    f"  p95={statistics.quantiles(ms, n=20)[-1]:8.2f}ms  statements={statements}"
+                )
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Measure audit session creation latency for review scopes of different sizes.
+
+Usage: python scripts/bench_session_seeding.py [--sizes 50,500,5000] [--runs N]
+       [--assets N] [--keep]
+
+Creates a scratch ``session_seeding_bench`` schema in the DATABASE_URL
+database with one framework per size, each mapping that many controls (with
+requirement, testing procedure and checklist text) to one review scope type.
+Each run creates a session and seeds its control instances in one unit of
+work, as the create-session route does, and deletes the session afterwards
+so every run starts from the same table size. Peak Python memory comes from
+one extra run per size under tracemalloc. Every control has distinct text, so
+the first session of a scope stores its snapshots and later sessions reuse them.
+
+Afterwards --assets sessions are kept per scope and the script reports the
+size of ``session_control_instances`` and ``control_snapshots`` next to the
+snapshot text the instances would hold if each copied it inline. The schema
+is dropped afterwards unless --keep is given.
+"""
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, delete, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import unit_of_work  # noqa: E402
+from app.models import (  # noqa: E402
+    AuditSession,
+    BaseModel,
+    Client,
+    ControlToReviewScopeMapping,
+    Framework,
+    FrameworkControl,
+    FrameworkSection,
+    Project,
+    ProjectType,
+    ReviewScope,
+    ReviewScopeType,
+    SessionControlInstance,
+    Tenant,
+)
+from app.repositories import HealthCheckRepository  # noqa: E402
+
+SCHEMA = "session_seeding_bench"
+CONTROL_TEXT = "The entity maintains and reviews the control as documented. " * 8
+
+STORAGE_SQL = """
+SELECT
+    (SELECT count(*) FROM session_control_instances),
+    pg_total_relation_size('session_control_instances'),
+    (SELECT count(*) FROM control_snapshots),
+    pg_total_relation_size('control_snapshots'),
+    (SELECT coalesce(sum(
+        coalesce(pg_column_size(s.description), 0)
+        + coalesce(pg_column_size(s.requirements_text), 0)
+        + coalesce(pg_column_size(s.testing_procedures_text), 0)
+        + coalesce(pg_column_size(s.check_points_text), 0)
+        + coalesce(pg_column_size(s.assessment_checklist), 0)
+    ), 0)
+     FROM session_control_instances i
+     JOIN control_snapshots s ON s.content_hash = i.control_snapshot_hash)
+"""
+
+
+def build_scope(db: Session, tenant_id, client_id, size: int) -> tuple:
+    """A framework with ``size`` controls all mapped to one review scope type."""
+    framework_id, section_id, type_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    db.execute(
+        insert(Framework).values(id=framework_id, tenant_id=tenant_id, name=f"Framework {size}")
+    )
+    db.execute(
+        insert(FrameworkSection).values(
+            id=section_id, framework_id=framework_id, name="Section", order=0
+        )
+    )
+    controls = [
+        {
+            "id": uuid.uuid4(),
+            "framework_section_id": section_id,
+            "control_id": f"{i // 100 + 1}.{i % 100 + 1}",
+            "name": f"Control {i}",
+            "description": f"{CONTROL_TEXT}({i})",
+            "requirements_text": f"{CONTROL_TEXT}({i})",
+            "testing_procedures_text": f"{CONTROL_TEXT}({i})",
+            "check_points_text": f"{CONTROL_TEXT}({i})",
+            "assessment_checklist": {
+                "items": [{"text": f"Check {n}", "done": False} for n in range(5)]
+            },
+        }
+        for i in range(size)
+    ]
+    db.execute(insert(FrameworkControl), controls)
+    db.execute(
+        insert(ReviewScopeType).values(
+            id=type_id, framework_id=framework_id, name="Scope", sort_order=0
+        )
+    )
+    db.execute(
+        insert(ControlToReviewScopeMapping),
+        [{"review_scope_type_id": type_id, "framework_control_id": c["id"]} for c in controls],
+    )
+    project_id, scope_id = uuid.uuid4(), uuid.uuid4()
+    db.execute(
+        insert(Project).values(
+            id=project_id,
+            tenant_id=tenant_id,
+            client_id=client_id,
+            framework_id=framework_id,
+            name=f"Health check {size}",
+            project_type=ProjectType.PCI_DSS_HEALTH_CHECK,
+        )
+    )
+    db.execute(
+        insert(ReviewScope).values(id=scope_id, project_id=project_id, review_scope_type_id=type_id)
+    )
+    return project_id, scope_id, type_id
+
+
+def create_session(
+    engine, scope_id, project_id, type_id, size: int, trace: bool = False, keep: bool = False
+) -> tuple[float, int]:
+    """Create and seed one session as the route does; returns (seconds, peak traced bytes)."""
+    with Session(engine) as db:
+        hc_repo = HealthCheckRepository(db)
+        if trace:
+            tracemalloc.start()
+        started_at = time.perf_counter()
+        with unit_of_work(db):
+            session = hc_repo.create_session(scope_id, project_id, "Bench asset")
+            count = hc_repo.seed_control_instances(session, type_id)
+            session_id = session.id
+        elapsed = time.perf_counter() - started_at
+        peak = 0
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        if not keep:
+            # Remove the session so every run sees the same table size
+            db.execute(
+                delete(SessionControlInstance).where(
+                    SessionControlInstance.audit_session_id == session_id
+                )
+            )
+            db.execute(delete(AuditSession).where(AuditSession.id == session_id))
+            db.commit()
+    if count != size:
+        raise SystemExit(f"Seeded {count} instances, expected {size}")
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="50,500,5000", help="Comma-separated controls per review scope"
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Sessions created per size")
+    parser.add_argument(
+        "--assets", type=int, default=20, help="Sessions kept per scope for the storage report"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        tenant_id, client_id = uuid.uuid4(), uuid.uuid4()
+        with Session(engine) as db:
+            db.execute(insert(Tenant), [{"id": tenant_id, "name": "Bench", "slug": "bench"}])
+            db.execute(
+                insert(Client).values(id=client_id, tenant_id=tenant_id, name="Bench client")
+            )
+            scopes = {size: build_scope(db, tenant_id, client_id, size) for size in sizes}
+            db.commit()
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("ANALYZE"))
+
+        print(f"Session creation, {args.runs} runs per size\n")
+        print(f"  {'controls':>8} {'mean':>9} {'p50':>9} {'max':>9} {'peak mem':>10}")
+        for size in sizes:
+            project_id, scope_id, type_id = scopes[size]
+            seconds = []
+            for _ in range(args.runs):
+                elapsed, _peak = create_session(engine, scope_id, project_id, type_id, size)
+                seconds.append(elapsed)
+            # One more run under tracemalloc, which would skew the timings above
+            _elapsed, peak = create_session(engine, scope_id, project_id, type_id, size, trace=True)
+            ms = [s * 1000 for s in seconds]
+            print(
+                f"  {size:>8} {statistics.fmean(ms):7.1f}ms {statistics.median(ms):7.1f}ms"
+                f" {max(ms):7.1f}ms {peak / 1024 / 1024:8.1f}MB"
+            )
+
+        # Storage once every scope has --assets seeded sessions
+        for size in sizes:
+            project_id, scope_id, type_id = scopes[size]
+            for _ in range(args.assets):
+                create_session(engine, scope_id, project_id, type_id, size, keep=True)
+        with engine.connect() as conn:
+            instances, instance_bytes, snapshot_rows, snapshot_bytes, inline_bytes = conn.execute(
+                text(STORAGE_SQL)
+            ).one()
+        print(f"\nStorage after {args.assets} sessions per scope ({instances} instances)\n")
+        print(f"  session_control_instances  {instance_bytes / 1024 / 1024:8.1f}MB")
+        print(
+            f"  control_snapshots          {snapshot_bytes / 1024 / 1024:8.1f}MB"
+            f"  ({snapshot_rows} rows)"
+        )
+        print(f"  snapshot text if copied per instance {inline_bytes / 1024 / 1024:8.1f}MB")
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
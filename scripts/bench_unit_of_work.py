@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Count commits and round trips for the control panel save with and without a unit of work.
+
+Usage: python scripts/bench_unit_of_work.py [--new N] [--updated N] [--runs N] [--keep]
+
+Creates a scratch ``unit_of_work_bench`` schema in the DATABASE_URL database and
+loads a small synthetic dataset (scripts/synthetic_dataset.py). Two write paths
+are then replayed the way their routes run them:
+
+  control panel save   status + notes, --new observations with a note each and
+                       --updated recommendation edits on existing observations
+  health check create  a new project plus one review scope per scope type
+
+"commit per call" is the previous route code (each repository call commits and
+refreshes); "unit of work" wraps the same writes in ``unit_of_work`` so they
+flush in batches and commit once. A round trip is every statement sent plus
+every COMMIT. The schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import unit_of_work  # noqa: E402
+from app.models import BaseModel, Client, ControlInstanceStatus, ProjectType  # noqa: E402
+from app.models.health_check import SessionControlObservation  # noqa: E402
+from app.repositories import HealthCheckRepository, ProjectRepository  # noqa: E402
+from synthetic_dataset import build_dataset  # noqa: E402
+
+SCHEMA = "unit_of_work_bench"
+
+
+class RoundTrips:
+    """Counts statements and commits on an engine while active."""
+
+    def __init__(self, engine):
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine, "after_cursor_execute", self._statement)
+        event.listen(engine, "commit", self._commit)
+
+    def _statement(self, *args):
+        self.statements += 1
+
+    def _commit(self, conn):
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = self.commits = 0
+
+
+def _observations(count: int, run: int) -> list[tuple[str, str | None, str | None]]:
+    return [(f"Finding {run}.{i}", f"<p>Fix {i}</p>", f"Note {i}") for i in range(count)]
+
+
+def save_commit_per_call(db: Session, instance_id, user_id, new, recommendations) -> None:
+    """The control panel save as the route ran it before unit of work."""
+    hc_repo = HealthCheckRepository(db)
+    instance = hc_repo.get_control_instance_with_observations(instance_id)
+    hc_repo.update_control_instance(instance_id, ControlInstanceStatus.PASS, "Notes", user_id)
+    for obs_text, obs_rec, obs_note in new:
+        new_obs = hc_repo.create_observation(instance.id, obs_text, obs_rec)
+        if obs_note:
+            hc_repo.add_observation_text_note(new_obs.id, obs_note)
+    for obs_id, obs_rec in recommendations.items():
+        hc_repo.update_observation_recommendation(obs_id, obs_rec)
+    instance = hc_repo.get_control_instance_with_observations(instance.id)
+    [obs.evidence_files for obs in instance.observations]
+
+
+def save_unit_of_work(db: Session, instance_id, user_id, new, recommendations) -> None:
+    """The control panel save as the route runs it now."""
+    hc_repo = HealthCheckRepository(db)
+    instance = hc_repo.get_control_instance_with_observations(instance_id)
+    with unit_of_work(db):
+        hc_repo.save_control_assessment(
+            instance, ControlInstanceStatus.PASS, "Notes", user_id, new, recommendations
+        )
+        [obs.evidence_files for obs in instance.observations]
+
+
+def create_commit_per_call(db: Session, tenant_id, client_id, framework_id, user_id) -> None:
+    """Health check project creation as the route ran it before unit of work."""
+    project = ProjectRepository(db).create(
+        tenant_id=tenant_id, client_id=client_id, framework_id=framework_id, name="Bench",
+        owner_id=user_id, project_type=ProjectType.PCI_DSS_HEALTH_CHECK,
+    )
+    db.refresh(project, ["client", "framework"])
+    hc_repo = HealthCheckRepository(db)
+    scope_types = hc_repo.get_review_scope_types_for_framework(project.framework_id)
+    for i, review_scope_type in enumerate(scope_types):
+        hc_repo.add_review_scope_to_project(project.id, review_scope_type.id, sort_order=i)
+
+
+def create_unit_of_work(db: Session, tenant_id, client_id, framework_id, user_id) -> None:
+    """Health check project creation as the route runs it now."""
+    with unit_of_work(db):
+        project = ProjectRepository(db).create(
+            tenant_id=tenant_id, client_id=client_id, framework_id=framework_id, name="Bench",
+            owner_id=user_id, project_type=ProjectType.PCI_DSS_HEALTH_CHECK,
+        )
+        hc_repo = HealthCheckRepository(db)
+        review_scope_types = hc_repo.get_review_scope_types_for_framework(project.framework_id)
+        hc_repo.add_review_scopes_to_project(project.id, [t.id for t in review_scope_types])
+
+
+def _report(label: str, counter: RoundTrips, runs: int, seconds: list[float]) -> None:
+    ms = [s * 1000 for s in seconds]
+    print(
+        f"  {label:<16} statements={counter.statements / runs:5.1f}"
+        f"  commits={counter.commits / runs:4.1f}"
+        f"  round trips={(counter.statements + counter.commits) / runs:5.1f}"
+        f"  mean={statistics.fmean(ms):6.2f}ms  p50={statistics.median(ms):6.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--new", type=int, default=5, help="New observations per save, each with a note"
+    )
+    parser.add_argument(
+        "--updated",
+        type=int,
+        default=5,
+        help="Existing observations whose recommendation changes",
+    )
+    parser.add_argument("--runs", type=int, default=20, help="Saves per scenario")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    make_session = sessionmaker(bind=engine, autoflush=False)
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        with Session(engine) as db:
+            data = build_dataset(db, scale=0.1, tenants=2)
+        tenant_id = data.tenant_ids[0]
+        user_id = data.auditor_ids[tenant_id][0]
+
+        # Give every benchmarked instance --updated existing observations to edit
+        instance_ids = data.instance_ids[1 : 1 + 2 * args.runs]
+        with Session(engine) as db:
+            for instance_id in instance_ids:
+                db.add_all(
+                    SessionControlObservation(
+                        session_control_instance_id=instance_id, observation_text="Existing"
+                    )
+                    for _ in range(args.updated)
+                )
+            db.commit()
+            client_id = db.query(Client.id).filter(Client.tenant_id == tenant_id).limit(1).scalar()
+            existing = {
+                instance_id: [
+                    obs_id for (obs_id,) in db.query(SessionControlObservation.id).filter(
+                        SessionControlObservation.session_control_instance_id == instance_id
+                    )
+                ]
+                for instance_id in instance_ids
+            }
+
+        with Session(engine) as db:
+            stored_before = db.query(SessionControlObservation).count()
+
+        counter = RoundTrips(engine)
+        print(
+            f"Control panel save: {args.new} new observations with notes, "
+            f"{args.updated} recommendation edits, {args.runs} saves\n"
+        )
+        for label, save, batch in (
+            ("commit per call", save_commit_per_call, instance_ids[: args.runs]),
+            ("unit of work", save_unit_of_work, instance_ids[args.runs :]),
+        ):
+            counter.reset()
+            seconds = []
+            for run, instance_id in enumerate(batch):
+                recommendations = {obs_id: f"<p>Edit {run}</p>" for obs_id in existing[instance_id]}
+                with make_session() as db:
+                    started_at = time.perf_counter()
+                    save(db, instance_id, user_id, _observations(args.new, run), recommendations)
+                    seconds.append(time.perf_counter() - started_at)
+            _report(label, counter, len(batch), seconds)
+
+        with Session(engine) as db:
+            added = db.query(SessionControlObservation).count() - stored_before
+        print(f"  observations added: {added} (expected {len(instance_ids) * args.new})")
+
+        print("\nHealth check project create: one review scope per scope type\n")
+        for label, create in (
+            ("commit per call", create_commit_per_call),
+            ("unit of work", create_unit_of_work),
+        ):
+            counter.reset()
+            seconds = []
+            for _ in range(args.runs):
+                with make_session() as db:
+                    started_at = time.perf_counter()
+                    create(db, tenant_id, client_id, data.framework_ids[tenant_id], user_id)
+                    seconds.append(time.perf_counter() - started_at)
+            _report(label, counter, args.runs, seconds)
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
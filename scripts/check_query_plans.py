@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Check that key repository queries are planned with index scans.
+
+Usage: python scripts/check_query_plans.py [--scale S] [--keep] [--verbose]
+
+Creates a scratch ``query_plan_check`` schema in the DATABASE_URL database,
+builds the tables from the models, loads a synthetic multi-tenant dataset
+(scripts/synthetic_dataset.py) and runs VACUUM ANALYZE (the vacuum moves GIN
+pending-list entries into the index, as autovacuum would; until then the
+planner prices full-text matches as scans). Each check then calls real
+repository methods, captures the SELECTs they issue and runs EXPLAIN on them
+with the same parameters. A check fails if any of its guarded tables is read
+with a sequential scan. A final check fails if any foreign key lacks an index
+that starts with its columns, since cascading deletes and parent lookups
+would then scan the child table.
+
+Exits non-zero when a check fails, so it can gate migrations in CI. The
+schema is dropped afterwards unless --keep is given.
+"""
+import argparse
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.models import BaseModel, User  # noqa: E402
+from app.repositories import (  # noqa: E402
+    ClientRepository,
+    HealthCheckRepository,
+    ProjectRepository,
+    ProjectResponseRepository,
+    UserRepository,
+    WorkflowExecutionRepository,
+)
+from app.repositories.observation import ProjectObservationRepository  # noqa: E402
+from app.repositories.search import SearchRepository  # noqa: E402
+from app.services.health_check_stats import load_stats  # noqa: E402
+from synthetic_dataset import Dataset, build_dataset  # noqa: E402
+
+SCHEMA = "query_plan_check"
+SEARCHABLE_TABLES = (
+    "framework_controls",
+    "project_responses",
+    "project_observations",
+    "project_evidence_files",
+    "session_control_observations",
+    "control_instance_evidence_files",
+    "session_control_observation_evidence",
+)
+
+
+def _tenant(data: Dataset):
+    return data.tenant_ids[len(data.tenant_ids) // 2]
+
+
+def _auditor(db: Session, data: Dataset) -> User:
+    return db.get(User, data.auditor_ids[_tenant(data)][0])
+
+
+def _project(data: Dataset):
+    return data.project_ids[_tenant(data)][5]
+
+
+def _control(data: Dataset):
+    return data.control_ids[data.framework_ids[_tenant(data)]][3]
+
+
+def _observations_with_evidence(db: Session, data: Dataset) -> None:
+    observations = ProjectObservationRepository(db).get_for_control(_project(data), _control(data))
+    for observation in observations:
+        observation.evidence_files
+
+
+def _next_page(fetch: Callable[..., object]) -> None:
+    """Load a list's first page, then the page after it with the returned cursor."""
+    fetch(cursor=fetch(cursor=None).next_cursor)
+
+
+# (name, tables that must not be seq-scanned, repository call)
+CHECKS: list[tuple[str, tuple[str, ...], Callable[[Session, Dataset], object]]] = [
+    (
+        "projects list (auditor scope)",
+        ("projects", "project_members"),
+        lambda db, d: ProjectRepository(db).filter_projects(_tenant(d), user=_auditor(db, d)),
+    ),
+    *(
+        (
+            f"projects list page ({sort})",
+            ("projects",),
+            lambda db, d, sort=sort: _next_page(
+                lambda cursor: ProjectRepository(db).list_project_rows(
+                    _tenant(d), sort=sort, cursor=cursor, limit=20
+                )
+            ),
+        )
+        for sort in ProjectRepository.LIST_SORTS
+    ),
+    (
+        "clients list page",
+        ("clients",),
+        lambda db, d: _next_page(
+            lambda cursor: ClientRepository(db).list_client_rows(_tenant(d), cursor=cursor, limit=5)
+        ),
+    ),
+    (
+        "users list page",
+        ("users",),
+        lambda db, d: _next_page(
+            lambda cursor: UserRepository(db).list_user_rows(_tenant(d), cursor=cursor, limit=5)
+        ),
+    ),
+    (
+        "dashboard summary (auditor scope)",
+        ("projects", "project_responses", "project_members"),
+        lambda db, d: ProjectRepository(db).dashboard_summary(_tenant(d), user=_auditor(db, d)),
+    ),
+    (
+        "project segments",
+        ("projects",),
+        lambda db, d: ProjectRepository(db).get_children(
+            _tenant(d), d.parent_project_ids[_tenant(d)][2]
+        ),
+    ),
+    (
+        "segment progress",
+        ("projects", "project_responses"),
+        lambda db, d: ProjectRepository(db).segment_progress(
+            _tenant(d), d.parent_project_ids[_tenant(d)][2]
+        ),
+    ),
+    (
+        "project responses",
+        ("project_responses",),
+        lambda db, d: ProjectResponseRepository(db).get_for_project(_project(d)),
+    ),
+    (
+        "response for control",
+        ("project_responses",),
+        lambda db, d: ProjectResponseRepository(db).get_by_control(_project(d), _control(d)),
+    ),
+    (
+        "pending responses for tenant",
+        ("projects",),
+        lambda db, d: ProjectResponseRepository(db).count_pending_for_tenant(_tenant(d)),
+    ),
+    (
+        "observations for control",
+        ("project_observations", "project_evidence_files"),
+        _observations_with_evidence,
+    ),
+    (
+        "workflow execution",
+        ("workflow_executions",),
+        lambda db, d: WorkflowExecutionRepository(db).get_for_project_control(
+            _project(d), _control(d)
+        ),
+    ),
+    (
+        "review scopes for project",
+        ("review_scopes", "audit_sessions"),
+        lambda db, d: HealthCheckRepository(db).get_review_scopes_for_project(
+            d.health_check_project_ids[_tenant(d)][0]
+        ),
+    ),
+    (
+        "health check project stats",
+        ("review_scope_status_counts",),
+        lambda db, d: load_stats(db, project_id=d.health_check_project_ids[_tenant(d)][0]),
+    ),
+    (
+        "review scope stats",
+        ("audit_session_status_counts",),
+        lambda db, d: load_stats(db, review_scope_id=d.review_scope_ids[7]),
+    ),
+    (
+        "review scope with sessions",
+        ("audit_sessions",),
+        lambda db, d: HealthCheckRepository(db).get_review_scope_with_sessions(
+            d.review_scope_ids[7]
+        ),
+    ),
+    (
+        "session control instances",
+        ("session_control_instances", "control_instance_evidence_files"),
+        lambda db, d: HealthCheckRepository(db).get_control_instances_for_session(
+            d.session_ids[11]
+        ),
+    ),
+    (
+        "control panel with observations",
+        (
+            "session_control_instances",
+            "session_control_observations",
+            "session_control_observation_evidence",
+            "control_instance_evidence_files",
+        ),
+        lambda db, d: HealthCheckRepository(db).get_control_instance_with_observations(
+            d.instance_ids[40]
+        ),
+    ),
+    (
+        "session stats",
+        ("audit_session_status_counts",),
+        lambda db, d: HealthCheckRepository(db).get_session_stats(d.session_ids[11]),
+    ),
+    (
+        "users for tenant",
+        ("users",),
+        lambda db, d: UserRepository(db).get_all(_tenant(d)),
+    ),
+    (
+        "clients for tenant",
+        ("clients",),
+        lambda db, d: ClientRepository(db).get_all(_tenant(d)),
+    ),
+    (
+        "full-text search",
+        SEARCHABLE_TABLES,
+        lambda db, d: SearchRepository(db).search(_tenant(d), "TLS 1.0"),
+    ),
+    (
+        "full-text search (auditor scope)",
+        SEARCHABLE_TABLES,
+        lambda db, d: SearchRepository(db).search(
+            _tenant(d), '"default passwords"', user=_auditor(db, d)
+        ),
+    ),
+]
+
+UNINDEXED_FOREIGN_KEYS_SQL = """
+SELECT c.conrelid::regclass::text AS table_name,
+       array_agg(a.attname::text ORDER BY k.ord) AS columns
+FROM pg_constraint c
+CROSS JOIN LATERAL unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum
+WHERE c.contype = 'f'
+  AND c.connamespace = CAST(:schema AS regnamespace)
+  AND NOT EXISTS (
+      SELECT 1
+      FROM pg_index i
+      WHERE i.indrelid = c.conrelid
+        AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] @> c.conkey
+        AND (string_to_array(i.indkey::text, ' ')::int2[])[1:cardinality(c.conkey)] <@ c.conkey
+  )
+GROUP BY c.conrelid, c.conname
+ORDER BY 1
+"""
+
+
+def _scan_nodes(plan: dict):
+    """Yield (node type, relation) for every scan in an EXPLAIN JSON plan."""
+    if "Relation Name" in plan:
+        yield plan["Node Type"], plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from _scan_nodes(child)
+
+
+def explain_calls(engine, data: Dataset, call) -> list[tuple[str, str]]:
+    """Run a repository call and return the scans planned for each SELECT it issued."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(engine) as db:
+            call(db, data)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement, parameters
+            ).scalar_one()
+            scans.extend(_scan_nodes(plan[0]["Plan"]))
+    return scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset size multiplier")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    parser.add_argument("--verbose", action="store_true", help="Print every planned scan")
+    args = parser.parse_args()
+
+    database_url = get_settings().database_url
+    admin_engine = create_engine(database_url)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA},public"})
+    failures = 0
+    try:
+        # Create every table in the scratch schema, even those public already has
+        BaseModel.metadata.create_all(
+            engine.execution_options(schema_translate_map={None: SCHEMA})
+        )
+        print(f"Loading synthetic dataset (scale {args.scale}) into schema {SCHEMA}...")
+        with Session(engine) as db:
+            data = build_dataset(db, scale=args.scale)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM ANALYZE"))
+
+        for name, guarded, call in CHECKS:
+            scans = explain_calls(engine, data, call)
+            seq_scanned = sorted(
+                {rel for node, rel in scans if node == "Seq Scan" and rel in guarded}
+            )
+            status = "FAIL" if seq_scanned else "ok"
+            failures += bool(seq_scanned)
+            detail = f"  seq scan on {', '.join(seq_scanned)}" if seq_scanned else ""
+            print(f"  [{status:>4}] {name}{detail}")
+            if args.verbose:
+                for node, rel in scans:
+                    print(f"           {node} on {rel}")
+
+        with engine.connect() as conn:
+            missing = conn.execute(text(UNINDEXED_FOREIGN_KEYS_SQL), {"schema": SCHEMA}).all()
+        failures += bool(missing)
+        print(f"  [{'FAIL' if missing else 'ok':>4}] every foreign key has a leading index")
+        for table_name, columns in missing:
+            print(f"           {table_name}({', '.join(columns)})")
+    finally:
+        engine.dispose()
+        if not args.keep:
+            with admin_engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        admin_engine.dispose()
+
+    print(f"\n{len(CHECKS) + 1 - failures}/{len(CHECKS) + 1} checks passed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Repair the evidence blob store: unreferenced blobs, stray files, legacy files.
+
+Usage: python scripts/reconcile_evidence_blobs.py [--adopt-legacy] [--dry-run]
+
+The app removes a blob when an ORM delete releases its last reference, so
+blobs only linger when evidence rows go some other way (a database cascade,
+a bulk delete, manual SQL) or a removal fails. This script
+
+  1. with --adopt-legacy, moves files uploaded before the blob store
+     (evidence rows with a file_path under static/ but no blob_sha256) into
+     it, so duplicates among a tenant's files are kept once;
+  2. removes blobs no evidence row points at, and files in the store with no
+     blob row (left by an upload whose transaction failed, or a removal
+     interrupted after its row was gone) or not named with the blob's
+     extension, and staged uploads older than a day.
+
+Each blob is handled under the same advisory lock as uploads, so it can run
+while the app is serving. With --dry-run nothing is written. Exits non-zero
+when anything was found, so a --dry-run can be used as a monitoring check.
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.database import SessionLocal, unit_of_work  # noqa: E402
+from app.models import AuditSession, Project  # noqa: E402
+from app.models.evidence import EVIDENCE_FILE_MODELS, EvidenceBlob  # noqa: E402
+from app.models.health_check import (  # noqa: E402
+    ControlInstanceEvidenceFile,
+    SessionControlInstance,
+    SessionControlObservation,
+    SessionControlObservationEvidence,
+)
+from app.models.project import ProjectObservation  # noqa: E402
+from app.repositories import EvidenceBlobRepository  # noqa: E402
+from app.services.evidence_store import blob_key, evidence_store  # noqa: E402
+
+STALE_STAGED_SECONDS = 24 * 60 * 60
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def with_tenant(model):
+    """Select ``model``'s rows together with the tenant they belong to."""
+    query = select(model, Project.tenant_id)
+    if model is ControlInstanceEvidenceFile:
+        query = query.join(model.control_instance)
+    elif model is SessionControlObservationEvidence:
+        query = query.join(model.observation).join(SessionControlObservation.control_instance)
+    else:
+        return query.join(model.observation).join(
+            Project, Project.id == ProjectObservation.project_id
+        )
+    return query.join(SessionControlInstance.audit_session).join(AuditSession.project)
+
+
+def adopt_legacy(db, dry_run: bool) -> int:
+    """Move pre-store evidence files into the blob store; return files adopted."""
+    adopted = 0
+    for model in EVIDENCE_FILE_MODELS:
+        rows = db.execute(
+            with_tenant(model).where(model.blob_sha256.is_(None), model.file_path.is_not(None))
+        ).all()
+        for row, tenant_id in rows:
+            legacy_path = Path(row.file_path.lstrip("/"))
+            if not legacy_path.is_file():
+                print(f"{model.__tablename__} {row.id}: {row.file_path} missing, left as is")
+                continue
+            adopted += 1
+            if dry_run:
+                continue
+            sha256 = blob_key(tenant_id, file_sha256(legacy_path))
+            extension = legacy_path.suffix.lower()
+            with unit_of_work(db):
+                blobs = EvidenceBlobRepository(db)
+                blobs.lock(sha256)
+                extension = blobs.add(tenant_id, sha256, extension, legacy_path.stat().st_size)
+                blob_path = evidence_store.path_for(sha256, extension)
+                if not blob_path.exists():
+                    blob_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        os.link(legacy_path, blob_path)
+                    except OSError:
+                        shutil.copyfile(legacy_path, blob_path)
+                row.blob_sha256 = sha256
+                row.file_path = evidence_store.url_for(sha256, extension)
+            legacy_path.unlink(missing_ok=True)
+    return adopted
+
+
+def remove_stray_files(db, dry_run: bool) -> int:
+    """Remove files in the store without a blob row, and stale staged uploads."""
+    removed = 0
+    root = evidence_store.root
+    if not root.is_dir():
+        return 0
+    cutoff = time.time() - STALE_STAGED_SECONDS
+    for path in evidence_store.staging_dir.glob("*.part"):
+        if path.stat().st_mtime < cutoff:
+            removed += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+    known = EvidenceBlobRepository(db).list_file_names()
+    db.rollback()
+    for path in root.glob("??/*"):
+        if path.name in known:
+            continue
+        sha256 = path.name.split(".", 1)[0]
+        with unit_of_work(db):
+            # An upload may be storing this blob right now; its row shows once it commits
+            EvidenceBlobRepository(db).lock(sha256)
+            blob = db.get(EvidenceBlob, sha256)
+            if blob is not None and path.name == f"{blob.sha256}{blob.extension}":
+                continue
+            print(f"stray file {path}")
+            removed += 1
+            if not dry_run:
+                path.unlink(missing_ok=True)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--adopt-legacy", action="store_true", help="Move pre-store evidence files into the store"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report problems without repairing them"
+    )
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        blobs = EvidenceBlobRepository(db)
+        adopted = adopt_legacy(db, args.dry_run) if args.adopt_legacy else 0
+        if args.adopt_legacy:
+            print(f"{adopted} legacy evidence files {'to adopt' if args.dry_run else 'adopted'}")
+
+        unreferenced = [blob.sha256 for blob in blobs.list_unreferenced()]
+        db.rollback()
+        if not args.dry_run:
+            unreferenced_count = asyncio.run(evidence_store.collect(db, unreferenced))
+        else:
+            unreferenced_count = len(unreferenced)
+        print(f"{unreferenced_count} unreferenced blobs {'found' if args.dry_run else 'removed'}")
+
+        stray = remove_stray_files(db, args.dry_run)
+        print(f"{stray} stray files {'found' if args.dry_run else 'removed'}")
+    return 1 if adopted or unreferenced_count or stray else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
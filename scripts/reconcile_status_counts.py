@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Detect and repair drift in the stored health check status counts.
+
+Usage: python scripts/reconcile_status_counts.py [--project ID ...] [--dry-run]
+
+Recounts every health check project (or only the given ones) from its control
+assessments with ``reconcile_status_counts`` and rewrites the session and
+review scope counts that do not match, one transaction per project. Counts
+only drift if rows are changed outside ``HealthCheckRepository`` (manual SQL,
+a restored backup), so this is meant to run from cron, e.g. nightly. With
+--dry-run nothing is written. Exits non-zero when drift was found, so a
+--dry-run can be used as a monitoring check.
+"""
+import argparse
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.database import SessionLocal  # noqa: E402
+from app.models import ReviewScope  # noqa: E402
+from app.services.health_check_stats import reconcile_status_counts  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--project", type=uuid.UUID, action="append", help="Only this project (repeatable)"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report drift without repairing it")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        project_ids = args.project or db.scalars(
+            select(ReviewScope.project_id).distinct().order_by(ReviewScope.project_id)
+        ).all()
+        db.rollback()
+
+        drifted = 0
+        for project_id in project_ids:
+            sessions, review_scopes = reconcile_status_counts(db, project_id, dry_run=args.dry_run)
+            if sessions or review_scopes:
+                drifted += 1
+                print(
+                    f"{project_id}: {len(sessions)} sessions, {len(review_scopes)} review scopes "
+                    f"{'drifted' if args.dry_run else 'repaired'}"
+                )
+    print(f"Checked {len(project_ids)} projects, {drifted} with drift")
+    return 1 if drifted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+"""Synthetic multi-tenant dataset for benchmarks and query-plan checks.
+
+Not a runnable script: imported by other scripts in this directory. Rows are
+bulk-inserted through the ORM models, so enum columns and defaults match what
+the application writes. Sizes scale linearly with ``scale``; at 1.0 the hot
+tables hold tens of thousands of rows, enough for the planner to prefer
+indexes over sequential scans wherever a query is selective.
+"""
+import random
+import uuid
+from dataclasses import dataclass, field
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models import (
+    AuditSession,
+    AuditSessionStatusCounts,
+    ChecklistItem,
+    Client,
+    ControlInstanceEvidenceFile,
+    ControlInstanceStatus,
+    ControlSnapshot,
+    ControlToReviewScopeMapping,
+    Framework,
+    FrameworkControl,
+    FrameworkSection,
+    Project,
+    ProjectEvidenceFile,
+    ProjectMember,
+    ProjectResponse,
+    ProjectStatus,
+    ProjectType,
+    ResponseStatus,
+    ReviewScope,
+    ReviewScopeStatusCounts,
+    ReviewScopeType,
+    SessionControlAssessment,
+    SessionControlInstance,
+    Tenant,
+    User,
+    UserRole,
+    WorkflowExecution,
+    WorkflowExecutionStatus,
+)
+from app.models.framework import SNAPSHOT_FIELDS
+from app.models.health_check import (
+    STATUS_COUNT_COLUMNS,
+    SessionControlObservation,
+    SessionControlObservationEvidence,
+)
+from app.models.project import ProjectObservation
+
+
+# Audit text for findings, observations and evidence notes, so full-text
+# search has realistic vocabulary and selectivity: each phrase is on roughly
+# 1/len of the rows that get text
+FINDINGS = (
+    "TLS 1.0 is still enabled on the payment gateway load balancer.",
+    "Default vendor passwords were found on two network switches.",
+    "Firewall rule review has not been performed in the last six months.",
+    "Audit logs are retained for 30 days instead of the required 12 months.",
+    "Cardholder data is stored unencrypted in a legacy reporting database.",
+    "Anti-virus signatures on the jump host are several weeks out of date.",
+    "Quarterly external vulnerability scans were not completed by an ASV.",
+    "Terminated user accounts remained active after the employee left.",
+    "Change management tickets lack documented approval before deployment.",
+    "Wireless access points use WPA2 with a shared pre-shared key.",
+    "Physical access logs to the data center are not reviewed.",
+    "Penetration testing scope excluded the segmentation controls.",
+)
+RECOMMENDATIONS = (
+    "Disable legacy protocols and enforce TLS 1.2 or later.",
+    "Change all default credentials and record the change.",
+    "Schedule and document the review on a recurring basis.",
+    "Extend retention and protect logs from modification.",
+    "Encrypt stored data and restrict access to the keys.",
+)
+EVIDENCE_NOTES = (
+    "Screenshot of the load balancer cipher configuration reviewed with the network team.",
+    "Interviewed the system administrator about the password policy.",
+    "Sampled 25 change tickets from the last quarter.",
+    "Reviewed the log server retention settings.",
+    "Walked through the data center badge access process.",
+    "Scan report from the approved scanning vendor attached.",
+)
+
+
+@dataclass
+class Dataset:
+    """Ids of generated rows, for picking realistic query parameters."""
+
+    tenant_ids: list = field(default_factory=list)
+    auditor_ids: dict = field(default_factory=dict)  # tenant_id -> [user_id]
+    framework_ids: dict = field(default_factory=dict)  # tenant_id -> framework_id
+    control_ids: dict = field(default_factory=dict)  # framework_id -> [control_id]
+    scope_type_ids: dict = field(default_factory=dict)  # framework_id -> [type_id]
+    project_ids: dict = field(default_factory=dict)  # tenant_id -> [project_id]
+    parent_project_ids: dict = field(default_factory=dict)  # tenant_id -> [project_id]
+    health_check_project_ids: dict = field(default_factory=dict)  # tenant_id -> [project_id]
+    review_scope_ids: list = field(default_factory=list)
+    session_ids: list = field(default_factory=list)
+    instance_ids: list = field(default_factory=list)
+
+
+class _Rows:
+    """Collects rows per model and bulk-inserts them in dependency order."""
+
+    def __init__(self):
+        self.by_model: dict = {}
+
+    def add(self, model, **values) -> uuid.UUID | None:
+        if "id" in model.__table__.c:
+            values.setdefault("id", uuid.uuid4())
+        self.by_model.setdefault(model, []).append(values)
+        return values.get("id")
+
+    def flush(self, db: Session, models) -> None:
+        for model in models:
+            rows = self.by_model.pop(model, [])
+            for start in range(0, len(rows), 5000):
+                db.execute(insert(model), rows[start:start + 5000])
+
+
+INSERT_ORDER = (
+    Tenant, User, Client, Framework, FrameworkSection, FrameworkControl,
+    ChecklistItem, ReviewScopeType, ControlToReviewScopeMapping, Project,
+    ProjectMember, ProjectResponse, WorkflowExecution, ProjectObservation, ProjectEvidenceFile,
+    ReviewScope, AuditSession, SessionControlInstance, SessionControlAssessment,
+    AuditSessionStatusCounts, ReviewScopeStatusCounts,
+    ControlInstanceEvidenceFile, SessionControlObservation, SessionControlObservationEvidence,
+)
+
+
+def build_dataset(
+    db: Session,
+    scale: float = 1.0,
+    tenants: int = 20,
+    sections_per_framework: int = 10,
+    controls_per_section: int = 20,
+    seed: int = 7,
+) -> Dataset:
+    """Insert a synthetic dataset and commit it. Returns the generated ids."""
+    rng = random.Random(seed)
+    # Separate stream for text, so adding it leaves the other rows as they were
+    text_rng = random.Random(seed + 1)
+    rows = _Rows()
+    data = Dataset()
+    projects_per_tenant = max(1, round(100 * scale))
+    health_checks_per_tenant = max(1, round(10 * scale))
+
+    for t in range(tenants):
+        tenant_id = rows.add(Tenant, name=f"Tenant {t}", slug=f"tenant-{t}-{uuid.uuid4().hex[:6]}")
+        data.tenant_ids.append(tenant_id)
+
+        auditors = []
+        for u in range(25):
+            user_id = rows.add(
+                User,
+                tenant_id=tenant_id,
+                email=f"user{u}.{tenant_id.hex[:8]}@example.com",
+                full_name=f"User {u:02d} {t}",
+                password_hash=None,
+                role=UserRole.ADMIN if u == 0 else UserRole.AUDITOR,
+                is_active=True,
+            )
+            if u:
+                auditors.append(user_id)
+        data.auditor_ids[tenant_id] = auditors
+
+        client_ids = [
+            rows.add(
+                Client,
+                tenant_id=tenant_id,
+                name=f"Client {c} {t}",
+                industry=rng.choice(["Banking", "Retail", "Health"]),
+            )
+            for c in range(20)
+        ]
+
+        framework_id = rows.add(Framework, tenant_id=tenant_id, name=f"Framework {t}")
+        data.framework_ids[tenant_id] = framework_id
+        controls = []
+        for s in range(sections_per_framework):
+            section_id = rows.add(
+                FrameworkSection, framework_id=framework_id, name=f"Section {s}", order=s
+            )
+            for c in range(controls_per_section):
+                control_id = rows.add(
+                    FrameworkControl,
+                    framework_section_id=section_id,
+                    control_id=f"{s + 1}.{c + 1}",
+                    name=f"Control {s + 1}.{c + 1}",
+                    requirements_text=f"Requirement text {s + 1}.{c + 1}",
+                )
+                controls.append(control_id)
+                rows.add(ChecklistItem, framework_control_id=control_id, description="Check item")
+        data.control_ids[framework_id] = controls
+
+        scope_types = [
+            rows.add(
+                ReviewScopeType, framework_id=framework_id, name=f"Scope type {k}", sort_order=k
+            )
+            for k in range(6)
+        ]
+        data.scope_type_ids[framework_id] = scope_types
+        for i, control_id in enumerate(controls):
+            rows.add(
+                ControlToReviewScopeMapping,
+                review_scope_type_id=scope_types[i % len(scope_types)],
+                framework_control_id=control_id,
+            )
+
+        project_ids, parent_ids = [], []
+        for p in range(projects_per_tenant):
+            parent_id = parent_ids[-1] if parent_ids and p % 10 in (1, 2, 3) else None
+            project_id = rows.add(
+                Project,
+                tenant_id=tenant_id,
+                client_id=rng.choice(client_ids),
+                framework_id=framework_id,
+                parent_project_id=parent_id,
+                owner_id=rng.choice(auditors),
+                name=f"Project {p} {t}",
+                status=rng.choice(list(ProjectStatus)),
+                project_type=ProjectType.STANDARD_AUDIT,
+            )
+            project_ids.append(project_id)
+            if p % 10 == 0:
+                parent_ids.append(project_id)
+            for member_id in rng.sample(auditors, 3):
+                rows.add(ProjectMember, project_id=project_id, user_id=member_id, role="auditor")
+            for n, control_id in enumerate(rng.sample(controls, min(40, len(controls)))):
+                rows.add(
+                    ProjectResponse,
+                    project_id=project_id,
+                    framework_control_id=control_id,
+                    status=rng.choice(list(ResponseStatus)),
+                    finding=text_rng.choice(FINDINGS) if n % 4 == 0 else None,
+                    recommendation=text_rng.choice(RECOMMENDATIONS) if n % 4 == 0 else None,
+                )
+                if n < 8:
+                    rows.add(
+                        WorkflowExecution,
+                        project_id=project_id,
+                        framework_control_id=control_id,
+                        answers={},
+                        status=WorkflowExecutionStatus.IN_PROGRESS,
+                    )
+            for control_id in rng.sample(controls, 5):
+                observation_id = rows.add(
+                    ProjectObservation,
+                    project_id=project_id,
+                    framework_control_id=control_id,
+                    observation_text=text_rng.choice(FINDINGS),
+                    recommendation_text=text_rng.choice(RECOMMENDATIONS),
+                )
+                rows.add(
+                    ProjectEvidenceFile,
+                    project_observation_id=observation_id,
+                    evidence_type="text_note",
+                    content=text_rng.choice(EVIDENCE_NOTES),
+                )
+        data.project_ids[tenant_id] = project_ids
+        data.parent_project_ids[tenant_id] = parent_ids
+
+        health_ids = []
+        for h in range(health_checks_per_tenant):
+            project_id = rows.add(
+                Project,
+                tenant_id=tenant_id,
+                client_id=rng.choice(client_ids),
+                framework_id=framework_id,
+                owner_id=rng.choice(auditors),
+                name=f"Health check {h} {t}",
+                status=ProjectStatus.IN_PROGRESS,
+                project_type=ProjectType.PCI_DSS_HEALTH_CHECK,
+            )
+            health_ids.append(project_id)
+            for k, scope_type_id in enumerate(scope_types[:3]):
+                scope_id = rows.add(
+                    ReviewScope,
+                    project_id=project_id,
+                    review_scope_type_id=scope_type_id,
+                    sort_order=k,
+                )
+                data.review_scope_ids.append(scope_id)
+                scope_controls = controls[k::len(scope_types)]
+                scope_counts = dict.fromkeys(STATUS_COUNT_COLUMNS, 0)
+                for n in range(3):
+                    session_id = rows.add(
+                        AuditSession,
+                        review_scope_id=scope_id,
+                        project_id=project_id,
+                        name=f"Asset {n}",
+                    )
+                    data.session_ids.append(session_id)
+                    session_counts = dict.fromkeys(STATUS_COUNT_COLUMNS, 0)
+                    for i, control_id in enumerate(scope_controls):
+                        instance_id = rows.add(
+                            SessionControlInstance,
+                            audit_session_id=session_id,
+                            framework_control_id=control_id,
+                            control_id_snapshot=f"{k}.{i}",
+                            control_title_snapshot=f"Control {k}.{i}",
+                        )
+                        status = rng.choice(list(ControlInstanceStatus))
+                        rows.add(
+                            SessionControlAssessment,
+                            session_control_instance_id=instance_id,
+                            audit_session_id=session_id,
+                            status=status,
+                        )
+                        session_counts[f"{status.value}_count"] += 1
+                        data.instance_ids.append(instance_id)
+                        if i % 2 == 0:
+                            rows.add(
+                                ControlInstanceEvidenceFile,
+                                session_control_instance_id=instance_id,
+                                evidence_type="text_note",
+                                content=text_rng.choice(EVIDENCE_NOTES),
+                            )
+                        if i % 10 == 0:
+                            observation_id = rows.add(
+                                SessionControlObservation,
+                                session_control_instance_id=instance_id,
+                                observation_text=text_rng.choice(FINDINGS),
+                                recommendation_text=text_rng.choice(RECOMMENDATIONS),
+                            )
+                            rows.add(
+                                SessionControlObservationEvidence,
+                                session_control_observation_id=observation_id,
+                                evidence_type="text_note",
+                                content=text_rng.choice(EVIDENCE_NOTES),
+                            )
+                    rows.add(
+                        AuditSessionStatusCounts,
+                        audit_session_id=session_id,
+                        review_scope_id=scope_id,
+                        **session_counts,
+                    )
+                    for name, count in session_counts.items():
+                        scope_counts[name] += count
+                rows.add(
+                    ReviewScopeStatusCounts,
+                    review_scope_id=scope_id,
+                    project_id=project_id,
+                    **scope_counts,
+                )
+        data.health_check_project_ids[tenant_id] = health_ids
+
+    # Instances point at their control's snapshot by content hash, which the
+    # database computes, so store the snapshots once controls exist
+    seeded = INSERT_ORDER.index(SessionControlInstance)
+    rows.flush(db, INSERT_ORDER[:seeded])
+    db.execute(
+        pg_insert(ControlSnapshot).from_select(
+            ["content_hash", *SNAPSHOT_FIELDS],
+            select(
+                FrameworkControl.snapshot_hash,
+                *(getattr(FrameworkControl, name) for name in SNAPSHOT_FIELDS),
+            ).distinct(FrameworkControl.snapshot_hash),
+        ).on_conflict_do_nothing(index_elements=["content_hash"])
+    )
+    hashes = dict(db.execute(select(FrameworkControl.id, FrameworkControl.snapshot_hash)).all())
+    for instance in rows.by_model.get(SessionControlInstance, []):
+        instance["control_snapshot_hash"] = hashes[instance["framework_control_id"]]
+    rows.flush(db, INSERT_ORDER[seeded:])
+    db.commit()
+    return data